@@ -16,7 +16,7 @@ _log = get_logger("api.media")
 
 router = APIRouter(tags=["Media"], dependencies=[Depends(require_api_key)])
 
-ALLOWED_UPLOAD_EXTENSIONS = set(ALLOWED_TEXT_EXTENSIONS + ALLOWED_IMAGE_EXTENSIONS + [".pdf"])
+ALLOWED_UPLOAD_EXTENSIONS = ALLOWED_TEXT_EXTENSIONS | ALLOWED_IMAGE_EXTENSIONS | {".pdf"}
 
 def _sanitize_filename(filename: str) -> str:
     if not filename:
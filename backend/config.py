@@ -19,6 +19,9 @@ GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-3-flash-preview")
 ANTHROPIC_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929")
 ANTHROPIC_THINKING_BUDGET = int(os.getenv("ANTHROPIC_THINKING_BUDGET", "10000"))
 
+# Gemini model used by maintenance scripts (memory GC, message cleanup, KG population)
+DEFAULT_GEMINI_MODEL = GEMINI_MODEL
+
 # ─── Derived ────────────────────────────────────────────────────────────
 CHAT_MODEL = GEMINI_MODEL if CHAT_PROVIDER == "google" else ANTHROPIC_MODEL
 CHAT_THINKING_LEVEL = "high"
@@ -85,9 +88,17 @@ CRON_LOG_PATH = STORAGE_ROOT / "cron" / "log.md"
 SYSTEM_PROMPT_FILE = str(PERSONA_PATH)
 LOGS_DIR = PROJECT_ROOT / "logs"
 
+# Directories known to exist in this process (targets and their parents)
+_ENSURED_DIRS: set[Path] = set()
+
 def ensure_data_directories() -> None:
-    """Create required data directories if they don't exist."""
-    directories = [
+    """Create required data directories if they don't exist.
+
+    Deepest paths go first: once a directory exists so do all its parents,
+    so shared ancestors (DATA_ROOT, STORAGE_ROOT, ...) cost no syscalls.
+    Paths ensured by an earlier call are skipped, so repeat calls are free.
+    """
+    directories = {
         DATA_ROOT,
         TEMP_DIR,
         CHROMADB_PATH,
@@ -96,17 +107,23 @@ def ensure_data_directories() -> None:
         RESEARCH_ARTIFACTS_DIR,
         CRON_REPORTS_DIR,
         LOGS_DIR,
-    ]
+    }
 
-    for directory in directories:
+    for directory in sorted(directories, key=lambda p: len(p.parts), reverse=True):
+        if directory in _ENSURED_DIRS:
+            continue
         try:
             directory.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             _log.warning("Failed to create directory", path=str(directory), error=str(e))
+            continue
+        _ENSURED_DIRS.add(directory)
+        _ENSURED_DIRS.update(directory.parents)
 
-ALLOWED_TEXT_EXTENSIONS = ['.py', '.js', '.json', '.txt', '.md', '.html', '.css', '.csv', '.ts', '.tsx']
+# Lowercase suffixes including the dot; compare against Path.suffix.lower()
+ALLOWED_TEXT_EXTENSIONS = frozenset({'.py', '.js', '.json', '.txt', '.md', '.html', '.css', '.csv', '.ts', '.tsx'})
 
-ALLOWED_IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp'})
 
 def _get_size_bytes(bytes_env: str, mb_env: str, default_mb: int) -> int:
     """Get size in bytes from environment variable.
@@ -232,6 +249,9 @@ MEMORY_MIN_IMPORTANCE = _get_float_env("MEMORY_MIN_IMPORTANCE", 0.55)
 # Message archival settings
 MESSAGE_ARCHIVE_AFTER_DAYS = _get_int_env("MESSAGE_ARCHIVE_AFTER_DAYS", 7)
 
+# Hedge ratio / sentence length metrics on logged responses (disable to save CPU)
+STYLE_METRICS_ENABLED = os.getenv("STYLE_METRICS_ENABLED", "True").lower() == "true"
+
 # =============================================================================
 # Research & Web Scraping
 # =============================================================================
@@ -244,10 +264,10 @@ RESEARCH_MAX_POLL_TIME = _get_int_env("RESEARCH_MAX_POLL_TIME", 1800)
 # =============================================================================
 # MCP Tool Visibility (affects MCP schema only, not internal callers)
 # =============================================================================
-MCP_DISABLED_TOOLS: set[str] = set(
+MCP_DISABLED_TOOLS: frozenset[str] = frozenset(
     filter(None, os.getenv("MCP_DISABLED_TOOLS", "").split(","))
 )
-MCP_DISABLED_CATEGORIES: set[str] = set(
+MCP_DISABLED_CATEGORIES: frozenset[str] = frozenset(
     filter(None, os.getenv("MCP_DISABLED_CATEGORIES", "").split(","))
 )
 
@@ -101,6 +101,9 @@ _PARTIAL_TOOL_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+_BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+_MULTI_SPACE_PATTERN = re.compile(r' {2,}')
+
 
 # === Public Functions ===
 
@@ -125,13 +128,17 @@ def strip_xml_tags(text: str) -> str:
     cleaned = _XML_TAG_PATTERN.sub('', cleaned)
 
     # Remove stray ** (bold artifacts from LLM output)
-    cleaned = re.sub(r'\*\*', '', cleaned)
+    cleaned = cleaned.replace('**', '')
+
+    # Substring checks are C-level scans; most chunks skip the regex entirely
 
     # Clean up excessive blank lines left behind
-    cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+    if '\n\n\n' in cleaned:
+        cleaned = _BLANK_LINES_PATTERN.sub('\n\n', cleaned)
 
     # Collapse multiple spaces (from tag removal) into one
-    cleaned = re.sub(r' {2,}', ' ', cleaned)
+    if '  ' in cleaned:
+        cleaned = _MULTI_SPACE_PATTERN.sub(' ', cleaned)
 
     return cleaned
 
@@ -71,6 +71,8 @@ def query_interactions(
     Returns:
         List of interaction log dicts
     """
+    # Rows buffered by an InteractionLogger are not in the table yet
+    conn_mgr.flush_buffers()
     with conn_mgr.get_connection() as conn:
         if session_id:
             rows = conn.execute(
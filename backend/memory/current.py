@@ -6,6 +6,12 @@ from pathlib import Path
 import threading
 import uuid
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from backend.config import WORKING_MEMORY_PATH, CONTEXT_WORKING_TURNS, CONTEXT_SQL_PERSIST_TURNS
 from backend.core.utils.timezone import now_vancouver, ensure_aware
 from backend.core.logging import get_logger
@@ -211,9 +217,14 @@ class WorkingMemory:
                 }
                 msg_cnt = len(self._messages)
 
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
             Path(path).parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(path, 'wb') as f:
+                f.write(payload)
 
             _log.info("save ok", msg_cnt=msg_cnt, path=path)
             return True
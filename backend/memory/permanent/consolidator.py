@@ -106,16 +106,6 @@ class MemoryConsolidator:
                 else:
                     batch_data.append((i, doc_id, metadata))
 
-            # Process preservation first (PERF-021: batch update)
-            if to_preserve:
-                preserve_ids = [doc_id for doc_id, _ in to_preserve]
-                preserve_metadatas = [{**metadata, "preserved": True} for _, metadata in to_preserve]
-                preserved_count = self.repository.batch_update_metadata(preserve_ids, preserve_metadatas)
-                report["preserved"] = preserved_count
-                if preserved_count < len(to_preserve):
-                    _log.warning("Some preservation updates failed",
-                                failed=len(to_preserve) - preserved_count)
-
             # Calculate decayed importance in batch
             to_delete, decayed_values = self._calculate_deletions_batch(batch_data)
             report["deleted"] = len(to_delete)
@@ -125,18 +115,29 @@ class MemoryConsolidator:
                 self.repository.delete(to_delete)
                 _log.info("Deleted faded memories", count=len(to_delete))
 
-            # T-03: Update surviving memories' importance to decayed value (PERF-022: batch update)
+            # T-03: Surviving memories take their decayed importance.
+            # Preservation flags and importance writes go to the repository
+            # as one batch per pass (PERF-021/022); deleted ids never enter it.
+            updates: Dict[str, dict] = {}
+            for doc_id, metadata in to_preserve:
+                updates[doc_id] = {**metadata, "preserved": True}
             surviving_updates = self._get_surviving_updates(
                 batch_data, decayed_values, to_delete
             )
-            if surviving_updates:
-                update_ids = [doc_id for doc_id, _ in surviving_updates]
-                update_metadatas = [{"importance": new_importance} for _, new_importance in surviving_updates]
-                updated = self.repository.batch_update_metadata(update_ids, update_metadatas)
-                report["surviving_updated"] = updated
-                if updated < len(surviving_updates):
-                    _log.warning("Some surviving updates failed",
-                                failed=len(surviving_updates) - updated)
+            for doc_id, new_importance in surviving_updates:
+                updates[doc_id] = {"importance": new_importance}
+
+            if updates:
+                updated = self.repository.batch_update_metadata(
+                    list(updates), list(updates.values())
+                )
+                if updated < len(updates):
+                    _log.warning("Some metadata updates failed",
+                                failed=len(updates) - updated)
+                else:
+                    report["preserved"] = len(to_preserve)
+                    if surviving_updates:
+                        report["surviving_updated"] = len(surviving_updates)
 
             _log.info(
                 "MEM consolidate",
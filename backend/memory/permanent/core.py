@@ -137,6 +137,17 @@ class LongTermMemory:
         """
         return self._repository.get_all(include=include, limit=limit)
 
+    def get_memory_contents(self, doc_ids: List[str]) -> Dict[str, str]:
+        """Get the content of several memories in one lookup.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping each found ID to its content
+        """
+        return self._repository.get_contents(doc_ids)
+
     def delete_memories(self, doc_ids: List[str]) -> int:
         """Delete memories by ID.
 
@@ -20,6 +20,11 @@ except ImportError:
     _HAS_NATIVE = False
     _log.debug("Native decay module not available, using Python fallback")
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Memory type-specific decay multipliers (lower = slower decay)
 MEMORY_TYPE_DECAY_MULTIPLIERS = {
     "fact": 0.3,  # Facts decay slowly (user name, important dates)
@@ -34,6 +39,20 @@ RECENCY_ACCESS_HOURS = 24  # memory considered "recently accessed"
 RECENCY_BOOST = 1.3  # boost multiplier for old-but-recently-accessed
 
 
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, treating naive values as Vancouver time.
+
+    Returns None if the value cannot be parsed.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except Exception:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=VANCOUVER_TZ)
+    return parsed
+
+
 def get_memory_age_hours(created_at: str) -> float:
     """Calculate memory age in hours.
 
@@ -46,17 +65,10 @@ def get_memory_age_hours(created_at: str) -> float:
     if not created_at:
         return 0
 
-    try:
-        created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        now = now_vancouver()
-
-        if created.tzinfo is None:
-            created = created.replace(tzinfo=VANCOUVER_TZ)
-
-        return (now - created).total_seconds() / 3600
-
-    except Exception:
+    created = _parse_timestamp(created_at)
+    if created is None:
         return 0
+    return (now_vancouver() - created).total_seconds() / 3600
 
 
 _cached_graph: object | None = None
@@ -235,7 +247,9 @@ class AdaptiveDecayCalculator:
         # Memory type string to int mapping for native module
         type_to_int = {"conversation": 0, "fact": 1, "preference": 2, "insight": 3}
 
-        # Pre-process: convert timestamps to hours
+        # Pre-process: convert timestamps to hours. "now" is taken once for
+        # the whole batch and each timestamp is parsed exactly once.
+        now = now_vancouver()
         processed: list[Optional[dict[str, float]]] = []
         for mem in memories:
             created_at = mem.get("created_at")
@@ -243,18 +257,20 @@ class AdaptiveDecayCalculator:
                 processed.append(None)
                 continue
 
-            hours_passed = get_memory_age_hours(created_at)
-            last_accessed = mem.get("last_accessed")
-            last_access_hours = get_memory_age_hours(last_accessed) if last_accessed else -1.0
+            created = _parse_timestamp(created_at)
+            hours_passed = (now - created).total_seconds() / 3600 if created else 0
 
-            # W2-2: Extract hour-of-day for circadian stability
+            # W2-2: Hour-of-day of last access feeds circadian stability
+            last_accessed = mem.get("last_accessed")
+            last_access_hours = -1.0
             last_accessed_hour = -1
             if last_accessed:
-                try:
-                    la_dt = datetime.fromisoformat(last_accessed.replace("Z", "+00:00"))
-                    last_accessed_hour = la_dt.hour
-                except Exception:
-                    pass
+                accessed = _parse_timestamp(last_accessed)
+                if accessed is None:
+                    last_access_hours = 0
+                else:
+                    last_access_hours = (now - accessed).total_seconds() / 3600
+                    last_accessed_hour = accessed.hour
 
             processed.append({
                 "importance": float(mem.get("importance", 0.5)),
@@ -271,13 +287,13 @@ class AdaptiveDecayCalculator:
         if _HAS_NATIVE and len(memories) >= 10:
             return self._calculate_batch_native(processed)
 
-        # Python fallback
+        # Vectorized fallback, then pure Python
+        if np is not None:
+            return self._calculate_batch_numpy(processed)
         return self._calculate_batch_python(processed)
 
     def _calculate_batch_native(self, processed: List[Optional[dict]]) -> List[float]:
         """Batch calculation using native C++ module."""
-        import numpy as np
-
         # Filter valid entries and track indices
         valid_indices = []
         valid_data = []
@@ -337,6 +353,53 @@ class AdaptiveDecayCalculator:
 
         return results
 
+    def _calculate_batch_numpy(self, processed: List[Optional[dict]]) -> List[float]:
+        """Batch calculation using NumPy arrays (same formula as the Python loop)."""
+        valid_data = [p for p in processed if p is not None]
+        if not valid_data:
+            return [0.5] * len(processed)
+
+        n = len(valid_data)
+
+        def column(key, dtype):
+            return np.fromiter((d.get(key, 0) for d in valid_data), dtype=dtype, count=n)
+
+        importance = column("importance", np.float64)
+        hours_passed = column("hours_passed", np.float64)
+        access_count = column("access_count", np.float64)
+        connection_count = column("connection_count", np.float64)
+        last_access_hours = column("last_access_hours", np.float64)
+        memory_type = column("memory_type", np.intp)
+        channel_mentions = column("channel_mentions", np.float64)
+
+        # W2-2: Peak-hour access counts as one extra access
+        if self.peak_hours:
+            last_accessed_hour = np.fromiter(
+                (d.get("last_accessed_hour", -1) for d in valid_data), dtype=np.intp, count=n
+            )
+            access_count += (last_accessed_hour >= 0) & np.isin(last_accessed_hour, self.peak_hours)
+
+        stability = 1 + self.config.ACCESS_STABILITY_K * np.log1p(access_count)
+        resistance = np.minimum(1.0, connection_count * self.config.RELATION_RESISTANCE_K)
+        type_multiplier = np.array([1.0, 0.3, 0.5, 0.7])[memory_type]  # conv, fact, pref, insight
+        channel_boost = 1.0 / (1 + self.config.CHANNEL_DIVERSITY_K * channel_mentions)
+
+        effective_rate = (
+            self.config.BASE_DECAY_RATE * type_multiplier * channel_boost / stability * (1 - resistance)
+        )
+        decayed = importance * np.exp(-effective_rate * hours_passed)
+
+        # Recency paradox boost
+        recent = (
+            (last_access_hours >= 0)
+            & (hours_passed > RECENCY_AGE_HOURS)
+            & (last_access_hours < RECENCY_ACCESS_HOURS)
+        )
+        decayed[recent] *= RECENCY_BOOST
+
+        values = iter(np.maximum(decayed, importance * self.config.MIN_RETENTION).tolist())
+        return [0.5 if p is None else next(values) for p in processed]
+
     def _calculate_batch_python(self, processed: List[Optional[dict]]) -> List[float]:
         """Batch calculation using Python (fallback)."""
         from .dynamic_decay import apply_circadian_stability
@@ -80,6 +80,17 @@ class MemoryRepositoryProtocol(Protocol):
         """
         ...
 
+    def get_contents(self, doc_ids: List[str]) -> Dict[str, str]:
+        """Get the content of several memories in one lookup.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping each found ID to its content
+        """
+        ...
+
     def query_by_embedding(
         self,
         embedding: List[float],
@@ -154,6 +154,26 @@ class ChromaDBRepository:
 
         return None
 
+    def get_contents(self, doc_ids: List[str]) -> Dict[str, str]:
+        """Get the content of several memories in one lookup.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping each found ID to its content
+        """
+        if not doc_ids:
+            return {}
+
+        try:
+            result = self._collection.get(ids=doc_ids, include=["documents"])
+            return dict(zip(result["ids"], result["documents"] or []))
+
+        except Exception as e:
+            _log.error("Get contents failed", error=str(e), count=len(doc_ids))
+            return {}
+
     def query_by_embedding(
         self,
         embedding: List[float],
@@ -1,7 +1,7 @@
 """Interaction logging — PostgreSQL backend."""
 
 import json
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 from backend.core.logging import get_logger
 
@@ -83,6 +83,7 @@ class PgInteractionLogger:
         return None
 
     def get_recent_logs(self, limit: int = 20) -> List[Dict]:
+        """Retrieve the most recent interaction logs, newest first."""
         try:
             return self._conn.execute_dict(
                 "SELECT * FROM interaction_logs ORDER BY ts DESC LIMIT %s",
@@ -91,3 +92,15 @@ class PgInteractionLogger:
         except Exception as e:
             _log.error("Get interaction logs failed", error=str(e))
             return []
+
+    def get_interaction_detail(self, log_id: int) -> Optional[Dict]:
+        """Retrieve a single interaction log entry including JSON columns."""
+        try:
+            rows = self._conn.execute_dict(
+                "SELECT * FROM interaction_logs WHERE id = %s",
+                (log_id,),
+            )
+            return rows[0] if rows else None
+        except Exception as e:
+            _log.error("Get interaction detail failed", error=str(e), log_id=log_id)
+            return None
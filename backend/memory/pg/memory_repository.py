@@ -150,6 +150,28 @@ class PgMemoryRepository:
             "metadata": self._row_to_metadata(r),
         }
 
+    def get_contents(self, doc_ids: List[str]) -> Dict[str, str]:
+        """Get the content of several memories in one lookup.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping each found ID to its content
+        """
+        if not doc_ids:
+            return {}
+
+        try:
+            rows = self._conn.execute_dict(
+                "SELECT uuid, content FROM memories WHERE uuid = ANY(%s)", (doc_ids,)
+            )
+            return {r["uuid"]: r["content"] for r in rows}
+
+        except Exception as e:
+            _log.error("Get contents failed", error=str(e), count=len(doc_ids))
+            return {}
+
     def query_by_embedding(
         self,
         embedding: List[float],
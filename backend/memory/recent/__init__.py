@@ -118,6 +118,8 @@ class SessionArchive:
         return self._repo.get_stats()
 
     def get_interaction_stats(self) -> Dict[str, Any]:
+        if not self._pg_mode:
+            self._logger.flush()
         return self._repo.get_interaction_stats()
 
     # ── Interaction logging ──────────────────────────────────────────────
@@ -144,6 +146,9 @@ class SessionArchive:
     def get_recent_interaction_logs(self, limit: int = 20) -> List[Dict]:
         return self._logger.get_recent_logs(limit)
 
+    def get_interaction_detail(self, log_id: int) -> Optional[Dict]:
+        return self._logger.get_interaction_detail(log_id)
+
     # ── Summarization ────────────────────────────────────────────────────
 
     async def summarize_expired(self, llm_client=None) -> Dict[str, int]:
@@ -157,6 +162,7 @@ class SessionArchive:
 
     def close(self, silent: bool = False):
         if self._conn_mgr:
+            self._logger.close()
             self._conn_mgr.close()
         if not silent:
             try:
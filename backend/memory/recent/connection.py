@@ -1,22 +1,37 @@
 """SQLite connection manager with thread safety and lifecycle management."""
 
 import atexit
+import os
 import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from backend.core.logging import get_logger
 
 _log = get_logger("memory.recent.connection")
 
 
+def maintenance_lock_path(db_path: Path | str) -> Path:
+    """Lockfile coordinating open managers with ``scripts/db_maintenance.py``.
+
+    Managers hold a shared flock on it while they have connections open;
+    the maintenance swap takes it exclusively, so it never replaces the
+    file under a live connection and managers wait for the swap to finish.
+    """
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.name + ".maint.lock")
+
+
 class SQLiteConnectionManager:
-    """Manages a single SQLite connection with thread-safe access.
+    """Manages per-thread SQLite connections with lifecycle management.
 
-    Uses atexit for cleanup instead of __del__ to avoid interpreter
-    shutdown issues. Provides context manager protocol for scoped usage.
+    Each thread gets its own connection, so WAL readers run in parallel
+    and threads never contend on a shared handle; SQLite's own locking
+    (with busy_timeout) arbitrates writers. Uses atexit for cleanup
+    instead of __del__ to avoid interpreter shutdown issues. Provides
+    context manager protocol for scoped usage.
 
     Args:
         db_path: Path to SQLite database file.
@@ -25,43 +40,120 @@ class SQLiteConnectionManager:
     def __init__(self, db_path: Path | str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._connection: Optional[sqlite3.Connection] = None
-        self._lock = threading.RLock()
+        self._local = threading.local()
+        # Every open connection by owning thread id, so close() reaches
+        # connections held by other threads
+        self._connections: dict[int, sqlite3.Connection] = {}
+        # Bumped by close(); thread-local handles from an older generation
+        # belong to closed connections and are reopened on next use
+        self._generation = 0
+        self._lock = threading.Lock()
+        # Shared flock on maintenance_lock_path() while connections are open
+        self._hold_fd: Optional[int] = None
+        # flush() callbacks of write-behind buffers over this database,
+        # run by flush_buffers() before raw table reads
+        self._flush_hooks: list[Callable[[], object]] = []
         atexit.register(self._atexit_close)
 
+    @property
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's open connection, or None."""
+        if getattr(self._local, "generation", None) != self._generation:
+            return None
+        return self._local.conn
+
+    def _hold_database(self) -> None:
+        """Take the shared maintenance lock, waiting out a running swap."""
+        if os.name == "nt":
+            return
+        import fcntl
+
+        with self._lock:
+            if self._hold_fd is not None:
+                return
+            fd = os.open(maintenance_lock_path(self.db_path), os.O_CREAT | os.O_RDWR, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH)
+            except OSError:
+                os.close(fd)
+                raise
+            self._hold_fd = fd
+
+    def _release_database(self) -> None:
+        """Drop the shared maintenance lock; the caller holds ``_lock``."""
+        if self._hold_fd is None:
+            return
+        try:
+            os.close(self._hold_fd)  # closing the descriptor releases the flock
+        except OSError as e:
+            _log.warning("Maintenance lock release failed", error=str(e))
+        self._hold_fd = None
+
+    def _open(self) -> sqlite3.Connection:
+        self._hold_database()
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            timeout=10.0,
+            cached_statements=256,  # default 128; logger/repository hot paths stay prepared
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        try:
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        except sqlite3.DatabaseError:
+            pass  # builds without mmap support
+        conn.row_factory = sqlite3.Row
+
+        ident = threading.get_ident()
+        with self._lock:
+            # Connections of threads that have exited (or whose ident was
+            # reused by this thread) are no longer reachable; close them
+            alive = {t.ident for t in threading.enumerate()}
+            stale = [
+                tid for tid in self._connections
+                if tid == ident or tid not in alive
+            ]
+            for tid in stale:
+                try:
+                    self._connections.pop(tid).close()
+                except Exception:
+                    pass
+            self._connections[ident] = conn
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Yield a SQLite connection, creating one if needed.
+        """Yield the calling thread's SQLite connection, creating it if needed.
 
-        The connection is reused across calls. On exception,
-        a rollback is attempted before re-raising.
+        The connection is reused across calls from the same thread. On
+        exception, a rollback is attempted before re-raising.
 
         Yields:
             sqlite3.Connection
         """
-        with self._lock:
-            if self._connection is None:
-                self._connection = sqlite3.connect(
-                    self.db_path,
-                    check_same_thread=False,
-                    timeout=10.0,
-                )
-                self._connection.execute("PRAGMA journal_mode=WAL")
-                self._connection.execute("PRAGMA busy_timeout=5000")
-                self._connection.execute("PRAGMA synchronous=NORMAL")
+        conn = self._connection
+        if conn is None:
+            conn = self._open()
 
+        try:
+            yield conn
+        except Exception as e:
             try:
-                yield self._connection
-            except Exception as e:
-                try:
-                    self._connection.rollback()
-                except Exception as rb_err:
-                    _log.error(
-                        "Rollback also failed",
-                        original=str(e),
-                        rollback=str(rb_err),
-                    )
-                raise
+                conn.rollback()
+            except Exception as rb_err:
+                _log.error(
+                    "Rollback also failed",
+                    original=str(e),
+                    rollback=str(rb_err),
+                )
+            raise
 
     @contextmanager
     def transaction(self):
@@ -79,15 +171,36 @@ class SQLiteConnectionManager:
                 conn.rollback()
                 raise
 
+    def add_flush_hook(self, hook: Callable[[], object]) -> None:
+        """Register a buffer's flush callback for ``flush_buffers``."""
+        with self._lock:
+            self._flush_hooks.append(hook)
+
+    def remove_flush_hook(self, hook: Callable[[], object]) -> None:
+        """Unregister a flush callback; unknown hooks are ignored."""
+        with self._lock:
+            if hook in self._flush_hooks:
+                self._flush_hooks.remove(hook)
+
+    def flush_buffers(self) -> None:
+        """Write rows still held by registered buffers, e.g. before a read."""
+        with self._lock:
+            hooks = list(self._flush_hooks)
+        for hook in hooks:
+            hook()
+
     def close(self):
-        """Close the connection. Idempotent — safe to call multiple times."""
+        """Close every thread's connection. Idempotent — safe to call multiple times."""
         with self._lock:
-            if self._connection is not None:
+            self._generation += 1
+            connections = list(self._connections.values())
+            self._connections.clear()
+            for conn in connections:
                 try:
-                    self._connection.close()
+                    conn.close()
                 except Exception:
                     pass
-                self._connection = None
+            self._release_database()
 
     def _atexit_close(self):
         """Cleanup handler registered with atexit."""
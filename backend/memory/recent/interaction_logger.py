@@ -1,10 +1,13 @@
 """Interaction logging and response style analysis."""
 
+import atexit
 import json
 import re
-import sqlite3
+import threading
+from datetime import datetime, timezone
 from typing import Optional, Dict, List
 
+from backend.config import STYLE_METRICS_ENABLED
 from backend.core.logging import get_logger
 from backend.memory.recent.connection import SQLiteConnectionManager
 
@@ -25,6 +28,35 @@ _HEDGE_PHRASES = [
     "추측이지만",
 ]
 
+# Compiled once: one alternation scan per sentence instead of a substring
+# test per phrase; phrases are escaped so matching stays plain substring
+_HEDGE_RE = re.compile("|".join(map(re.escape, _HEDGE_PHRASES)))
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?。]")
+
+# Responses shorter than this carry no meaningful style signal
+_STYLE_MIN_CHARS = 10
+
+# Buffered rows are written once this many are pending, or by the flush
+# thread this long after the first buffered row
+_LOG_BATCH_SIZE = 32
+_LOG_FLUSH_INTERVAL_S = 2.0
+
+_INSERT_LOG_SQL = """INSERT INTO interaction_logs (
+        conversation_id, turn_id,
+        effective_model, tier, router_reason,
+        routing_features_json, manual_override,
+        latency_ms, ttft_ms, tokens_in, tokens_out,
+        tool_calls_json, refusal_detected,
+        response_chars, hedge_ratio, avg_sentence_len, ts
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Columns returned by get_recent_logs — excludes the JSON blob columns
+_SUMMARY_COLUMNS = (
+    "id, ts, conversation_id, turn_id, effective_model, tier, router_reason, "
+    "latency_ms, ttft_ms, tokens_in, tokens_out, refusal_detected, "
+    "hedge_ratio, avg_sentence_len"
+)
+
 
 def calculate_style_metrics(response: str) -> dict:
     """Calculate hedge ratio and average sentence length.
@@ -37,22 +69,18 @@ def calculate_style_metrics(response: str) -> dict:
     Returns:
         Dict with hedge_ratio (float) and avg_sentence_len (float).
     """
-    if not response or len(response) < 10:
+    if not response or len(response) < _STYLE_MIN_CHARS:
         return {"hedge_ratio": 0.0, "avg_sentence_len": 0.0}
 
-    sentences = re.split(r"[.!?。]", response)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    # Lowercase once up front instead of once per sentence in the hedge scan.
+    lower = response.lower()
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(lower)) if s]
 
     if not sentences:
         return {"hedge_ratio": 0.0, "avg_sentence_len": 0.0}
 
-    # PERF-041: Pre-compile hedge pattern for efficiency (now done at module level)
-    # This optimization is minor given _HEDGE_PHRASES check is already efficient
-    hedge_count = sum(
-        1
-        for sentence in sentences
-        if any(hedge in sentence.lower() for hedge in _HEDGE_PHRASES)
-    )
+    hedge_search = _HEDGE_RE.search
+    hedge_count = sum(1 for sentence in sentences if hedge_search(sentence))
 
     return {
         "hedge_ratio": round(hedge_count / len(sentences), 3),
@@ -63,12 +91,35 @@ def calculate_style_metrics(response: str) -> dict:
 class InteractionLogger:
     """Records model routing decisions and response metrics.
 
+    Rows are buffered in memory and written with one ``executemany`` per
+    batch, so a burst of turns costs one commit instead of one per turn.
+    A full batch is written on the logging thread; partial batches are
+    written by one long-lived flush thread, so timed flushes reuse a
+    single connection. Reads through this logger flush first, and the
+    logger registers ``flush`` with the connection manager so other
+    readers can call ``conn_mgr.flush_buffers()``.
+
     Args:
         conn_mgr: SQLiteConnectionManager instance.
     """
 
     def __init__(self, conn_mgr: SQLiteConnectionManager):
         self._conn_mgr = conn_mgr
+        self._pending: list[tuple] = []
+        self._lock = threading.Lock()
+        self._has_rows = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        conn_mgr.add_flush_hook(self.flush)
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Flush thread: write partial batches _LOG_FLUSH_INTERVAL_S after they start."""
+        while True:
+            self._has_rows.wait()
+            if self._stop.wait(_LOG_FLUSH_INTERVAL_S):
+                return  # close() writes what is left
+            self.flush()
 
     def log_interaction(
         self,
@@ -83,67 +134,130 @@ class InteractionLogger:
         refusal_detected: bool = False,
         response_text: Optional[str] = None,
     ) -> bool:
-        """Record a single interaction log entry."""
+        """Record a single interaction log entry.
+
+        Returns True once the row is buffered; it reaches the table with
+        the next batch or flush.
+        """
         try:
             style_metrics = {}
-            if response_text:
+            if (
+                STYLE_METRICS_ENABLED
+                and response_text
+                and len(response_text) >= _STYLE_MIN_CHARS
+            ):
                 style_metrics = calculate_style_metrics(response_text)
 
-            with self._conn_mgr.get_connection() as conn:
-                conn.execute(
-                    """INSERT INTO interaction_logs (
-                           conversation_id, turn_id,
-                           effective_model, tier, router_reason,
-                           routing_features_json, manual_override,
-                           latency_ms, ttft_ms, tokens_in, tokens_out,
-                           tool_calls_json, refusal_detected,
-                           response_chars, hedge_ratio, avg_sentence_len
-                       ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        conversation_id,
-                        turn_id,
-                        routing_decision.get("effective_model", "unknown"),
-                        routing_decision.get("tier", "unknown"),
-                        routing_decision.get("router_reason", "unknown"),
-                        json.dumps(
-                            routing_decision.get("routing_features", {}),
-                            ensure_ascii=False,
-                        ),
-                        1 if routing_decision.get("manual_override", False) else 0,
-                        latency_ms,
-                        ttft_ms,
-                        tokens_in,
-                        tokens_out,
-                        json.dumps(tool_calls, ensure_ascii=False) if tool_calls else None,
-                        1 if refusal_detected else 0,
-                        len(response_text) if response_text else None,
-                        style_metrics.get("hedge_ratio"),
-                        style_metrics.get("avg_sentence_len"),
-                    ),
-                )
-                conn.commit()
+            row = (
+                conversation_id,
+                turn_id,
+                routing_decision.get("effective_model", "unknown"),
+                routing_decision.get("tier", "unknown"),
+                routing_decision.get("router_reason", "unknown"),
+                json.dumps(
+                    routing_decision.get("routing_features", {}),
+                    ensure_ascii=False,
+                ),
+                1 if routing_decision.get("manual_override", False) else 0,
+                latency_ms,
+                ttft_ms,
+                tokens_in,
+                tokens_out,
+                json.dumps(tool_calls, ensure_ascii=False) if tool_calls else None,
+                1 if refusal_detected else 0,
+                len(response_text) if response_text else None,
+                style_metrics.get("hedge_ratio"),
+                style_metrics.get("avg_sentence_len"),
+                # Stamped at log time, not flush time; same format as CURRENT_TIMESTAMP
+                datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            )
 
-                _log.debug(
-                    "Interaction logged",
-                    tier=routing_decision.get("tier"),
-                    router_reason=routing_decision.get("router_reason"),
-                    latency_ms=latency_ms,
-                )
-                return True
+            with self._lock:
+                self._pending.append(row)
+                # Once closed there is no flush thread; write through
+                flush_now = self._stop.is_set() or len(self._pending) >= _LOG_BATCH_SIZE
+                if not flush_now:
+                    self._has_rows.set()
+                    if self._worker is None:
+                        self._worker = threading.Thread(
+                            target=self._run, name="interaction-log-flush", daemon=True
+                        )
+                        self._worker.start()
+            if flush_now:
+                self.flush()
+
+            _log.debug(
+                "Interaction logged",
+                tier=routing_decision.get("tier"),
+                router_reason=routing_decision.get("router_reason"),
+                latency_ms=latency_ms,
+            )
+            return True
         except Exception as e:
             _log.error("Log interaction failed", error=str(e))
             return False
 
+    def flush(self) -> int:
+        """Write all buffered rows in one transaction.
+
+        Returns:
+            Number of rows written (0 if nothing was pending or the write failed)
+        """
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not self._stop.is_set():  # stays set after close() so the thread exits
+                self._has_rows.clear()
+        if not rows:
+            return 0
+
+        try:
+            with self._conn_mgr.transaction() as conn:
+                conn.executemany(_INSERT_LOG_SQL, rows)
+            return len(rows)
+        except Exception as e:
+            _log.error("Log interaction flush failed", error=str(e), dropped=len(rows))
+            return 0
+
+    def close(self) -> None:
+        """Stop the flush thread and write buffered rows. Idempotent."""
+        with self._lock:
+            self._stop.set()
+            self._has_rows.set()  # wake the flush thread so it can exit
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.join()
+        self._conn_mgr.remove_flush_hook(self.flush)
+        atexit.unregister(self.close)
+        self.flush()
+
     def get_recent_logs(self, limit: int = 20) -> List[Dict]:
-        """Retrieve the most recent interaction logs."""
+        """Retrieve the most recent interaction logs.
+
+        The JSON blob columns are omitted; use ``get_interaction_detail``
+        to fetch them for a single entry.
+        """
+        self.flush()
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
-                    "SELECT * FROM interaction_logs ORDER BY ts DESC LIMIT ?",
+                    f"SELECT {_SUMMARY_COLUMNS} FROM interaction_logs ORDER BY ts DESC LIMIT ?",
                     (limit,),
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor]
         except Exception as e:
             _log.error("Get interaction logs failed", error=str(e))
             return []
+
+    def get_interaction_detail(self, log_id: int) -> Optional[Dict]:
+        """Retrieve a single interaction log entry including JSON columns."""
+        self.flush()
+        try:
+            with self._conn_mgr.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT * FROM interaction_logs WHERE id = ?",
+                    (log_id,),
+                ).fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            _log.error("Get interaction detail failed", error=str(e), log_id=log_id)
+            return None
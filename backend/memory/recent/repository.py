@@ -1,9 +1,9 @@
 """Session and message persistence operations."""
 
 import json
-import sqlite3
 from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from backend.config import MESSAGE_ARCHIVE_AFTER_DAYS
@@ -15,6 +15,28 @@ MESSAGE_EXPIRY_DAYS = MESSAGE_ARCHIVE_AFTER_DAYS
 
 _log = get_logger("memory.recent.repository")
 
+# Write-path SQL shared by several methods; one string per statement keeps
+# a single entry in each connection's prepared-statement cache
+_MAX_TURN_SQL = "SELECT MAX(turn_id) FROM messages WHERE session_id = ?"
+_INSERT_MESSAGES_PREFIX = """INSERT OR IGNORE INTO messages
+    (session_id, turn_id, role, content, timestamp, emotional_context)
+    VALUES """
+_MESSAGE_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?)"
+_INSERT_MESSAGE_SQL = _INSERT_MESSAGES_PREFIX + _MESSAGE_ROW_PLACEHOLDERS
+# Rows per multi-row INSERT: 6 params each stays under SQLite's
+# historical 999 bound-variable limit
+_MESSAGES_PER_INSERT = 150
+_UPSERT_SESSION_SQL = """INSERT OR REPLACE INTO sessions
+    (session_id, summary, key_topics, emotional_tone,
+     turn_count, started_at, ended_at, expires_at, messages_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)"""
+
+
+@lru_cache(maxsize=None)
+def _insert_messages_sql(rows: int) -> str:
+    """Multi-row ``INSERT`` for ``rows`` messages (one string per row count)."""
+    return _INSERT_MESSAGES_PREFIX + ", ".join([_MESSAGE_ROW_PLACEHOLDERS] * rows)
+
 
 class SessionRepository:
     """Handles all session and message CRUD operations.
@@ -37,17 +59,12 @@ class SessionRepository:
         """Save a message immediately with duplicate prevention."""
         try:
             with self._conn_mgr.get_connection() as conn:
-                cursor = conn.execute(
-                    "SELECT MAX(turn_id) FROM messages WHERE session_id = ?",
-                    (session_id,),
-                )
+                cursor = conn.execute(_MAX_TURN_SQL, (session_id,))
                 row = cursor.fetchone()
                 turn_id = (row[0] if row[0] is not None else -1) + 1
 
                 conn.execute(
-                    """INSERT OR IGNORE INTO messages
-                       (session_id, turn_id, role, content, timestamp, emotional_context)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    _INSERT_MESSAGE_SQL,
                     (session_id, turn_id, role, content, timestamp, emotional_context),
                 )
                 conn.commit()
@@ -74,37 +91,31 @@ class SessionRepository:
         try:
             with self._conn_mgr.transaction() as conn:
                 if messages:
-                    cursor = conn.execute(
-                        "SELECT MAX(turn_id) FROM messages WHERE session_id = ?",
-                        (session_id,),
-                    )
+                    cursor = conn.execute(_MAX_TURN_SQL, (session_id,))
                     row = cursor.fetchone()
                     base_turn_id = (row[0] if row[0] is not None else -1) + 1
 
-                    # PERF-023: Use executemany for batch insert
-                    message_data = [
-                        (
-                            session_id,
-                            base_turn_id + i,
-                            msg.get("role", "unknown"),
-                            msg.get("content", ""),
-                            msg.get("timestamp", datetime.now(VANCOUVER_TZ).isoformat()),
-                            msg.get("emotional_context", "neutral"),
-                        )
-                        for i, msg in enumerate(messages)
-                    ]
-                    conn.executemany(
-                        """INSERT OR IGNORE INTO messages
-                           (session_id, turn_id, role, content, timestamp, emotional_context)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
-                        message_data,
-                    )
+                    # One multi-row INSERT per chunk instead of a VM step per message
+                    now_iso = datetime.now(VANCOUVER_TZ).isoformat()
+                    for start in range(0, len(messages), _MESSAGES_PER_INSERT):
+                        chunk = messages[start : start + _MESSAGES_PER_INSERT]
+                        params: List[Any] = []
+                        for i, msg in enumerate(chunk, base_turn_id + start):
+                            timestamp = msg.get("timestamp", now_iso)
+                            if isinstance(timestamp, datetime):
+                                timestamp = timestamp.isoformat()
+                            params += (
+                                session_id,
+                                i,
+                                msg.get("role", "unknown"),
+                                msg.get("content", ""),
+                                timestamp,
+                                msg.get("emotional_context", "neutral"),
+                            )
+                        conn.execute(_insert_messages_sql(len(chunk)), params)
 
                 conn.execute(
-                    """INSERT OR REPLACE INTO sessions
-                       (session_id, summary, key_topics, emotional_tone,
-                        turn_count, started_at, ended_at, expires_at, messages_json)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)""",
+                    _UPSERT_SESSION_SQL,
                     (
                         session_id,
                         summary,
@@ -132,7 +143,6 @@ class SessionRepository:
         """Get messages for a session, ordered by turn_id."""
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     """SELECT role, content, timestamp, turn_id
                        FROM messages
@@ -140,7 +150,7 @@ class SessionRepository:
                        ORDER BY turn_id ASC""",
                     (session_id,),
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor]
         except Exception as e:
             _log.error("Get session messages failed", error=str(e))
             return []
@@ -149,7 +159,6 @@ class SessionRepository:
         """Get session metadata and messages."""
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     "SELECT * FROM sessions WHERE session_id = ?",
                     (session_id,),
@@ -179,14 +188,13 @@ class SessionRepository:
         """Search sessions by topic keyword."""
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     """SELECT * FROM sessions
                        WHERE key_topics LIKE ?
                        ORDER BY ended_at DESC LIMIT ?""",
                     (f"%{topic}%", limit),
                 )
-                return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor]
         except Exception as e:
             _log.error("Topic search failed", error=str(e), topic=topic)
             return []
@@ -204,7 +212,6 @@ class SessionRepository:
 
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     """SELECT role, content, timestamp, emotional_context
                        FROM messages
@@ -249,7 +256,6 @@ class SessionRepository:
         """Retrieve recent conversations grouped by date."""
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     """SELECT role, content, timestamp, emotional_context
                        FROM messages ORDER BY timestamp DESC LIMIT ?""",
@@ -372,7 +378,6 @@ class SessionRepository:
         """Get usage statistics summary by model and tier."""
         try:
             with self._conn_mgr.get_connection() as conn:
-                conn.row_factory = sqlite3.Row
 
                 by_model = [
                     dict(row)
@@ -445,13 +450,12 @@ class SessionRepository:
     def get_session_messages_for_archive(self, session_id: str) -> List[Dict]:
         """Get full message records for archiving."""
         with self._conn_mgr.get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 """SELECT id, turn_id, role, content, timestamp, emotional_context
                    FROM messages WHERE session_id = ? ORDER BY turn_id ASC""",
                 (session_id,),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
 
     def archive_session(self, session_id: str, messages: List[Dict], summary: str):
         """Archive messages and update session summary atomically."""
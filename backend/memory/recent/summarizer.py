@@ -1,5 +1,6 @@
 """Session summarization using LLM."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from backend.config import UTILITY_MODEL
@@ -7,6 +8,9 @@ from backend.core.logging import get_logger
 
 _log = get_logger("memory.recent.summarizer")
 
+# Upper bound on summary LLM calls in flight during one summarize_expired run
+_SUMMARIZE_CONCURRENCY = 8
+
 
 class SessionSummarizer:
     """Generates LLM summaries for expired sessions and archives them.
@@ -90,23 +94,24 @@ class SessionSummarizer:
 
             _log.info("Summarizing expired sessions", count=len(expired_sessions))
 
-            for session_id in expired_sessions:
-                try:
-                    messages = self._repo.get_session_messages_for_archive(session_id)
-                    if not messages:
-                        continue
+            sem = asyncio.Semaphore(_SUMMARIZE_CONCURRENCY)
 
-                    summary = await self.generate_summary(messages, llm_client)
-                    if not summary:
-                        _log.warning(
-                            "Failed to generate summary", session_id=session_id[:8]
-                        )
-                        continue
+            async def _summarize_one(session_id: str) -> int:
+                """Summarize and archive one session; returns messages archived."""
+                try:
+                    async with sem:
+                        messages = self._repo.get_session_messages_for_archive(session_id)
+                        if not messages:
+                            return 0
 
-                    self._repo.archive_session(session_id, messages, summary)
+                        summary = await self.generate_summary(messages, llm_client)
+                        if not summary:
+                            _log.warning(
+                                "Failed to generate summary", session_id=session_id[:8]
+                            )
+                            return 0
 
-                    result["sessions_processed"] += 1
-                    result["messages_archived"] += len(messages)
+                        self._repo.archive_session(session_id, messages, summary)
 
                     _log.info(
                         "Session summarized",
@@ -114,13 +119,20 @@ class SessionSummarizer:
                         messages=len(messages),
                         summary_len=len(summary),
                     )
+                    return len(messages)
                 except Exception as e:
                     _log.error(
                         "Session summarize failed",
                         session_id=session_id[:8],
                         error=str(e),
                     )
-                    continue
+                    return 0
+
+            archived = await asyncio.gather(
+                *(_summarize_one(sid) for sid in expired_sessions)
+            )
+            result["sessions_processed"] = sum(1 for n in archived if n)
+            result["messages_archived"] = sum(archived)
 
         except Exception as e:
             _log.error("Summarize expired failed", error=str(e))
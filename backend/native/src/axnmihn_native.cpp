@@ -247,11 +247,13 @@ PYBIND11_MODULE(axnmihn_native, m) {
 
     text_m.def("fix_korean_spacing", &axnmihn::text_ops::fix_korean_spacing,
         "Fix Korean spacing around punctuation and bracket boundaries",
-        py::arg("text"));
+        py::arg("text"),
+        py::call_guard<py::gil_scoped_release>());
 
     text_m.def("fix_korean_spacing_batch", &axnmihn::text_ops::fix_korean_spacing_batch,
         "Batch fix Korean spacing",
-        py::arg("texts"));
+        py::arg("texts"),
+        py::call_guard<py::gil_scoped_release>());
 
     // ====================
     // Module Info
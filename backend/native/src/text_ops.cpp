@@ -2,6 +2,10 @@
 
 #include <cstddef>
 
+#ifdef HAS_AVX2
+#include <immintrin.h>
+#endif
+
 namespace axnmihn {
 namespace text_ops {
 
@@ -102,6 +106,77 @@ inline bool is_open_bracket(uint32_t cp) {
     return cp == '[' || cp == '(' || cp == '{';
 }
 
+// Rule trigger bytes: . ! ? ] ) } [ ( { : *
+// All are ASCII, and UTF-8 lead/continuation bytes are >= 0x80, so a
+// byte-level scan finds every codepoint that can start or end a rule.
+inline bool is_trigger_byte(uint8_t b) {
+    switch (b) {
+        case '.': case '!': case '?':
+        case ']': case ')': case '}':
+        case '[': case '(': case '{':
+        case ':': case '*':
+            return true;
+        default:
+            return false;
+    }
+}
+
+/// True if any rule can fire: a trigger byte or two consecutive spaces.
+bool needs_fix(const std::string& text) {
+    const auto* data = reinterpret_cast<const uint8_t*>(text.data());
+    const size_t n = text.size();
+    size_t i = 0;
+
+#ifdef HAS_AVX2
+    // Nibble lookup: a byte is a trigger iff hi_lut[b >> 4] & lo_lut[b & 0xF]
+    // is non-zero (bit 0: 0x2_, bit 1: 0x3_, bit 2: 0x5_/0x7_).
+    // Bytes >= 0x80 have a zero high-nibble entry.
+    const __m256i hi_lut = _mm256_setr_epi8(
+        0, 0, 1, 2, 0, 4, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 1, 2, 0, 4, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0);
+    const __m256i lo_lut = _mm256_setr_epi8(
+        0, 1, 0, 0, 0, 0, 0, 0, 1, 1, 3, 4, 0, 4, 1, 2,
+        0, 1, 0, 0, 0, 0, 0, 0, 1, 1, 3, 4, 0, 4, 1, 2);
+    const __m256i nibble_mask = _mm256_set1_epi8(0x0F);
+    const __m256i space = _mm256_set1_epi8(' ');
+    uint32_t prev_space = 0;
+
+    for (; i + 32 <= n; i += 32) {
+        __m256i v = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + i));
+        __m256i hi = _mm256_and_si256(_mm256_srli_epi16(v, 4), nibble_mask);
+        __m256i lo = _mm256_and_si256(v, nibble_mask);
+        __m256i cls = _mm256_and_si256(
+            _mm256_shuffle_epi8(hi_lut, hi), _mm256_shuffle_epi8(lo_lut, lo));
+        __m256i is_trigger = _mm256_cmpgt_epi8(cls, _mm256_setzero_si256());
+        if (_mm256_movemask_epi8(is_trigger) != 0) {
+            return true;
+        }
+
+        auto spaces = static_cast<uint32_t>(
+            _mm256_movemask_epi8(_mm256_cmpeq_epi8(v, space)));
+        // A space whose predecessor (possibly the last byte of the
+        // previous block) is also a space
+        if ((spaces & ((spaces << 1) | prev_space)) != 0) {
+            return true;
+        }
+        prev_space = spaces >> 31;
+    }
+    if (prev_space && i < n && data[i] == ' ') {
+        return true;
+    }
+#endif
+
+    for (; i < n; ++i) {
+        if (is_trigger_byte(data[i])) {
+            return true;
+        }
+        if (data[i] == ' ' && i + 1 < n && data[i + 1] == ' ') {
+            return true;
+        }
+    }
+    return false;
+}
+
 }  // anonymous namespace
 
 // ---------------------------------------------------------------------------
@@ -115,7 +190,8 @@ bool is_korean(uint32_t cp) {
 }
 
 std::string fix_korean_spacing(const std::string& text) {
-    if (text.empty()) {
+    // Most text has nothing to fix; skip the codepoint round trip
+    if (text.empty() || !needs_fix(text)) {
         return text;
     }
 
@@ -27,11 +27,17 @@ bool is_korean(uint32_t cp);
  *   6. Consecutive spaces -> single space
  *
  * Safety: never inserts space between two Hangul characters.
+ *
+ * Text with no trigger byte and no double space is returned as-is after
+ * a byte scan (AVX2 nibble-table classification when available).
  */
 std::string fix_korean_spacing(const std::string& text);
 
 /**
  * Batch version of fix_korean_spacing.
+ *
+ * Exposed to Python as text_ops.fix_korean_spacing_batch(list[str]) -> list[str];
+ * runs with the GIL released, so Python only pays for list marshalling.
  */
 std::vector<std::string> fix_korean_spacing_batch(
     const std::vector<std::string>& texts);
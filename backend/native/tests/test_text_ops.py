@@ -158,6 +158,25 @@ class TestEdgeCases:
         assert native.text_ops.fix_korean_spacing(text) == "안녕\n세상"
 
 
+# ---------------------------------------------------------------------------
+# Trigger pre-scan (SIMD blocks of 32 bytes plus scalar tail)
+# ---------------------------------------------------------------------------
+class TestPreScan:
+    def test_trigger_free_text_unchanged(self):
+        text = "안녕하세요 반갑습니다 " * 50
+        assert native.text_ops.fix_korean_spacing(text) == text
+
+    @pytest.mark.parametrize("offset", [0, 30, 31, 32, 63, 64, 70])
+    def test_double_space_at_any_offset(self, offset):
+        text = "a" * offset + "  " + "b" * 80
+        assert native.text_ops.fix_korean_spacing(text) == "a" * offset + " " + "b" * 80
+
+    @pytest.mark.parametrize("offset", [0, 31, 32, 95])
+    def test_trigger_at_any_offset(self, offset):
+        text = "가" * offset + ".다" + "나" * 40
+        assert native.text_ops.fix_korean_spacing(text) == "가" * offset + ". 다" + "나" * 40
+
+
 # ---------------------------------------------------------------------------
 # Batch API
 # ---------------------------------------------------------------------------
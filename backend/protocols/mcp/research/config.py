@@ -18,10 +18,15 @@ SELECTOR_TIMEOUT_MS: int = 5000
 # Page loading
 PAGE_TIMEOUT_MS: int = RESEARCH_PAGE_TIMEOUT_MS
 NAVIGATION_TIMEOUT_MS: int = RESEARCH_NAVIGATION_TIMEOUT_MS
+MAX_CONCURRENT_PAGES: int = 3  # simultaneous deep_dive page loads
 
 # Content limits
 MAX_CONTENT_LENGTH: int = RESEARCH_MAX_CONTENT_LENGTH
 
+# Rendered page cache (visit_page)
+PAGE_CACHE_TTL: int = 600  # seconds (10 min)
+PAGE_CACHE_MAXSIZE: int = 256
+
 # HTML cleaning
 EXCLUDED_TAGS: list[str] = [
     "script", "style", "noscript", "iframe", "svg", "path", "meta", "link",
@@ -35,6 +40,9 @@ AD_PATTERNS: list[str] = [
     "recommended", "sponsored", "promo", "social-share", "share-buttons",
 ]
 
+# O(1) membership view for per-node checks (list kept for ordered consumers)
+EXCLUDED_TAGS_SET: frozenset[str] = frozenset(EXCLUDED_TAGS)
+
 # User agents for browser rotation
 USER_AGENTS: list[str] = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1,21 +1,41 @@
 """HTML cleaning and markdown conversion for research pages."""
 
 import re
+import threading
 from urllib.parse import urljoin
 
+from bs4 import BeautifulSoup, Comment, Doctype, FeatureNotFound, SoupStrainer, Tag
 from markdownify import MarkdownConverter
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    etree = None
+    lxml_html = None
+    HAS_LXML = False
+
 from backend.protocols.mcp.research.config import (
     AD_PATTERNS,
-    EXCLUDED_TAGS,
+    EXCLUDED_TAGS_SET,
     MAX_CONTENT_LENGTH,
 )
 
 # Pre-compiled regex patterns (avoids 33+ re.compile() calls per invocation)
 _AD_PATTERN_RE = re.compile("|".join(AD_PATTERNS), re.I)
 _DISPLAY_NONE_RE = re.compile(r"display:\s*none", re.I)
-_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
-_MULTI_SPACE_RE = re.compile(r" {2,}")
+# Newline runs and space runs collapsed in one scan
+_COLLAPSE_RE = re.compile(r"\n{3,}| {2,}")
+# Leading newlines, content, trailing newlines of a converted chunk
+_EDGE_NEWLINES_RE = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", re.S)
+
+_converter_local = threading.local()
+
+# Top-level tags never built at parse time: document wrappers plus excluded tags
+_STRAINED_TAGS = EXCLUDED_TAGS_SET | {"html", "head"}
+# Tags removed wholesale by the lxml path (head carries title/meta/scripts)
+_STRIP_TAGS = tuple(EXCLUDED_TAGS_SET | {"head"})
 
 
 class _Converter(MarkdownConverter):
@@ -39,12 +59,107 @@ class _Converter(MarkdownConverter):
         return ""
 
 
+def _get_converter(base_url: str) -> _Converter:
+    """Return this thread's reusable converter with ``base_url`` set.
+
+    One instance per thread, so concurrent callers never share the
+    mutable ``base_url`` option.
+    """
+    converter = getattr(_converter_local, "converter", None)
+    if converter is None:
+        converter = _Converter(
+            heading_style="ATX",
+            bullets="-",
+            strip=["script", "style", "noscript", "iframe"],
+        )
+        _converter_local.converter = converter
+    converter.options["base_url"] = base_url
+    return converter
+
+
+def _collapse_run(match: re.Match) -> str:
+    return "\n\n" if match.group()[0] == "\n" else " "
+
+
+def _is_noise(element) -> bool:
+    """Return True if a tag looks like an ad or is hidden via inline style."""
+    classes = element.get("class")
+    if classes:
+        # bs4 splits class into a list; lxml keeps the raw attribute string
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
+        if _AD_PATTERN_RE.search(classes):
+            return True
+    element_id = element.get("id")
+    if element_id and _AD_PATTERN_RE.search(element_id):
+        return True
+    style = element.get("style")
+    return bool(style and _DISPLAY_NONE_RE.search(style))
+
+
+def _clean_lxml(html: str) -> str | None:
+    """Strip noise elements with lxml and return the cleaned HTML.
+
+    Tag and comment removal runs in C via ``strip_elements``; only the
+    class/id/style checks iterate in Python, over raw lxml elements with
+    no bs4 wrapping. Returns None if lxml rejects the input (empty
+    document, encoding declaration) so callers can fall back to bs4.
+    """
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    if tree.tag in EXCLUDED_TAGS_SET or _is_noise(tree):
+        return ""
+
+    # with_tail=False keeps text that follows a removed element
+    etree.strip_elements(tree, *_STRIP_TAGS, etree.Comment, with_tail=False)
+    noisy = [el for el in tree.iter(etree.Element) if el is not tree and _is_noise(el)]
+    for element in noisy:
+        element.drop_tree()
+
+    return lxml_html.tostring(tree, encoding="unicode")
+
+
+def _clean_soup(html: str):
+    """Parse HTML and strip noise elements, returning the BeautifulSoup tree.
+
+    Pure-bs4 path, used when lxml is unavailable or rejects the input.
+    """
+    # The strainer only filters top-level elements, so this drops <head>
+    # and its <script>/<style>/<meta> children without building them;
+    # excluded tags nested inside <body> are still removed below.
+    strainer = SoupStrainer(lambda name, attrs=None: name not in _STRAINED_TAGS)
+
+    # lxml parses in C; html.parser is the pure-Python fallback
+    try:
+        soup = BeautifulSoup(html, "lxml", parse_only=strainer)
+    except FeatureNotFound:
+        soup = BeautifulSoup(html, "html.parser", parse_only=strainer)
+
+    # Single traversal: comments, excluded tags, ad class/id, display:none.
+    # Materialized first so the tree can be mutated during the walk;
+    # nodes inside an already-removed subtree are flagged as decomposed.
+    for element in list(soup.descendants):
+        if element.decomposed:
+            continue
+        if isinstance(element, Comment):
+            element.extract()
+            continue
+        if not isinstance(element, Tag):
+            continue
+        if element.name in EXCLUDED_TAGS_SET or _is_noise(element):
+            element.decompose()
+
+    return soup
+
+
 def clean_html(html: str) -> str:
     """Remove noise elements from HTML for content extraction.
 
-    Strips scripts, styles, ads, hidden elements, and comments.
-    Uses at most 3 DOM traversals (excluded tags, ad patterns, hidden
-    elements) instead of the previous 47.
+    Strips scripts, styles, ads, hidden elements, and comments. Uses
+    lxml directly when available, falling back to BeautifulSoup.
 
     Args:
         html: Raw HTML string
@@ -55,31 +170,11 @@ def clean_html(html: str) -> str:
     if not html:
         return ""
 
-    from bs4 import BeautifulSoup, Comment
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Traversal 1: remove comments and excluded tags in one pass
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-
-    for tag in EXCLUDED_TAGS:
-        for element in soup.find_all(tag):
-            element.decompose()
-
-    # Traversal 2: remove ad elements by class (single combined regex)
-    for element in soup.find_all(class_=_AD_PATTERN_RE):
-        element.decompose()
-
-    # Traversal 3: remove ad elements by id (single combined regex)
-    for element in soup.find_all(id=_AD_PATTERN_RE):
-        element.decompose()
-
-    # Traversal 4 (bonus): remove display:none elements
-    for element in soup.find_all(style=_DISPLAY_NONE_RE):
-        element.decompose()
-
-    return str(soup)
+    if HAS_LXML:
+        cleaned = _clean_lxml(html)
+        if cleaned is not None:
+            return cleaned
+    return str(_clean_soup(html))
 
 
 def html_to_markdown(html: str, base_url: str = "") -> str:
@@ -95,17 +190,38 @@ def html_to_markdown(html: str, base_url: str = "") -> str:
     if not html:
         return ""
 
-    cleaned_html = clean_html(html)
-
-    markdown = _Converter(
-        heading_style="ATX",
-        bullets="-",
-        strip=["script", "style", "noscript", "iframe"],
-        base_url=base_url,  # type: ignore[call-arg]
-    ).convert(cleaned_html)
-
-    markdown = _MULTI_NEWLINE_RE.sub("\n\n", markdown)
-    markdown = _MULTI_SPACE_RE.sub(" ", markdown)
+    # One parse: the cleaned bs4 tree goes straight to markdownify
+    soup = _clean_soup(html)
+    converter = _get_converter(base_url)
+
+    # Convert top-level nodes one at a time and stop once enough markdown
+    # exists to fill MAX_CONTENT_LENGTH, instead of converting the whole
+    # page and discarding the tail. The margin absorbs whitespace collapse.
+    # Whitespace-only strings are kept: process_text drops them next to
+    # blocks and keeps the space between inline siblings. Chunks are
+    # joined the way markdownify joins children (newlines at a boundary
+    # merged, at most two).
+    container = soup.body or soup
+    parent_tags = {soup.name, container.name}
+    budget = int(MAX_CONTENT_LENGTH * 1.1)
+    parts: list[str] = [""]
+    produced = 0
+    for child in container.children:
+        if isinstance(child, (Comment, Doctype)):
+            continue
+        chunk = converter.process_element(child, parent_tags=parent_tags)
+        if not chunk:
+            continue
+        leading, content, trailing = _EDGE_NEWLINES_RE.match(chunk).groups()
+        if parts[-1] and leading:
+            leading = "\n" * min(2, max(len(parts.pop()), len(leading)))
+        parts += (leading, content, trailing)
+        produced += len(chunk)
+        if produced >= budget:
+            break
+    markdown = "".join(parts)
+
+    markdown = _COLLAPSE_RE.sub(_collapse_run, markdown)
     markdown = markdown.strip()
 
     if len(markdown) > MAX_CONTENT_LENGTH:
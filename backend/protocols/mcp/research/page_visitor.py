@@ -6,13 +6,17 @@ import time
 from urllib.parse import urlparse
 
 from backend.core.logging import get_logger
+from backend.core.utils.cache import get_cache
 from backend.core.research_artifacts import (
     ARTIFACT_THRESHOLD,
     process_content_for_artifact,
 )
 from backend.protocols.mcp.research.browser import get_browser_manager
 from backend.protocols.mcp.research.config import (
+    MAX_CONCURRENT_PAGES,
     NAVIGATION_TIMEOUT_MS,
+    PAGE_CACHE_MAXSIZE,
+    PAGE_CACHE_TTL,
     PAGE_TIMEOUT_MS,
     SELECTOR_TIMEOUT_MS,
 )
@@ -21,23 +25,63 @@ from backend.protocols.mcp.research.search_engines import search_duckduckgo
 
 _log = get_logger("research.page_visitor")
 
+_page_cache = get_cache("research_page", maxsize=PAGE_CACHE_MAXSIZE, ttl_seconds=PAGE_CACHE_TTL)
+_page_locks: dict[str, asyncio.Lock] = {}
+_page_lock_users: dict[str, int] = {}  # visits holding or waiting on each lock
+
+_visit_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+_VISIT_TIMEOUT_S = NAVIGATION_TIMEOUT_MS / 1000 + 5
+
 
 async def visit_page(url: str) -> str:
     """Visit a URL with headless browser and return markdown content.
 
+    Successful full loads are cached per URL for PAGE_CACHE_TTL seconds;
+    concurrent visits to the same URL share a single browser load.
+
     Args:
         url: Full URL to visit (http/https only)
 
     Returns:
         Markdown content or error message
     """
-    start_time = time.time()
-    _log.info("Page visit starting", url=url[:100])
-
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
         return f"Error: Invalid URL scheme. Only http/https supported: {url}"
 
+    lock = _page_locks.setdefault(url, asyncio.Lock())
+    _page_lock_users[url] = _page_lock_users.get(url, 0) + 1
+    try:
+        async with lock:
+            hit, cached = await _page_cache.get(url)
+            if hit:
+                _log.info("Page visit cache hit", url=url[:100])
+                return cached
+
+            output, cacheable = await _load_page(url)
+            if cacheable:
+                await _page_cache.set(url, output)
+            return output
+    finally:
+        # Drop the lock only once no visit holds or waits on it; a waiter
+        # woken by release() is still counted here until it finishes.
+        users = _page_lock_users.pop(url) - 1
+        if users:
+            _page_lock_users[url] = users
+        elif _page_locks.get(url) is lock:
+            del _page_locks[url]
+
+
+async def _load_page(url: str) -> tuple[str, bool]:
+    """Load a page in the browser and convert it to markdown.
+
+    Returns:
+        Tuple of (output, cacheable). Only complete loads are cacheable;
+        errors and partial timeout content are not.
+    """
+    start_time = time.time()
+    _log.info("Page visit starting", url=url[:100])
+
     page = None
     try:
         manager = await get_browser_manager()
@@ -50,7 +94,7 @@ async def visit_page(url: str) -> str:
 
         if response is None or response.status >= 400:
             status = response.status if response else "unknown"
-            return f"Error: Failed to load page. Status: {status}"
+            return f"Error: Failed to load page. Status: {status}", False
 
         await page.wait_for_load_state("networkidle")
 
@@ -67,14 +111,11 @@ async def visit_page(url: str) -> str:
 
         markdown = html_to_markdown(html, url)
 
-        output = f"# {title}\n\n"
-        output += f"**Source:** {url}\n\n"
-        output += "---\n\n"
-        output += markdown
+        output = "".join((f"# {title}\n\n", f"**Source:** {url}\n\n", "---\n\n", markdown))
 
         dur_ms = int((time.time() - start_time) * 1000)
         _log.info("Page visit complete", url=url[:80], dur_ms=dur_ms, content_len=len(output))
-        return process_content_for_artifact(url, output)
+        return process_content_for_artifact(url, output), True
 
     except asyncio.TimeoutError:
         dur_ms = int((time.time() - start_time) * 1000)
@@ -86,24 +127,26 @@ async def visit_page(url: str) -> str:
             title = await page.title()
             markdown = html_to_markdown(html, url)
             if markdown and len(markdown.strip()) > 100:
-                output = f"# {title}\n\n"
-                output += f"**Source:** {url}\n\n"
-                output += f"**Note:** Page timed out after {dur_ms / 1000:.1f}s, partial content returned.\n\n"
-                output += "---\n\n"
-                output += markdown
+                output = "".join((
+                    f"# {title}\n\n",
+                    f"**Source:** {url}\n\n",
+                    f"**Note:** Page timed out after {dur_ms / 1000:.1f}s, partial content returned.\n\n",
+                    "---\n\n",
+                    markdown,
+                ))
                 _log.info(
                     "Page visit timeout but partial content extracted",
                     url=url[:80],
                     content_len=len(output),
                 )
-                return process_content_for_artifact(url, output)
+                return process_content_for_artifact(url, output), False
         except Exception as e:
             _log.debug("Partial content extraction failed", url=url[:50], error=str(e))
-        return f"Error: Page load timed out after {NAVIGATION_TIMEOUT_MS / 1000}s (no usable content): {url}"
+        return f"Error: Page load timed out after {NAVIGATION_TIMEOUT_MS / 1000}s (no usable content): {url}", False
     except Exception as e:
         dur_ms = int((time.time() - start_time) * 1000)
         _log.error("Page visit error", url=url[:80], dur_ms=dur_ms, error=str(e))
-        return f"Error visiting page: {str(e)}"
+        return f"Error visiting page: {str(e)}", False
     finally:
         if page:
             try:
@@ -112,6 +155,25 @@ async def visit_page(url: str) -> str:
                 _log.warning("Page close failed, potential leak", url=url[:50], error=str(e))
 
 
+def _skip_lines(text: str, n: int) -> str:
+    """Return text after its first n lines ("" if it has n or fewer)."""
+    idx = -1
+    for _ in range(n):
+        idx = text.find("\n", idx + 1)
+        if idx == -1:
+            return ""
+    return text[idx + 1:]
+
+
+async def _visit_bounded(url: str) -> str:
+    """visit_page under the shared concurrency limit and a hard deadline.
+
+    The deadline keeps one slow host from stalling deep_dive's gather.
+    """
+    async with _visit_semaphore:
+        return await asyncio.wait_for(visit_page(url), timeout=_VISIT_TIMEOUT_S)
+
+
 async def deep_dive(query: str) -> str:
     """Comprehensive research: search + visit top pages + compile findings.
 
@@ -143,7 +205,7 @@ async def deep_dive(query: str) -> str:
     visited_content: list[dict] = []
     urls_to_visit = [r["url"] for r in results[:3]]
 
-    tasks = [visit_page(url) for url in urls_to_visit]
+    tasks = [_visit_bounded(url) for url in urls_to_visit]
     page_contents = await asyncio.gather(*tasks, return_exceptions=True)
 
     artifact_paths: list[str] = []
@@ -152,7 +214,8 @@ async def deep_dive(query: str) -> str:
         output_parts.append(f"### Source {i}: {url}\n\n")
 
         if isinstance(content, BaseException):
-            output_parts.append(f"*Failed to retrieve: {str(content)}*\n\n")
+            reason = str(content) or type(content).__name__
+            output_parts.append(f"*Failed to retrieve: {reason}*\n\n")
         else:
             is_artifact = content.strip().startswith("[ARTIFACT SAVED]")
 
@@ -164,8 +227,8 @@ async def deep_dive(query: str) -> str:
                 if path_match:
                     artifact_paths.append(path_match.group(1))
             else:
-                content_lines = content.split("\n")
-                content_body = "\n".join(content_lines[4:])[:4000]
+                # Skip the title/source/separator header from visit_page
+                content_body = _skip_lines(content, 4)[:4000]
 
                 if content_body.strip():
                     visited_content.append({"url": url, "content": content_body, "is_artifact": False})
@@ -3,8 +3,18 @@
 import asyncio
 import os
 import random
+import re
 from typing import TYPE_CHECKING, Optional
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, unquote
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    etree = None
+    lxml_html = None
+    HAS_LXML = False
 
 from backend.core.logging import get_logger
 from backend.protocols.mcp.research.config import USER_AGENTS
@@ -52,6 +62,92 @@ def get_tavily_client():
 # ---------------------------------------------------------------------------
 # DuckDuckGo search
 # ---------------------------------------------------------------------------
+def _class_xpath(name: str) -> str:
+    """XPath predicate matching one whitespace-separated class token."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_RESULT_XPATH = f"//*[{_class_xpath('result')}]"
+# lxml closes an <a> when another opens, so a link nested in an
+# a.result__title ends up as its sibling; match either shape, skipping empties.
+_TITLE_XPATH = (
+    f".//*[{_class_xpath('result__title')}]//a[normalize-space()]"
+    f" | .//a[{_class_xpath('result__title')}][normalize-space()]"
+)
+_SNIPPET_XPATH = f".//*[{_class_xpath('result__snippet')}]"
+
+
+_UDDG_RE = re.compile(r"[?&]uddg=([^&]+)")
+
+
+def _unwrap_ddg_href(href: str) -> str:
+    """Return the target of a DuckDuckGo redirect link, or the link itself."""
+    match = _UDDG_RE.search(href)
+    return unquote(match.group(1)) if match else href
+
+
+def _squash_ws(text: str) -> str:
+    """Collapse whitespace runs to single spaces, as both parsers report text."""
+    return " ".join(text.split())
+
+
+def _parse_ddg_lxml(html: str, num_results: int) -> list[dict]:
+    """Parse result entries with lxml (C parser, XPath selection)."""
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return []
+
+    results: list[dict] = []
+    for result in tree.xpath(_RESULT_XPATH)[:num_results]:
+        titles = result.xpath(_TITLE_XPATH)
+        if not titles:
+            continue
+        title_elem = titles[0]
+        snippets = result.xpath(_SNIPPET_XPATH)
+        results.append(
+            {
+                "title": _squash_ws(title_elem.text_content()),
+                "url": _unwrap_ddg_href(title_elem.get("href") or ""),
+                "snippet": _squash_ws(snippets[0].text_content()) if snippets else "",
+            }
+        )
+    return results
+
+
+def _parse_ddg_soup(html: str, num_results: int) -> list[dict]:
+    """Parse result entries with BeautifulSoup; used when lxml is unavailable."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    results: list[dict] = []
+    for result in soup.select(".result")[:num_results]:
+        title_elem = result.select_one(".result__title a")
+        snippet_elem = result.select_one(".result__snippet")
+
+        if title_elem:
+            href = title_elem.get("href", "")
+            if isinstance(href, list):
+                href = href[0] if href else ""
+            href = str(href) if href else ""
+
+            results.append(
+                {
+                    "title": _squash_ws(title_elem.get_text()),
+                    "url": _unwrap_ddg_href(href),
+                    "snippet": _squash_ws(snippet_elem.get_text()) if snippet_elem else "",
+                }
+            )
+    return results
+
+
+def _parse_ddg_results(html: str, num_results: int) -> list[dict]:
+    """Extract title/url/snippet dicts from a DuckDuckGo HTML results page."""
+    if HAS_LXML:
+        return _parse_ddg_lxml(html, num_results)
+    return _parse_ddg_soup(html, num_results)
+
+
 async def search_duckduckgo(query: str, num_results: int = 5, session: Optional["aiohttp.ClientSession"] = None) -> list[dict]:
     """Search DuckDuckGo HTML endpoint and parse results.
 
@@ -64,7 +160,6 @@ async def search_duckduckgo(query: str, num_results: int = 5, session: Optional[
         List of dicts with title, url, snippet keys
     """
     import aiohttp
-    from bs4 import BeautifulSoup
 
     search_url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
     headers = {
@@ -84,32 +179,7 @@ async def search_duckduckgo(query: str, num_results: int = 5, session: Optional[
                         return []
 
                     html = await response.text()
-                    soup = BeautifulSoup(html, "html.parser")
-
-                    for result in soup.select(".result")[:num_results]:
-                        title_elem = result.select_one(".result__title a")
-                        snippet_elem = result.select_one(".result__snippet")
-
-                        if title_elem:
-                            href = title_elem.get("href", "")
-                            if isinstance(href, list):
-                                href = href[0] if href else ""
-                            href = str(href) if href else ""
-                            if "uddg=" in href:
-                                import urllib.parse
-
-                                parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                                actual_url = parsed.get("uddg", [href])[0]
-                            else:
-                                actual_url = href
-
-                            results.append(
-                                {
-                                    "title": title_elem.get_text(strip=True),
-                                    "url": actual_url,
-                                    "snippet": snippet_elem.get_text(strip=True) if snippet_elem else "",
-                                }
-                            )
+                    results = _parse_ddg_results(html, num_results)
         else:
             # Reuse provided session
             async with session.get(search_url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
@@ -118,32 +188,7 @@ async def search_duckduckgo(query: str, num_results: int = 5, session: Optional[
                     return []
 
                 html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                for result in soup.select(".result")[:num_results]:
-                    title_elem = result.select_one(".result__title a")
-                    snippet_elem = result.select_one(".result__snippet")
-
-                    if title_elem:
-                        href = title_elem.get("href", "")
-                        if isinstance(href, list):
-                            href = href[0] if href else ""
-                        href = str(href) if href else ""
-                        if "uddg=" in href:
-                            import urllib.parse
-
-                            parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
-                            actual_url = parsed.get("uddg", [href])[0]
-                        else:
-                            actual_url = href
-
-                        results.append(
-                            {
-                                "title": title_elem.get_text(strip=True),
-                                "url": actual_url,
-                                "snippet": snippet_elem.get_text(strip=True) if snippet_elem else "",
-                            }
-                        )
+                results = _parse_ddg_results(html, num_results)
 
     except asyncio.TimeoutError:
         _log.error("DuckDuckGo search timeout", query=query[:50])
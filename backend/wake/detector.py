@@ -12,6 +12,40 @@ CHANNELS = 1
 RATE = 16000
 WAKE_MODEL_PATH = os.path.join(os.path.dirname(__file__), "models/hey_agssel.onnx")
 
+# Device name fragment -> PyAudio input index, resolved once per process
+_input_device_cache: dict[str, int | None] = {}
+
+def find_input_device(name_substr: str, p: pyaudio.PyAudio = None) -> int | None:
+    """Return the index of the first input device whose name contains name_substr.
+
+    Matches case-insensitively so USB re-enumeration does not break a
+    hard-coded index. Returns None (PortAudio default device) if nothing matches.
+    """
+    key = name_substr.lower()
+    if key in _input_device_cache:
+        return _input_device_cache[key]
+
+    owns_pa = p is None
+    if owns_pa:
+        p = pyaudio.PyAudio()
+    try:
+        index = None
+        for i in range(p.get_device_count()):
+            info = p.get_device_info_by_index(i)
+            if info.get('maxInputChannels', 0) > 0 and key in info.get('name', '').lower():
+                index = i
+                break
+    finally:
+        if owns_pa:
+            p.terminate()
+
+    if index is None:
+        _log.warning("mic not found, using default", match=name_substr)
+    else:
+        _log.info("mic resolved", match=name_substr, dev=index)
+    _input_device_cache[key] = index
+    return index
+
 class WakewordDetector:
     def __init__(self, sensitivity: float = 0.5, gain: float = 1.0, device_index: int = None):
         self.sensitivity = sensitivity
@@ -3,12 +3,10 @@ import pyaudio
 p = pyaudio.PyAudio()
 
 print("\n--- Audio Output Devices ---")
-info = p.get_host_api_info_by_index(0)
-numdevices = info.get('deviceCount')
-
-for i in range(0, numdevices):
-    if (p.get_device_info_by_host_api_device_index(0, i).get('maxOutputChannels')) > 0:
-        name = p.get_device_info_by_host_api_device_index(0, i).get('name')
+for i in range(p.get_device_count()):
+    device_info = p.get_device_info_by_index(i)
+    if device_info.get('maxOutputChannels') > 0:
+        name = device_info.get('name')
         print(f"Device ID {i}: {name}")
 
 p.terminate()
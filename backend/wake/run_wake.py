@@ -1,12 +1,27 @@
-from .detector import WakewordDetector
+from .detector import WakewordDetector, find_input_device
 from .player import AudioPlayer
 from .conversation import ConversationHandler
+import os
 import sys
 import asyncio
+import threading
 from backend.core.logging import get_logger
 
 _log = get_logger("wake.runner")
 
+def _listen_in_thread(detector, loop, events: asyncio.Queue, resume: threading.Event):
+    # Blocking mic reads stay off the event loop. After each detection the
+    # thread waits on `resume`, so the detector is paused (and its model
+    # buffer untouched) while the conversation runs and reset() is called.
+    try:
+        for detected in detector.listen():
+            if detected:
+                resume.clear()
+                loop.call_soon_threadsafe(events.put_nowait, True)
+                resume.wait()
+    except Exception as e:
+        loop.call_soon_threadsafe(events.put_nowait, e)
+
 # PERF-041: Use single event loop instead of asyncio.run() per wakeword
 async def main_async():
     detector = None
@@ -14,35 +29,54 @@ async def main_async():
     try:
         _log.info("=== Axel Voice Asst starting ===")
 
-        detector = WakewordDetector(sensitivity=0.2, gain=3.0, device_index=11)
-        player = AudioPlayer(device_index=11)
-        handler = ConversationHandler(device_index=11)
+        # Resolve the mic by name; USB re-enumeration shifts numeric indices
+        device_index = find_input_device(os.getenv("AXEL_MIC", "USB"))
 
-        _log.info("components init done", dev=11, sensitivity=0.2, gain=3.0)
+        detector = WakewordDetector(sensitivity=0.2, gain=3.0, device_index=device_index)
+        player = AudioPlayer(device_index=device_index)
+        handler = ConversationHandler(device_index=device_index)
 
-        for detected in detector.listen():
-            if detected:
-                _log.info(">> WAKEWORD TRIGGERED <<")
-
-                player.play("listening")
-
-                try:
-                    result = await handler.handle_wakeword()
-                    if result:
-                        _log.info("conv done ok")
-                        player.play("complete")
-                    else:
-                        _log.warning("conv no res")
-                        player.play("error")
-                except Exception as e:
-                    _log.exception("conv fail", err=str(e))
+        _log.info("components init done", dev=device_index, sensitivity=0.2, gain=3.0)
+
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        resume = threading.Event()
+        # Daemon thread: a blocked stream.read() must not hold up interpreter exit
+        threading.Thread(
+            target=_listen_in_thread,
+            args=(detector, loop, events, resume),
+            name="wake-detector",
+            daemon=True,
+        ).start()
+
+        while True:
+            event = await events.get()
+            if isinstance(event, Exception):
+                raise event
+
+            _log.info(">> WAKEWORD TRIGGERED <<")
+
+            player.play("listening")
+
+            try:
+                result = await handler.handle_wakeword()
+                if result:
+                    _log.info("conv done ok")
+                    player.play("complete")
+                else:
+                    _log.warning("conv no res")
                     player.play("error")
+            except Exception as e:
+                _log.exception("conv fail", err=str(e))
+                player.play("error")
 
-                detector.reset()
+            detector.reset()
+            resume.set()
 
-                _log.debug("ready for next wakeword")
+            _log.debug("ready for next wakeword")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # Ctrl+C now arrives as cancellation of this task while it awaits the queue
         _log.info("shutdown requested (Ctrl+C)")
         if detector:
             detector.stop()
@@ -2,6 +2,7 @@
 
 import sqlite3
 import logging
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -14,32 +15,60 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent
-DB_PATH = PROJECT_ROOT / "data" / "sqlite_memory.db"
-
-def get_db_stats(conn: sqlite3.Connection) -> dict:
-
-    cursor = conn.cursor()
+sys.path.insert(0, str(PROJECT_ROOT))
 
-    cursor.execute("PRAGMA page_count")
-    page_count = cursor.fetchone()[0]
+from backend.memory.recent.connection import maintenance_lock_path
 
-    cursor.execute("PRAGMA page_size")
-    page_size = cursor.fetchone()[0]
+DB_PATH = PROJECT_ROOT / "data" / "sqlite_memory.db"
 
-    cursor.execute("PRAGMA freelist_count")
-    freelist_count = cursor.fetchone()[0]
+_STATS_SQL = """
+    SELECT
+        (SELECT page_count FROM pragma_page_count()),
+        (SELECT page_size FROM pragma_page_size()),
+        (SELECT freelist_count FROM pragma_freelist_count()),
+        (SELECT COUNT(*) FROM sessions),
+        {message_count}{log_count}
+"""
+
+def _estimate_row_count(conn: sqlite3.Connection, table: str) -> int | None:
+    """Row estimate from sqlite_stat1 (populated by ANALYZE), or None if absent."""
+    try:
+        row = conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1", (table,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if not row or not row[0]:
+        return None
+    try:
+        return int(row[0].split()[0])
+    except ValueError:
+        return None
 
-    cursor.execute("SELECT COUNT(*) FROM sessions")
-    session_count = cursor.fetchone()[0]
+def get_db_stats(conn: sqlite3.Connection, exact: bool = True) -> dict:
 
-    cursor.execute("SELECT COUNT(*) FROM messages")
-    message_count = cursor.fetchone()[0]
+    # COUNT(*) on messages is a full scan; non-exact callers take the
+    # ANALYZE estimate when one exists.
+    message_estimate = None if exact else _estimate_row_count(conn, "messages")
+    message_term = (
+        "(SELECT COUNT(*) FROM messages)" if message_estimate is None else str(message_estimate)
+    )
 
+    # One round-trip for all pragmas and counts; interaction_logs may not
+    # exist on older databases, in which case it is reported as 0.
     try:
-        cursor.execute("SELECT COUNT(*) FROM interaction_logs")
-        log_count = cursor.fetchone()[0]
+        row = conn.execute(
+            _STATS_SQL.format(
+                message_count=message_term,
+                log_count=",\n        (SELECT COUNT(*) FROM interaction_logs)",
+            )
+        ).fetchone()
     except sqlite3.OperationalError:
-        log_count = 0
+        row = conn.execute(
+            _STATS_SQL.format(message_count=message_term, log_count="")
+        ).fetchone() + (0,)
+
+    page_count, page_size, freelist_count, session_count, message_count, log_count = row
 
     return {
         "db_size_mb": round(page_count * page_size / (1024 * 1024), 2),
@@ -51,7 +80,94 @@ def get_db_stats(conn: sqlite3.Connection) -> dict:
         "interaction_logs": log_count,
     }
 
-def run_maintenance(db_path: Path = DB_PATH, dry_run: bool = False) -> dict:
+def _claim_database(db_path: Path) -> int | None:
+    """Take the maintenance lock exclusively without waiting.
+
+    Returns:
+        The lock descriptor (closing it releases the lock), or None while
+        an app connection manager holds the database.
+    """
+    import fcntl
+
+    fd = os.open(maintenance_lock_path(db_path), os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+def _vacuum_into_swap(conn: sqlite3.Connection, db_path: Path) -> bool:
+    """Write a compacted copy with VACUUM INTO, verify it, and swap it in.
+
+    Refuses while the app holds the database (see ``maintenance_lock_path``).
+    From the copy through the swap ``conn`` holds SQLite's exclusive lock,
+    so no write can land in the original after the snapshot; any other
+    open connection makes taking that lock fail. On swap ``conn`` is
+    closed before the maintenance lock is released, and the caller must
+    reopen the database.
+
+    Returns:
+        True on swap; False (nothing changed) if SQLite predates VACUUM INTO
+        (3.27), the database is in use, or the WAL could not be emptied.
+    """
+    if sqlite3.sqlite_version_info < (3, 27, 0):
+        logger.warning(f"SQLite {sqlite3.sqlite_version} lacks VACUUM INTO, using VACUUM")
+        return False
+    if os.name == "nt":
+        logger.warning("Maintenance lock needs flock, using VACUUM")
+        return False
+
+    lock_fd = _claim_database(db_path)
+    if lock_fd is None:
+        logger.warning("Database is held by the running app, using VACUUM")
+        return False
+
+    tmp_path = db_path.with_name(db_path.name + ".vacuum.tmp")
+    swapped = False
+    try:
+        # Keep the exclusive lock once taken, across the statements below
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        try:
+            conn.execute("BEGIN EXCLUSIVE")
+            conn.execute("COMMIT")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Database has other open connections ({e}), using VACUUM")
+            return False
+
+        tmp_path.unlink(missing_ok=True)
+        conn.execute("VACUUM INTO ?", (str(tmp_path),))
+
+        check_conn = sqlite3.connect(tmp_path)
+        try:
+            check = check_conn.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            check_conn.close()
+        if check != "ok":
+            raise RuntimeError(f"Compacted copy failed quick_check: {check}")
+
+        # A leftover non-empty WAL would be replayed onto the new file
+        wal_path = db_path.with_name(db_path.name + "-wal")
+        if wal_path.exists() and wal_path.stat().st_size > 0:
+            logger.warning("WAL not empty after checkpoint, using VACUUM")
+            return False
+
+        os.replace(tmp_path, db_path)
+        swapped = True
+        # Closing checkpoints and unlinks -wal/-shm by path: do it before any
+        # app connection can open the new file
+        conn.close()
+        return True
+    finally:
+        if not swapped:
+            tmp_path.unlink(missing_ok=True)
+            # Give the lock back on the next statement
+            conn.execute("PRAGMA locking_mode=NORMAL")
+        os.close(lock_fd)
+
+def run_maintenance(
+    db_path: Path = DB_PATH, dry_run: bool = False, vacuum_into: bool = False
+) -> dict:
 
     if not db_path.exists():
         logger.error(f"Database not found: {db_path}")
@@ -70,7 +186,7 @@ def run_maintenance(db_path: Path = DB_PATH, dry_run: bool = False) -> dict:
 
     try:
 
-        stats_before = get_db_stats(conn)
+        stats_before = get_db_stats(conn, exact=not dry_run)
         results["before"] = stats_before
         logger.info(f"Before: {stats_before['db_size_mb']}MB, "
                    f"{stats_before['freelist_pages']} free pages, "
@@ -93,9 +209,21 @@ def run_maintenance(db_path: Path = DB_PATH, dry_run: bool = False) -> dict:
         }
         logger.info(f"WAL checkpoint: {results['wal_checkpoint']}")
 
-        logger.info("Running VACUUM (this may take a while)...")
-        cursor.execute("VACUUM")
-        logger.info("VACUUM complete")
+        journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        if vacuum_into and _vacuum_into_swap(conn, db_path):
+            conn.close()
+            conn = sqlite3.connect(db_path, timeout=30.0)
+            cursor = conn.cursor()
+            # VACUUM INTO output is in rollback-journal mode; restore WAL
+            if journal_mode == "wal":
+                cursor.execute("PRAGMA journal_mode=WAL")
+            results["vacuum_mode"] = "into"
+            logger.info("VACUUM INTO complete, compacted copy swapped in")
+        else:
+            logger.info("Running VACUUM (this may take a while)...")
+            cursor.execute("VACUUM")
+            results["vacuum_mode"] = "in_place"
+            logger.info("VACUUM complete")
 
         logger.info("Running ANALYZE...")
         cursor.execute("ANALYZE")
@@ -111,7 +239,8 @@ def run_maintenance(db_path: Path = DB_PATH, dry_run: bool = False) -> dict:
         else:
             logger.info("Integrity check passed")
 
-        stats_after = get_db_stats(conn)
+        # ANALYZE just refreshed sqlite_stat1, so the estimate is current
+        stats_after = get_db_stats(conn, exact=False)
         results["after"] = stats_after
 
         space_saved = stats_before["db_size_mb"] - stats_after["db_size_mb"]
@@ -150,6 +279,7 @@ Examples:
   python scripts/db_maintenance.py              # Run maintenance
   python scripts/db_maintenance.py --dry-run    # Show stats only
   python scripts/db_maintenance.py --json       # Output as JSON
+  python scripts/db_maintenance.py --vacuum-into  # Compact via copy + swap
         """
     )
     parser.add_argument(
@@ -162,6 +292,12 @@ Examples:
         action="store_true",
         help="Output results as JSON"
     )
+    parser.add_argument(
+        "--vacuum-into",
+        action="store_true",
+        help="Compact via VACUUM INTO + file swap instead of in-place VACUUM "
+             "(falls back to VACUUM while the app holds the database)"
+    )
     parser.add_argument(
         "--db",
         type=Path,
@@ -171,7 +307,9 @@ Examples:
 
     args = parser.parse_args()
 
-    results = run_maintenance(db_path=args.db, dry_run=args.dry_run)
+    results = run_maintenance(
+        db_path=args.db, dry_run=args.dry_run, vacuum_into=args.vacuum_into
+    )
 
     if args.json:
         import json
@@ -4,6 +4,7 @@ import asyncio
 import argparse
 import json
 import sqlite3
+import tempfile
 from pathlib import Path
 
 if os.path.exists('/app'):
@@ -22,11 +23,17 @@ from backend.memory.permanent import LongTermMemory, MemoryConfig
 from backend.memory.recent import SessionArchive
 from backend.memory import MemoryManager
 from backend.core.identity.ai_brain import IdentityManager
+from backend.core.utils.file_utils import TMP_FILE_PREFIX, fsync_directory
 from collections import defaultdict
 
 init_state = None
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import native module for optimized vector operations
 try:
     import axnmihn_native as _native
@@ -42,10 +49,10 @@ OVERSIZED_PATTERNS = [
     "data:image/webp;base64,",
 ]
 
-def get_content_hash(content: str) -> str:
+def get_content_hash(content: str) -> bytes:
 
     normalized = content.lower().strip()[:200]
-    return hashlib.md5(normalized.encode()).hexdigest()
+    return hashlib.blake2b(normalized.encode("utf-8", "ignore"), digest_size=16).digest()
 
 def phase1_hash_dedup(ltm, all_data, dry_run: bool = False) -> list:
     """Phase 1: Hash-based exact duplicate removal."""
@@ -92,7 +99,9 @@ def _phase2_native(ltm, threshold: float) -> list[dict]:
 
     Fetches all embeddings from ChromaDB in a single call, then uses
     native find_duplicates_by_embedding for O(N^2) batch comparison.
-    Eliminates per-memory API calls entirely.
+    Eliminates per-memory API calls entirely. Documents are not part of
+    the bulk fetch; preview text is loaded in one lookup, only for the
+    memories chosen for deletion.
 
     Args:
         ltm: LongTermMemory instance
@@ -103,15 +112,12 @@ def _phase2_native(ltm, threshold: float) -> list[dict]:
     """
     import numpy as np
 
-    results = ltm.get_all_memories(
-        include=["documents", "metadatas", "embeddings"]
-    )
+    results = ltm.get_all_memories(include=["metadatas", "embeddings"])
 
     if not results["ids"] or results.get("embeddings") is None or len(results["embeddings"]) == 0:
         return []
 
     ids = results["ids"]
-    docs = results["documents"] or [""] * len(ids)
     embeddings_raw = results["embeddings"]
     metadatas = results["metadatas"] or [{}] * len(ids)
 
@@ -152,20 +158,22 @@ def _phase2_native(ltm, threshold: float) -> list[dict]:
 
         # Keep the one with higher importance
         if imp_i >= imp_j:
-            keep_id, remove_id, remove_idx = id_i, id_j, idx_j
+            keep_id, remove_id = id_i, id_j
         else:
-            keep_id, remove_id, remove_idx = id_j, id_i, idx_i
+            keep_id, remove_id = id_j, id_i
 
         if remove_id not in delete_ids:
             delete_ids.add(remove_id)
-            preview = (docs[remove_idx] or "")[:50]
             to_delete.append({
                 "id": remove_id,
                 "original_id": keep_id,
                 "similarity": sim,
-                "preview": preview,
             })
 
+    contents = ltm.get_memory_contents([d["id"] for d in to_delete])
+    for d in to_delete:
+        d["preview"] = (contents.get(d["id"]) or "")[:50]
+
     return to_delete
 
 
@@ -745,18 +753,24 @@ def cleanup_working_memory(dry_run: bool = True, threshold: int = SIZE_THRESHOLD
     if not path.exists():
         return {"status": "skipped", "reason": "file not found"}
 
-    with open(path) as f:
+    with open(path, encoding="utf-8") as f:
         data = json.load(f)
 
-    original_count = len(data.get("messages", []))
+    messages = data.get("messages", [])
+    original_count = len(messages)
     clean_messages = []
     removed = []
 
-    for msg in data.get("messages", []):
-        content = msg.get("content", "")
+    # Pair each message with its text once; non-string content counts as empty
+    contents = [
+        content if isinstance(content := msg.get("content"), str) else ""
+        for msg in messages
+    ]
+    for msg, content in zip(messages, contents):
         size = len(content)
         is_oversized = size > threshold
-        has_base64 = any(p in content for p in OVERSIZED_PATTERNS)
+        # Every pattern contains ";base64,", so most messages need one scan
+        has_base64 = ";base64," in content and any(p in content for p in OVERSIZED_PATTERNS)
 
         if is_oversized or has_base64:
             removed.append({
@@ -776,8 +790,24 @@ def cleanup_working_memory(dry_run: bool = True, threshold: int = SIZE_THRESHOLD
 
     if not dry_run and removed:
         data["messages"] = clean_messages
-        with open(path, "w") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        # Write beside the original and swap in atomically so an interrupted
+        # run leaves the previous working_memory.json intact
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=path.parent,
+            prefix=TMP_FILE_PREFIX,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, path)
+        fsync_directory(path.parent)
 
     return result
 
@@ -17,6 +17,7 @@ Usage:
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -25,7 +26,7 @@ import shutil
 import sqlite3
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -57,6 +58,9 @@ EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "models/gemini-embedding-001")
 # Phase 3 constants
 # ──────────────────────────────────────────────────────────────────────
 OPENAI_CONCURRENCY = 10
+SQLITE_UPDATE_BATCH = 1000  # rows per UPDATE transaction in the strip pass
+STRIP_CHECKED_TABLE = "_strip_checked"  # content hashes of rows already stripped
+PARALLEL_STRIP_MIN = 500  # below this, process-pool startup outweighs the gain
 OPENAI_MODEL = "gpt-5-mini-2025-08-07"
 
 CLEAN_TEXT_SYSTEM = "You are a text cleaning assistant. Return only the cleaned text, nothing else."
@@ -103,6 +107,20 @@ _KO_EN_PAIR_RE = re.compile(
 )
 
 
+def _connect_sqlite(read_only: bool = False) -> sqlite3.Connection:
+    """Open the SQLite DB with WAL settings suited to bulk UPDATE passes.
+
+    Read-only connections (dry runs) leave the file's journal mode alone.
+    """
+    if read_only:
+        return sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
 def _needs_cleaning(content: str) -> bool:
     """Check if content needs cleaning (emoji, ko-en pairs, smart quotes, bracket tags)."""
     if _EMOJI_RE.search(content):
@@ -401,6 +419,39 @@ def _embed_single(
         return None
 
 
+def _reembed_batch(
+    collection,
+    rotator: GeminiKeyRotator,
+    batch: list[tuple[str, str]],
+) -> tuple[int, int]:
+    """Embed a batch of (doc_id, content) pairs and write them in one update.
+
+    Embeddings are generated concurrently; successful rows are then sent
+    to ChromaDB as a single update call instead of one call per document.
+
+    Returns:
+        (updated, errors) counts.
+    """
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        embeddings = list(executor.map(
+            lambda item: _embed_single(rotator.get_client(), item[1], EMBEDDING_MODEL),
+            batch,
+        ))
+
+    ids: list[str] = []
+    documents: list[str] = []
+    vectors: list[list[float]] = []
+    for (doc_id, new_content), embedding in zip(batch, embeddings):
+        if embedding:
+            ids.append(doc_id)
+            documents.append(new_content)
+            vectors.append(embedding)
+
+    if ids:
+        collection.update(ids=ids, documents=documents, embeddings=vectors)
+    return len(ids), len(batch) - len(ids)
+
+
 def phase2_replace_labels(dry_run: bool = False) -> dict:
     """Replace role labels in ChromaDB and re-embed changed documents.
 
@@ -454,26 +505,11 @@ def phase2_replace_labels(dry_run: bool = False) -> dict:
     batch_size = 100
     for batch_start in range(0, len(changes), batch_size):
         batch = changes[batch_start : batch_start + batch_size]
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {}
-            for doc_id, _old, new_content in batch:
-                gem_client = rotator.get_client()
-                future = executor.submit(_embed_single, gem_client, new_content, EMBEDDING_MODEL)
-                futures[future] = (doc_id, new_content)
-
-            for future in as_completed(futures):
-                doc_id, new_content = futures[future]
-                embedding = future.result()
-                if embedding:
-                    collection.update(
-                        ids=[doc_id],
-                        documents=[new_content],
-                        embeddings=[embedding],
-                    )
-                    success += 1
-                else:
-                    errors += 1
+        batch_updated, batch_errors = _reembed_batch(
+            collection, rotator, [(doc_id, new) for doc_id, _old, new in batch]
+        )
+        success += batch_updated
+        errors += batch_errors
 
         logger.info(
             "Phase 2 — Batch %d/%d done (%d success so far)",
@@ -555,18 +591,19 @@ async def _phase3_sqlite(
     openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect_sqlite(read_only=dry_run)
     cursor = conn.cursor()
 
     query = "SELECT id, content FROM messages ORDER BY id"
     if limit:
         query += f" LIMIT {limit}"
     cursor.execute(query)
-    all_messages = cursor.fetchall()
 
-    # Filter: skip short messages and those that don't need cleaning
+    # Filter while streaming: only candidates are held in memory
+    total = 0
     candidates: list[tuple[int, str]] = []
-    for msg_id, content in all_messages:
+    for msg_id, content in cursor:
+        total += 1
         if not content or len(content.strip()) < 10:
             continue
         if not _needs_cleaning(content):
@@ -575,13 +612,13 @@ async def _phase3_sqlite(
 
     logger.info(
         "Phase 3 (SQLite) — Total: %d, Candidates for cleaning: %d",
-        len(all_messages),
+        total,
         len(candidates),
     )
 
     if not candidates:
         conn.close()
-        return {"total": len(all_messages), "candidates": 0, "updated": 0}
+        return {"total": total, "candidates": 0, "updated": 0}
 
     if dry_run:
         for msg_id, content in candidates[:5]:
@@ -599,7 +636,7 @@ async def _phase3_sqlite(
             logger.info("  ... and %d more", len(candidates) - 5)
         conn.close()
         return {
-            "total": len(all_messages),
+            "total": total,
             "candidates": len(candidates),
             "updated": 0,
             "dry_run": True,
@@ -618,12 +655,10 @@ async def _phase3_sqlite(
         ]
         results = await asyncio.gather(*tasks)
 
-        for msg_id, cleaned in results:
-            if cleaned:
-                cursor.execute("UPDATE messages SET content = ? WHERE id = ?", (cleaned, msg_id))
-                updated += 1
-            else:
-                skipped += 1
+        updates = [(cleaned, msg_id) for msg_id, cleaned in results if cleaned]
+        cursor.executemany("UPDATE messages SET content = ? WHERE id = ?", updates)
+        updated += len(updates)
+        skipped += len(results) - len(updates)
 
         conn.commit()
         logger.info(
@@ -637,7 +672,7 @@ async def _phase3_sqlite(
     conn.close()
 
     logger.info("Phase 3 (SQLite) — Updated: %d / %d candidates", updated, len(candidates))
-    return {"total": len(all_messages), "candidates": len(candidates), "updated": updated}
+    return {"total": total, "candidates": len(candidates), "updated": updated}
 
 
 async def _phase3_chroma(
@@ -728,27 +763,9 @@ async def _phase3_chroma(
                 skipped += 1
 
         if changed_docs:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {}
-                for doc_id, new_content in changed_docs:
-                    gem_client = rotator.get_client()
-                    future = executor.submit(
-                        _embed_single, gem_client, new_content, EMBEDDING_MODEL
-                    )
-                    futures[future] = (doc_id, new_content)
-
-                for future in as_completed(futures):
-                    doc_id, new_content = futures[future]
-                    embedding = future.result()
-                    if embedding:
-                        collection.update(
-                            ids=[doc_id],
-                            documents=[new_content],
-                            embeddings=[embedding],
-                        )
-                        updated += 1
-                    else:
-                        errors += 1
+            batch_updated, batch_errors = _reembed_batch(collection, rotator, changed_docs)
+            updated += batch_updated
+            errors += batch_errors
 
         logger.info(
             "Phase 3 (ChromaDB) — Batch %d/%d: updated=%d, skipped=%d, errors=%d",
@@ -822,28 +839,88 @@ def _strip_text(content: str) -> str:
     return result
 
 
-def phase3r_regex_strip(dry_run: bool = False, limit: int | None = None) -> dict:
-    """Strip emojis and normalize Korean-English pairs using regex (no LLM).
+def _strip_if_changed(content: str | None) -> str | None:
+    """Return the stripped document, or None if it needs no change."""
+    if not content or len(content.strip()) < 5:
+        return None
+    if not _needs_cleaning(content):
+        return None
+    stripped = _strip_text(content)
+    if stripped != content and stripped:
+        return stripped
+    return None
 
-    Also processes ChromaDB documents and re-embeds them.
-    """
-    # ── SQLite ──
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
 
-    query = "SELECT id, content FROM messages ORDER BY id"
+def _content_hash(content: str) -> bytes:
+    """Short digest used to recognize rows unchanged since the last strip run."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).digest()
+
+
+def _phase3r_sqlite(dry_run: bool, limit: int | None) -> dict:
+    """SQLite half of phase 3R: strip messages in batched UPDATEs.
+
+    Rows whose content hash matches the one recorded by a previous run
+    are skipped without running the regexes again. The hash table is
+    private to this script and created on first write run; a dry run
+    only reads it, and scans every row when it does not exist yet.
+    """
+    # Writer first so WAL is enabled; the reader then streams rows from
+    # its own snapshot while batches commit on the writer connection.
+    conn = _connect_sqlite(read_only=dry_run)
+    if dry_run:
+        has_checked = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (STRIP_CHECKED_TABLE,),
+        ).fetchone() is not None
+    else:
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {STRIP_CHECKED_TABLE} "
+                "(rid INTEGER PRIMARY KEY, sha BLOB NOT NULL)"
+            )
+        has_checked = True
+    record = not dry_run
+    if not has_checked:
+        logger.info("Phase 3R (SQLite) — %s missing, scanning every row", STRIP_CHECKED_TABLE)
+    read_conn = _connect_sqlite(read_only=True)
+
+    if has_checked:
+        query = (
+            f"SELECT m.id, m.content, c.sha FROM messages m "
+            f"LEFT JOIN {STRIP_CHECKED_TABLE} c ON c.rid = m.id ORDER BY m.id"
+        )
+    else:
+        query = "SELECT id, content, NULL FROM messages ORDER BY id"
     if limit:
         query += f" LIMIT {limit}"
-    cursor.execute(query)
-    all_messages = cursor.fetchall()
 
     sqlite_candidates = 0
     sqlite_updated = 0
+    sqlite_skipped = 0
+    updates: list[tuple[str, int]] = []
+    checked: list[tuple[int, bytes]] = []
+
+    def flush_updates() -> None:
+        with conn:
+            conn.executemany("UPDATE messages SET content = ? WHERE id = ?", updates)
+            if checked:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {STRIP_CHECKED_TABLE} (rid, sha) VALUES (?, ?)",
+                    checked,
+                )
+        updates.clear()
+        checked.clear()
 
-    for msg_id, content in all_messages:
-        if not content or len(content.strip()) < 5:
+    for msg_id, content, prev_sha in read_conn.execute(query):
+        if not content:
             continue
-        if not _needs_cleaning(content):
+        sha = _content_hash(content)
+        if sha == prev_sha:
+            sqlite_skipped += 1
+            continue
+        if len(content.strip()) < 5 or not _needs_cleaning(content):
+            if record:
+                checked.append((msg_id, sha))
             continue
         sqlite_candidates += 1
         stripped = _strip_text(content)
@@ -857,21 +934,45 @@ def phase3r_regex_strip(dry_run: bool = False, limit: int | None = None) -> dict
                         stripped[:50].replace("\n", " "),
                     )
             else:
-                cursor.execute("UPDATE messages SET content = ? WHERE id = ?", (stripped, msg_id))
+                updates.append((stripped, msg_id))
+                if record:
+                    checked.append((msg_id, _content_hash(stripped)))
             sqlite_updated += 1
-
-    if not dry_run:
-        conn.commit()
+        elif record:
+            checked.append((msg_id, sha))
+        if len(updates) >= SQLITE_UPDATE_BATCH or len(checked) >= SQLITE_UPDATE_BATCH:
+            flush_updates()
+
+    if updates or checked:
+        flush_updates()
+    if record:
+        # Drop hashes of messages deleted since they were recorded
+        with conn:
+            conn.execute(
+                f"DELETE FROM {STRIP_CHECKED_TABLE} "
+                "WHERE rid NOT IN (SELECT id FROM messages)"
+            )
+    read_conn.close()
     conn.close()
 
     logger.info(
-        "Phase 3R (SQLite) — Candidates: %d, %s: %d",
+        "Phase 3R (SQLite) — Candidates: %d, %s: %d, unchanged since last run: %d",
         sqlite_candidates,
         "would update" if dry_run else "updated",
         sqlite_updated,
+        sqlite_skipped,
     )
 
-    # ── ChromaDB ──
+    return {"candidates": sqlite_candidates, "updated": sqlite_updated}
+
+
+def phase3r_regex_strip(dry_run: bool = False, limit: int | None = None) -> dict:
+    """Strip emojis and normalize Korean-English pairs using regex (no LLM).
+
+    Also processes ChromaDB documents and re-embeds them. When the
+    ChromaDB strip fans out to a process pool, the independent SQLite
+    pass runs as one more task in that pool instead of before it.
+    """
     import chromadb
 
     client = chromadb.PersistentClient(path=str(CHROMADB_PATH))
@@ -883,18 +984,32 @@ def phase3r_regex_strip(dry_run: bool = False, limit: int | None = None) -> dict
     all_data = collection.get(include=["documents"])
     total_chroma = len(all_data["ids"])
 
+    documents = all_data["documents"] or [""] * total_chroma
+    if limit or total_chroma < PARALLEL_STRIP_MIN:
+        sqlite_stats = _phase3r_sqlite(dry_run, limit)
+        # Lazy so --limit stops work as soon as enough changes are found
+        stripped_docs = map(_strip_if_changed, documents)
+    else:
+        # Pure-Python regex work on independent strings: fan out across cores
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor() as executor:
+            sqlite_future = executor.submit(_phase3r_sqlite, dry_run, limit)
+            stripped_docs = list(
+                executor.map(
+                    _strip_if_changed,
+                    documents,
+                    chunksize=max(1, total_chroma // (workers * 8)),
+                )
+            )
+            sqlite_stats = sqlite_future.result()
+
     chroma_changes: list[tuple[str, str]] = []
-    for i, doc_id in enumerate(all_data["ids"]):
-        content = all_data["documents"][i] if all_data["documents"] else ""
-        if not content or len(content.strip()) < 5:
-            continue
-        if not _needs_cleaning(content):
+    for doc_id, stripped in zip(all_data["ids"], stripped_docs):
+        if stripped is None:
             continue
-        stripped = _strip_text(content)
-        if stripped != content and stripped:
-            chroma_changes.append((doc_id, stripped))
-            if limit and len(chroma_changes) >= limit:
-                break
+        chroma_changes.append((doc_id, stripped))
+        if limit and len(chroma_changes) >= limit:
+            break
 
     logger.info(
         "Phase 3R (ChromaDB) — Total: %d, Changes: %d",
@@ -911,28 +1026,9 @@ def phase3r_regex_strip(dry_run: bool = False, limit: int | None = None) -> dict
 
         for batch_start in range(0, len(chroma_changes), batch_size):
             batch = chroma_changes[batch_start : batch_start + batch_size]
-
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {}
-                for doc_id, new_content in batch:
-                    gem_client = rotator.get_client()
-                    future = executor.submit(
-                        _embed_single, gem_client, new_content, EMBEDDING_MODEL
-                    )
-                    futures[future] = (doc_id, new_content)
-
-                for future in as_completed(futures):
-                    doc_id, new_content = futures[future]
-                    embedding = future.result()
-                    if embedding:
-                        collection.update(
-                            ids=[doc_id],
-                            documents=[new_content],
-                            embeddings=[embedding],
-                        )
-                        chroma_updated += 1
-                    else:
-                        chroma_errors += 1
+            batch_updated, batch_errors = _reembed_batch(collection, rotator, batch)
+            chroma_updated += batch_updated
+            chroma_errors += batch_errors
 
             logger.info(
                 "Phase 3R (ChromaDB) — Batch %d/%d: updated=%d",
@@ -948,7 +1044,7 @@ def phase3r_regex_strip(dry_run: bool = False, limit: int | None = None) -> dict
         chroma_updated = len(chroma_changes)
 
     return {
-        "sqlite": {"candidates": sqlite_candidates, "updated": sqlite_updated},
+        "sqlite": sqlite_stats,
         "chroma": {"total": total_chroma, "changed": len(chroma_changes), "updated": chroma_updated, "errors": chroma_errors},
     }
 
@@ -4,23 +4,25 @@
 8-phase GC for PG-backed memory system:
   Phase 1: Emoji strip (messages, memories)
   Phase 2: LLM summarize (long messages via Gemini)
-  Phase 3: Hash dedup (SHA-256 content dedup)
+  Phase 3: Hash dedup (normalized content dedup)
   Phase 4: Decay cleanup (low-importance memories)
   Phase 5: Archive cleanup (old archived_messages)
   Phase 6: Meta cleanup (old memory_access_patterns)
-  Phase 7: KG cleanup (stale entities, weak/orphan relations)
+  Phase 7: KG cleanup (stale entities, weak relations)
   Phase 8: VACUUM ANALYZE
 """
 
 import argparse
-import hashlib
+import asyncio
+import csv
+import io
+import itertools
 import logging
 import os
 import re
 import sys
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -30,6 +32,7 @@ else:
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import psycopg2
+from dotenv import load_dotenv
 
 from backend.config import DATABASE_URL, DEFAULT_GEMINI_MODEL
 
@@ -45,6 +48,18 @@ logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Read once at import; KeyRotator instances reuse the parsed keys
+load_dotenv(PROJECT_ROOT / ".env")
+_KEYS = tuple(
+    k
+    for k in (
+        os.getenv("GEMINI_API_KEY"),
+        os.getenv("GEMINI_API_KEY_1"),
+        os.getenv("GEMINI_API_KEY_2"),
+    )
+    if k
+)
+
 # ── Emoji regex ──────────────────────────────────────────────────────────────
 
 _EMOJI_RE = re.compile(
@@ -62,6 +77,9 @@ _EMOJI_RE = re.compile(
     "]+",
     flags=re.UNICODE,
 )
+# Literal codepoint ranges in one bracket expression: valid as-is for
+# PostgreSQL's ~ and regexp_replace, so phase 1 passes the same pattern
+_EMOJI_PG_PATTERN: str = _EMOJI_RE.pattern
 
 SUMMARIZE_PROMPT = """이 메시지를 500자 이내로 요약해주세요.
 핵심 내용과 맥락을 보존하고, 불필요한 로그/메타정보를 제거하세요.
@@ -71,36 +89,45 @@ SUMMARIZE_PROMPT = """이 메시지를 500자 이내로 요약해주세요.
 {content}"""
 
 PARALLEL_WORKERS = 10
-
-
-def remove_emoji(text: str) -> str:
-    """Remove emoji characters from text."""
-    return _EMOJI_RE.sub("", text)
-
-
-def _content_hash(content: str) -> str:
-    """SHA-256 hash of normalized content for dedup."""
-    normalized = content.strip().lower()[:500]
-    return hashlib.sha256(normalized.encode()).hexdigest()
+SUMMARY_UPDATE_BATCH = 5000  # rows staged per COPY flush in phase 2
+LONG_MESSAGE_ITERSIZE = 1000  # rows per server-side cursor fetch in phase 2
+LONG_MESSAGE_CHARS = 2000  # phase 2 summarizes messages longer than this
+ARCHIVE_RETENTION_DAYS = 90  # phase 5
+ACCESS_PATTERN_RETENTION_DAYS = 30  # phase 6
+STALE_ENTITY_DAYS = 30  # phase 7
+VACUUM_PARALLEL_WORKERS = 4  # phase 8, index vacuum workers per table (PG 13+)
+VACUUM_CONNECTIONS = 4  # phase 8, tables maintained concurrently
+
+# Tables whose content phase 1 strips; cleaned_at (added by the migrate
+# command) marks rows already scanned
+_WATERMARK_TABLES = ("messages", "memories")
+
+# Indexes backing the filters of phases 1, 2, 6 and 7: (name, table, definition).
+# Created by the migrate command; the cleaned_at ones need install_watermarks first
+_GC_INDEXES = [
+    ("idx_gc_messages_uncleaned", "messages", "(id) WHERE cleaned_at IS NULL"),
+    ("idx_gc_memories_uncleaned", "memories", "(uuid) WHERE cleaned_at IS NULL"),
+    # Partial index holding exactly the phase 2 candidates; its predicate
+    # must match the phase 2 queries for the planner to use it
+    ("idx_gc_messages_long", "messages", f"(id) WHERE length(content) > {LONG_MESSAGE_CHARS}"),
+    # archived_messages has none: phase 5 filters on timestamp::timestamptz,
+    # which a plain index cannot serve, and the cast is not immutable so it
+    # cannot be indexed as an expression either
+    ("idx_gc_access_patterns_created", "memory_access_patterns", "(created_at)"),
+    ("idx_gc_entities_created", "entities", "(created_at)"),
+]
+# Indexes earlier versions created that no query uses; dropped by migrate
+_OBSOLETE_GC_INDEXES = ("idx_gc_archived_timestamp",)
 
 
 # ── KeyRotator ───────────────────────────────────────────────────────────────
 
 
 class KeyRotator:
-    """Gemini API key rotation (thread-safe)."""
+    """Gemini API key rotation (round-robin, lock-free)."""
 
     def __init__(self):
-        from dotenv import load_dotenv
-
-        load_dotenv(PROJECT_ROOT / ".env")
-
-        self.keys = [
-            os.getenv("GEMINI_API_KEY"),
-            os.getenv("GEMINI_API_KEY_1"),
-            os.getenv("GEMINI_API_KEY_2"),
-        ]
-        self.keys = [k for k in self.keys if k]
+        self.keys = list(_KEYS)
 
         if not self.keys:
             raise ValueError("GEMINI_API_KEY가 .env에 없습니다")
@@ -108,20 +135,18 @@ class KeyRotator:
         from google import genai
 
         self.clients = [genai.Client(api_key=k) for k in self.keys]
-        self.current_idx = 0
-        self.lock = threading.Lock()
-        self.call_counts = {i: 0 for i in range(len(self.keys))}
+        # next() on a cycle is atomic under the GIL, so no lock is needed
+        self._cycle = itertools.cycle(range(len(self.clients)))
+        self.call_counts = [0] * len(self.keys)
         logger.info(f"API 키 {len(self.keys)}개 로드됨")
 
     def get_client(self):
-        with self.lock:
-            client = self.clients[self.current_idx]
-            self.call_counts[self.current_idx] += 1
-            self.current_idx = (self.current_idx + 1) % len(self.keys)
-            return client
+        idx = next(self._cycle)
+        self.call_counts[idx] += 1
+        return self.clients[idx]
 
     def get_stats(self) -> dict:
-        return {f"key_{i}": cnt for i, cnt in self.call_counts.items()}
+        return {f"key_{i}": cnt for i, cnt in enumerate(self.call_counts)}
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -142,57 +167,178 @@ def _connect(autocommit: bool = False):
     return conn
 
 
-# ── Phase implementations ────────────────────────────────────────────────────
+def _watermarked_tables(conn) -> frozenset[str]:
+    """Names of the _WATERMARK_TABLES that already have a cleaned_at column."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT table_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND column_name = 'cleaned_at' "
+            "AND table_name = ANY(%s)",
+            (list(_WATERMARK_TABLES),),
+        )
+        return frozenset(row[0] for row in cur.fetchall())
+
+
+# Any UPDATE that changes content without setting cleaned_at itself (app
+# edits, phase 2 summaries) queues the row for phase 1 again
+_RESET_WATERMARK_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION gc_reset_cleaned_at() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF NEW.content IS DISTINCT FROM OLD.content
+           AND NEW.cleaned_at IS NOT DISTINCT FROM OLD.cleaned_at THEN
+            NEW.cleaned_at := NULL;
+        END IF;
+        RETURN NEW;
+    END
+    $$
+"""
+_RESET_WATERMARK_TRIGGER = "trg_gc_reset_cleaned_at"
 
 
-def phase1_emoji_strip(conn, dry_run: bool = False) -> dict:
-    """Phase 1: Remove emoji from messages.content and memories.content."""
-    print("\n[Phase 1] Emoji strip...")
+def install_watermarks(conn) -> dict:
+    """Add the cleaned_at watermark that phase 1 maintains, and its reset trigger.
 
-    result = {"messages_updated": 0, "memories_updated": 0}
+    The column is added with a NOW() default, which PostgreSQL 11+ stores
+    in the catalog without rewriting the table, so every existing row reads
+    as scanned. Those rows are stripped of emoji here, in the same
+    transaction, and the default is then dropped so new rows start
+    unscanned. Only rows that contain emoji are rewritten. The trigger is
+    (re)installed on every run.
+    """
+    print("\n[Migrate] cleaned_at watermark columns...")
+
+    installed = _watermarked_tables(conn)
+    missing = [t for t in _WATERMARK_TABLES if t not in installed]
 
+    stripped = 0
     with conn.cursor() as cur:
-        # messages
-        cur.execute(
-            "SELECT id, content FROM messages WHERE content ~ %s",
-            (_EMOJI_RE.pattern,),
-        )
-        msg_rows = cur.fetchall()
-        print(f"  Messages with emoji: {len(msg_rows)}")
+        for table in missing:
+            # ACCESS EXCLUSIVE until commit: no row lands between the
+            # default stamp and the strip
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN cleaned_at timestamptz DEFAULT NOW()")
+            cur.execute(
+                f"UPDATE {table} SET content = regexp_replace(content, %s, '', 'g') "
+                "WHERE content ~ %s",
+                (_EMOJI_PG_PATTERN, _EMOJI_PG_PATTERN),
+            )
+            stripped += cur.rowcount
+            cur.execute(f"ALTER TABLE {table} ALTER COLUMN cleaned_at DROP DEFAULT")
+        cur.execute(_RESET_WATERMARK_FUNCTION_SQL)
+        for table in _WATERMARK_TABLES:
+            cur.execute(f"DROP TRIGGER IF EXISTS {_RESET_WATERMARK_TRIGGER} ON {table}")
+            cur.execute(
+                f"CREATE TRIGGER {_RESET_WATERMARK_TRIGGER} "
+                f"BEFORE UPDATE OF content ON {table} "
+                "FOR EACH ROW EXECUTE FUNCTION gc_reset_cleaned_at()"
+            )
+    conn.commit()
 
-        if msg_rows and not dry_run:
-            for row_id, content in msg_rows:
-                cleaned = remove_emoji(content)
-                if cleaned != content:
-                    cur.execute(
-                        "UPDATE messages SET content = %s WHERE id = %s",
-                        (cleaned, row_id),
-                    )
-                    result["messages_updated"] += 1
-        elif msg_rows and dry_run:
-            result["messages_updated"] = len(msg_rows)
-            print(f"  [DRY-RUN] Would update {len(msg_rows)} messages")
+    if missing:
+        print(f"  Rows stripped: {stripped}")
+        print(f"  Installed: {', '.join(f'{t}.cleaned_at' for t in missing)}")
+    else:
+        print("  Columns already installed, reset trigger refreshed")
+    return {"installed": len(missing), "rows_stripped": stripped}
 
-        # memories
-        cur.execute(
-            "SELECT uuid, content FROM memories WHERE content ~ %s",
-            (_EMOJI_RE.pattern,),
-        )
-        mem_rows = cur.fetchall()
-        print(f"  Memories with emoji: {len(mem_rows)}")
 
-        if mem_rows and not dry_run:
-            for row_uuid, content in mem_rows:
-                cleaned = remove_emoji(content)
-                if cleaned != content:
+def install_gc_indexes() -> None:
+    """Create the indexes GC filters use and drop obsolete ones.
+
+    Indexes are built CONCURRENTLY so live writers are not blocked, which
+    requires an autocommit connection. Missing tables or columns are
+    skipped.
+    """
+    print("\n[Migrate] GC indexes...")
+
+    conn = _connect(autocommit=True)
+    try:
+        with conn.cursor() as cur:
+            for name, table, definition in _GC_INDEXES:
+                try:
                     cur.execute(
-                        "UPDATE memories SET content = %s WHERE uuid = %s",
-                        (cleaned, row_uuid),
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                        f"ON {table} {definition}"
                     )
-                    result["memories_updated"] += 1
-        elif mem_rows and dry_run:
-            result["memories_updated"] = len(mem_rows)
-            print(f"  [DRY-RUN] Would update {len(mem_rows)} memories")
+                except Exception as e:
+                    print(f"  Index {name} skipped: {e}")
+            for name in _OBSOLETE_GC_INDEXES:
+                cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    finally:
+        conn.close()
+
+
+# ── Phase implementations ────────────────────────────────────────────────────
+
+# Strips and stamps unscanned rows in a single statement, so a row committed
+# after its snapshot is neither stripped nor stamped and waits for the next
+# run. The CASE re-tests the row version actually updated; scan.hit only
+# feeds the reported count.
+_STRIP_AND_STAMP_SQL = """
+    WITH scan AS (
+        SELECT {key} AS k, content ~ %(pattern)s AS hit
+        FROM {table} WHERE cleaned_at IS NULL
+    ), stamped AS (
+        UPDATE {table} t SET
+            content = CASE WHEN t.content ~ %(pattern)s
+                THEN regexp_replace(t.content, %(pattern)s, '', 'g')
+                ELSE t.content END,
+            cleaned_at = NOW()
+        FROM scan
+        WHERE t.{key} = scan.k AND t.cleaned_at IS NULL
+        RETURNING scan.hit
+    )
+    SELECT COUNT(*) FILTER (WHERE hit) FROM stamped
+"""
+
+
+def phase1_emoji_strip(conn, dry_run: bool = False) -> dict:
+    """Phase 1: Remove emoji from messages.content and memories.content.
+
+    The rewrite runs server-side as one UPDATE per table, so rows never
+    travel to the client. Where the cleaned_at watermark exists only
+    unstamped rows are scanned, and the same statement stamps them, so each
+    run costs O(new or edited rows). Content edits clear the stamp (via the
+    trigger install_watermarks adds), so edited rows are scanned again.
+    Tables without the column are scanned in full.
+    """
+    print("\n[Phase 1] Emoji strip...")
+
+    result = {"messages_updated": 0, "memories_updated": 0}
+    watermarked = _watermarked_tables(conn)
+
+    with conn.cursor() as cur:
+        for table, pk, key, label in (
+            ("messages", "id", "messages_updated", "Messages"),
+            ("memories", "uuid", "memories_updated", "Memories"),
+        ):
+            has_mark = table in watermarked
+            if not has_mark:
+                print(f"  {table}.cleaned_at missing (run 'migrate'), scanning all rows")
+            unscanned = "cleaned_at IS NULL AND " if has_mark else ""
+            if dry_run:
+                cur.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE {unscanned}content ~ %s",
+                    (_EMOJI_PG_PATTERN,),
+                )
+                count = cur.fetchone()[0]
+                print(f"  {label} with emoji: {count}")
+                if count:
+                    print(f"  [DRY-RUN] Would update {count} {table}")
+            elif has_mark:
+                cur.execute(
+                    _STRIP_AND_STAMP_SQL.format(table=table, key=pk),
+                    {"pattern": _EMOJI_PG_PATTERN},
+                )
+                count = cur.fetchone()[0]
+            else:
+                cur.execute(
+                    f"UPDATE {table} SET content = regexp_replace(content, %s, '', 'g') "
+                    "WHERE content ~ %s",
+                    (_EMOJI_PG_PATTERN, _EMOJI_PG_PATTERN),
+                )
+                count = cur.rowcount
+            result[key] = count
 
     if not dry_run:
         conn.commit()
@@ -204,15 +350,15 @@ def phase1_emoji_strip(conn, dry_run: bool = False) -> dict:
     return result
 
 
-def _summarize_single(msg_id: int, content: str, client, max_retries: int = 2):
-    """Summarize a single message with Gemini (for ThreadPoolExecutor)."""
+async def _summarize_single(msg_id: int, content: str, client, max_retries: int = 2):
+    """Summarize a single message with Gemini's async client."""
     from google.genai import types
 
     prompt = SUMMARIZE_PROMPT.format(content=content[:4000])
 
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
+            response = await client.aio.models.generate_content(
                 model=DEFAULT_GEMINI_MODEL,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -226,103 +372,170 @@ def _summarize_single(msg_id: int, content: str, client, max_retries: int = 2):
                 if len(cleaned) >= 5:
                     return (msg_id, cleaned, "updated")
         except Exception:
-            time.sleep((attempt + 1) * 3)
+            await asyncio.sleep((attempt + 1) * 3)
 
     return (msg_id, None, "error")
 
 
-def phase2_llm_summarize(conn, dry_run: bool = False) -> dict:
-    """Phase 2: Summarize long messages (>2000 chars) via Gemini."""
-    print("\n[Phase 2] LLM summarize (long messages)...")
+def _write_summaries(conn, pairs: list[tuple[int, str]], reset_watermark: bool = True) -> None:
+    """Write (msg_id, summary) pairs by COPYing them into a temp table.
 
+    One COPY stream replaces per-row parameter parsing, then a single
+    UPDATE ... FROM joins the staged rows onto messages. With
+    reset_watermark, rewritten rows are queued for phase 1 again.
+    """
+    buf = io.StringIO()
+    csv.writer(buf).writerows(pairs)
+    buf.seek(0)
     with conn.cursor() as cur:
+        # Temp tables are never WAL-logged; rows are cleared after each flush
+        cur.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS phase2_fix "
+            "(id bigint PRIMARY KEY, content text) ON COMMIT DELETE ROWS"
+        )
+        cur.copy_expert("COPY phase2_fix (id, content) FROM STDIN WITH (FORMAT csv)", buf)
+        reset = ", cleaned_at = NULL" if reset_watermark else ""
         cur.execute(
-            "SELECT id, content FROM messages WHERE length(content) > 2000"
+            f"UPDATE messages m SET content = p.content{reset} "
+            "FROM phase2_fix p WHERE m.id = p.id"
         )
-        long_msgs = cur.fetchall()
+        cur.execute("TRUNCATE phase2_fix")
+
+
+async def _summarize_stream(conn, rotator, reset_watermark: bool = True) -> tuple[int, int]:
+    """Summarize every long message and write results back in batches.
+
+    PARALLEL_WORKERS workers drain a bounded queue fed from a server-side
+    cursor. At most PARALLEL_WORKERS requests are in flight, and besides
+    those only the queue and the cursor's current itersize batch hold
+    rows. Returns (updated, errors); the caller commits.
+    """
+    queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(maxsize=PARALLEL_WORKERS)
+    pending: list[tuple[int, str]] = []
+    updated = 0
+    errors = 0
 
-    print(f"  Messages > 2000 chars: {len(long_msgs)}")
+    async def worker() -> None:
+        nonlocal updated, errors
+        while (item := await queue.get()) is not None:
+            msg_id, content = item
+            try:
+                _, cleaned, status = await _summarize_single(
+                    msg_id, content, rotator.get_client()
+                )
+            except Exception:
+                cleaned, status = None, "error"
+            if status == "updated" and cleaned:
+                pending.append((msg_id, cleaned))
+                updated += 1
+                if len(pending) >= SUMMARY_UPDATE_BATCH:
+                    _write_summaries(conn, pending, reset_watermark)
+                    pending.clear()
+            else:
+                errors += 1
+
+    # A failing worker cancels the feed instead of leaving it blocked on put()
+    async with asyncio.TaskGroup() as group:
+        for _ in range(PARALLEL_WORKERS):
+            group.create_task(worker())
+        # Server-side cursor: rows arrive in itersize batches and put()
+        # waits whenever the workers fall behind
+        with conn.cursor(name="phase2_long_messages") as scan:
+            scan.itersize = LONG_MESSAGE_ITERSIZE
+            scan.execute(
+                f"SELECT id, content FROM messages WHERE length(content) > {LONG_MESSAGE_CHARS}"
+            )
+            for row in scan:
+                await queue.put(row)
+        for _ in range(PARALLEL_WORKERS):
+            await queue.put(None)
 
-    if not long_msgs:
+    if pending:
+        _write_summaries(conn, pending, reset_watermark)
+    return updated, errors
+
+
+def phase2_llm_summarize(conn, dry_run: bool = False) -> dict:
+    """Phase 2: Summarize long messages (>LONG_MESSAGE_CHARS chars) via Gemini."""
+    print("\n[Phase 2] LLM summarize (long messages)...")
+
+    with conn.cursor() as cur:
+        cur.execute(f"SELECT COUNT(*) FROM messages WHERE length(content) > {LONG_MESSAGE_CHARS}")
+        candidates = cur.fetchone()[0]
+
+    print(f"  Messages > {LONG_MESSAGE_CHARS} chars: {candidates}")
+
+    if not candidates:
         return {"candidates": 0, "updated": 0}
 
     if dry_run:
-        print(f"  [DRY-RUN] Would summarize {len(long_msgs)} messages")
-        return {"candidates": len(long_msgs), "updated": 0}
+        print(f"  [DRY-RUN] Would summarize {candidates} messages")
+        return {"candidates": candidates, "updated": 0}
 
     try:
         rotator = KeyRotator()
     except (ImportError, ValueError) as e:
         print(f"  Skipped: {e}")
-        return {"candidates": len(long_msgs), "updated": 0, "error": str(e)}
-
-    updated = 0
-    errors = 0
-
-    with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-        futures = {}
-        for msg_id, content in long_msgs:
-            client = rotator.get_client()
-            future = executor.submit(_summarize_single, msg_id, content, client)
-            futures[future] = msg_id
-
-        for future in as_completed(futures):
-            try:
-                msg_id, cleaned, status = future.result()
-                if status == "updated" and cleaned:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            "UPDATE messages SET content = %s WHERE id = %s",
-                            (cleaned, msg_id),
-                        )
-                    updated += 1
-                else:
-                    errors += 1
-            except Exception:
-                errors += 1
+        return {"candidates": candidates, "updated": 0, "error": str(e)}
 
+    reset_watermark = "messages" in _watermarked_tables(conn)
+    updated, errors = asyncio.run(_summarize_stream(conn, rotator, reset_watermark))
     conn.commit()
     print(f"  Updated: {updated}, Errors: {errors}")
     print(f"  Key usage: {rotator.get_stats()}")
-    return {"candidates": len(long_msgs), "updated": updated, "errors": errors}
+    return {"candidates": candidates, "updated": updated, "errors": errors}
+
+
+# Ranks each memory within its normalized-content group (trimmed, lowercased,
+# first 500 chars), best importance first
+_RANKED_MEMORIES_CTE = """
+    ranked AS (
+        SELECT uuid, ROW_NUMBER() OVER (
+            PARTITION BY md5(left(lower(btrim(COALESCE(content, ''), E' \\t\\n\\r\\f\\v')), 500))
+            ORDER BY COALESCE(importance, 0.5) DESC, uuid
+        ) AS rn
+        FROM memories
+    )
+"""
 
 
 def phase3_hash_dedup(conn, dry_run: bool = False) -> dict:
-    """Phase 3: Remove duplicate memories by SHA-256 content hash."""
+    """Phase 3: Remove duplicate memories by normalized content hash.
+
+    Grouping, ranking and deletion all run in PostgreSQL, so memory
+    content is never shipped to the client.
+    """
     print("\n[Phase 3] Hash dedup...")
 
     with conn.cursor() as cur:
-        cur.execute("SELECT uuid, content, importance FROM memories")
-        rows = cur.fetchall()
-
-    print(f"  Total memories: {len(rows)}")
-
-    hash_groups: dict[str, list] = {}
-    for uuid_val, content, importance in rows:
-        h = _content_hash(content or "")
-        hash_groups.setdefault(h, []).append((uuid_val, importance or 0.5))
-
-    to_delete = []
-    for h, entries in hash_groups.items():
-        if len(entries) > 1:
-            entries.sort(key=lambda x: x[1], reverse=True)
-            for uuid_val, _ in entries[1:]:
-                to_delete.append(uuid_val)
+        if dry_run:
+            cur.execute(
+                f"WITH {_RANKED_MEMORIES_CTE} "
+                "SELECT COUNT(*), COUNT(*) FILTER (WHERE rn > 1) FROM ranked"
+            )
+        else:
+            cur.execute(
+                f"WITH {_RANKED_MEMORIES_CTE}, "
+                "deleted AS ("
+                "  DELETE FROM memories WHERE uuid IN (SELECT uuid FROM ranked WHERE rn > 1) "
+                "  RETURNING 1"
+                ") "
+                "SELECT (SELECT COUNT(*) FROM ranked), (SELECT COUNT(*) FROM deleted)"
+            )
+        total, duplicates = cur.fetchone()
 
-    print(f"  Duplicates found: {len(to_delete)}")
+    print(f"  Total memories: {total}")
+    print(f"  Duplicates found: {duplicates}")
 
-    if to_delete:
+    if duplicates:
         if dry_run:
-            print(f"  [DRY-RUN] Would delete {len(to_delete)} duplicates")
+            print(f"  [DRY-RUN] Would delete {duplicates} duplicates")
         else:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "DELETE FROM memories WHERE uuid = ANY(%s)", (to_delete,)
-                )
-            conn.commit()
-            print(f"  Deleted: {len(to_delete)}")
+            print(f"  Deleted: {duplicates}")
+    if not dry_run:
+        conn.commit()
 
-    return {"total": len(rows), "duplicates": len(to_delete)}
+    return {"total": total, "duplicates": duplicates}
 
 
 def phase4_decay_cleanup(conn, dry_run: bool = False) -> dict:
@@ -348,24 +561,23 @@ def phase4_decay_cleanup(conn, dry_run: bool = False) -> dict:
         return {"deleted": count}
 
     with conn.cursor() as cur:
-        cur.execute(
-            f"DELETE FROM memories WHERE {condition} RETURNING uuid"
-        )
-        deleted = len(cur.fetchall())
+        cur.execute(f"DELETE FROM memories WHERE {condition}")
+        deleted = cur.rowcount
     conn.commit()
     print(f"  Deleted: {deleted}")
     return {"deleted": deleted}
 
 
 def phase5_archive_cleanup(conn, dry_run: bool = False) -> dict:
-    """Phase 5: Remove archived_messages older than 90 days."""
-    print("\n[Phase 5] Archive cleanup (>90 days)...")
+    """Phase 5: Remove archived_messages older than ARCHIVE_RETENTION_DAYS."""
+    print(f"\n[Phase 5] Archive cleanup (>{ARCHIVE_RETENTION_DAYS} days)...")
 
     try:
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT COUNT(*) FROM archived_messages "
-                "WHERE timestamp::timestamptz < NOW() - INTERVAL '90 days'"
+                "WHERE timestamp::timestamptz < NOW() - make_interval(days => %s)",
+                (ARCHIVE_RETENTION_DAYS,),
             )
             count = cur.fetchone()[0]
     except Exception:
@@ -385,23 +597,24 @@ def phase5_archive_cleanup(conn, dry_run: bool = False) -> dict:
     with conn.cursor() as cur:
         cur.execute(
             "DELETE FROM archived_messages "
-            "WHERE timestamp::timestamptz < NOW() - INTERVAL '90 days' "
-            "RETURNING id"
+            "WHERE timestamp::timestamptz < NOW() - make_interval(days => %s)",
+            (ARCHIVE_RETENTION_DAYS,),
         )
-        deleted = len(cur.fetchall())
+        deleted = cur.rowcount
     conn.commit()
     print(f"  Deleted: {deleted}")
     return {"deleted": deleted}
 
 
 def phase6_meta_cleanup(conn, dry_run: bool = False) -> dict:
-    """Phase 6: Remove old memory_access_patterns (>30 days)."""
-    print("\n[Phase 6] Meta cleanup (access patterns >30 days)...")
+    """Phase 6: Remove memory_access_patterns older than ACCESS_PATTERN_RETENTION_DAYS."""
+    print(f"\n[Phase 6] Meta cleanup (access patterns >{ACCESS_PATTERN_RETENTION_DAYS} days)...")
 
     with conn.cursor() as cur:
         cur.execute(
             "SELECT COUNT(*) FROM memory_access_patterns "
-            "WHERE created_at < NOW() - INTERVAL '30 days'"
+            "WHERE created_at < NOW() - make_interval(days => %s)",
+            (ACCESS_PATTERN_RETENTION_DAYS,),
         )
         count = cur.fetchone()[0]
 
@@ -417,102 +630,153 @@ def phase6_meta_cleanup(conn, dry_run: bool = False) -> dict:
     with conn.cursor() as cur:
         cur.execute(
             "DELETE FROM memory_access_patterns "
-            "WHERE created_at < NOW() - INTERVAL '30 days' "
-            "RETURNING id"
+            "WHERE created_at < NOW() - make_interval(days => %s)",
+            (ACCESS_PATTERN_RETENTION_DAYS,),
         )
-        deleted = len(cur.fetchall())
+        deleted = cur.rowcount
     conn.commit()
     print(f"  Deleted: {deleted}")
     return {"deleted": deleted}
 
 
-def phase7_kg_cleanup(conn, dry_run: bool = False) -> dict:
-    """Phase 7: Knowledge Graph cleanup - stale entities, weak/orphan relations."""
-    print("\n[Phase 7] Knowledge Graph cleanup...")
+_KG_STALE_CTE = """
+    stale AS (
+        SELECT entity_id FROM entities
+        WHERE mentions < 3 AND created_at < NOW() - make_interval(days => %s)
+    )
+"""
+
+# Relations to drop: touching a stale entity or weak. Each row is tagged
+# with the first reason that applies so only genuinely weak ones are counted.
+_KG_DOOMED_RELATION = """
+    r.source_id IN (SELECT entity_id FROM stale)
+    OR r.target_id IN (SELECT entity_id FROM stale)
+    OR r.weight < 0.1
+"""
+_KG_RELATION_KIND = """
+    CASE
+        WHEN r.source_id IN (SELECT entity_id FROM stale)
+            OR r.target_id IN (SELECT entity_id FROM stale) THEN 'stale'
+        ELSE 'weak'
+    END
+"""
+
+_RELATION_FKS = [
+    ("fk_relations_source", "source_id"),
+    ("fk_relations_target", "target_id"),
+]
+
 
-    result = {"entities_deleted": 0, "relations_weak": 0, "relations_orphan": 0}
+def install_constraints(conn) -> dict:
+    """Add ON DELETE CASCADE foreign keys from relations to entities.
+
+    With these in place deleting an entity drops its relations, so no
+    orphan sweep is needed. Orphans left from before are removed first
+    so the constraints validate; existing constraints are left as is.
+    """
+    print("\n[Constraints] relations -> entities foreign keys...")
 
     with conn.cursor() as cur:
-        # Stale entities: mentions < 3 AND older than 30 days
         cur.execute(
-            "SELECT COUNT(*) FROM entities "
-            "WHERE mentions < 3 AND created_at < NOW() - INTERVAL '30 days'"
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'relations'::regclass AND conname = ANY(%s)",
+            ([name for name, _ in _RELATION_FKS],),
         )
-        stale_entities = cur.fetchone()[0]
-        print(f"  Stale entities (mentions<3, >30d): {stale_entities}")
+        existing = {row[0] for row in cur.fetchall()}
+        missing = [(name, column) for name, column in _RELATION_FKS if name not in existing]
 
-        if stale_entities > 0:
-            if dry_run:
-                print(f"  [DRY-RUN] Would delete {stale_entities} entities")
-                result["entities_deleted"] = stale_entities
-            else:
-                # Delete relations referencing stale entities first
-                cur.execute(
-                    "DELETE FROM relations WHERE source_id IN ("
-                    "  SELECT entity_id FROM entities "
-                    "  WHERE mentions < 3 AND created_at < NOW() - INTERVAL '30 days'"
-                    ") OR target_id IN ("
-                    "  SELECT entity_id FROM entities "
-                    "  WHERE mentions < 3 AND created_at < NOW() - INTERVAL '30 days'"
-                    ")"
-                )
-                cur.execute(
-                    "DELETE FROM entities "
-                    "WHERE mentions < 3 AND created_at < NOW() - INTERVAL '30 days' "
-                    "RETURNING entity_id"
-                )
-                result["entities_deleted"] = len(cur.fetchall())
-
-        # Weak relations: weight < 0.1
-        cur.execute("SELECT COUNT(*) FROM relations WHERE weight < 0.1")
-        weak_count = cur.fetchone()[0]
-        print(f"  Weak relations (weight<0.1): {weak_count}")
+        if not missing:
+            print("  Already installed")
+            return {"installed": 0, "orphans_deleted": 0}
 
-        if weak_count > 0:
-            if dry_run:
-                print(f"  [DRY-RUN] Would delete {weak_count} weak relations")
-                result["relations_weak"] = weak_count
-            else:
-                cur.execute(
-                    "DELETE FROM relations WHERE weight < 0.1 RETURNING source_id"
-                )
-                result["relations_weak"] = len(cur.fetchall())
-
-        # Orphan relations
         cur.execute(
-            "SELECT COUNT(*) FROM relations r "
+            "DELETE FROM relations r "
             "WHERE NOT EXISTS (SELECT 1 FROM entities e WHERE e.entity_id = r.source_id) "
             "OR NOT EXISTS (SELECT 1 FROM entities e WHERE e.entity_id = r.target_id)"
         )
-        orphan_count = cur.fetchone()[0]
-        print(f"  Orphan relations: {orphan_count}")
+        orphans = cur.rowcount
+        for name, column in missing:
+            cur.execute(
+                f"ALTER TABLE relations ADD CONSTRAINT {name} "
+                f"FOREIGN KEY ({column}) REFERENCES entities(entity_id) ON DELETE CASCADE"
+            )
+    conn.commit()
 
-        if orphan_count > 0:
-            if dry_run:
-                print(f"  [DRY-RUN] Would delete {orphan_count} orphan relations")
-                result["relations_orphan"] = orphan_count
-            else:
-                cur.execute(
-                    "DELETE FROM relations r "
-                    "WHERE NOT EXISTS (SELECT 1 FROM entities e WHERE e.entity_id = r.source_id) "
-                    "OR NOT EXISTS (SELECT 1 FROM entities e WHERE e.entity_id = r.target_id) "
-                    "RETURNING source_id"
-                )
-                result["relations_orphan"] = len(cur.fetchall())
+    print(f"  Orphans deleted: {orphans}")
+    print(f"  Installed: {', '.join(name for name, _ in missing)}")
+    return {"installed": len(missing), "orphans_deleted": orphans}
 
-    if not dry_run:
+
+def phase7_kg_cleanup(conn, dry_run: bool = False) -> dict:
+    """Phase 7: Knowledge Graph cleanup - stale entities, weak relations.
+
+    Both passes run as one statement over a shared ``stale`` CTE and
+    return their counters in a single row. Relations that touch a stale
+    entity are removed with it but not counted as weak. Orphaned
+    relations are prevented by the foreign keys from ``install_constraints``.
+    """
+    print("\n[Phase 7] Knowledge Graph cleanup...")
+
+    with conn.cursor() as cur:
+        if dry_run:
+            cur.execute(
+                f"WITH {_KG_STALE_CTE}, "
+                f"rel AS (SELECT {_KG_RELATION_KIND} AS kind "
+                f"        FROM relations r WHERE {_KG_DOOMED_RELATION}) "
+                "SELECT (SELECT COUNT(*) FROM stale), "
+                "       (SELECT COUNT(*) FROM rel WHERE kind = 'weak')",
+                (STALE_ENTITY_DAYS,),
+            )
+        else:
+            cur.execute(
+                f"WITH {_KG_STALE_CTE}, "
+                f"rel AS (DELETE FROM relations r WHERE {_KG_DOOMED_RELATION} "
+                f"        RETURNING {_KG_RELATION_KIND} AS kind), "
+                "ent AS (DELETE FROM entities "
+                "        WHERE entity_id IN (SELECT entity_id FROM stale) RETURNING 1) "
+                "SELECT (SELECT COUNT(*) FROM ent), "
+                "       (SELECT COUNT(*) FROM rel WHERE kind = 'weak')",
+                (STALE_ENTITY_DAYS,),
+            )
+        entities, weak = cur.fetchone()
+
+    result = {"entities_deleted": entities, "relations_weak": weak}
+    print(f"  Stale entities (mentions<3, >{STALE_ENTITY_DAYS}d): {entities}")
+    print(f"  Weak relations (weight<0.1): {weak}")
+
+    if dry_run:
+        if entities or weak:
+            print(f"  [DRY-RUN] Would delete {entities} entities, {weak} weak relations")
+    else:
         conn.commit()
-        print(
-            f"  Deleted: {result['entities_deleted']} entities, "
-            f"{result['relations_weak']} weak relations, "
-            f"{result['relations_orphan']} orphan relations"
-        )
+        print(f"  Deleted: {entities} entities, {weak} weak relations")
 
     return result
 
 
+def _run_maintenance(conn, jobs: list[tuple[str, str, str]]) -> list[tuple[str, bool]]:
+    """Run (table, label, sql) maintenance jobs in order on one connection."""
+    done = []
+    with conn.cursor() as cur:
+        for table, label, sql in jobs:
+            try:
+                cur.execute(sql)
+                print(f"  {label} {table} ✓")
+                done.append((label, True))
+            except Exception as e:
+                print(f"  {label} {table} failed: {e}")
+                done.append((label, False))
+    return done
+
+
 def phase8_vacuum(dry_run: bool = False) -> dict:
-    """Phase 8: VACUUM ANALYZE (requires autocommit connection)."""
+    """Phase 8: VACUUM ANALYZE (requires autocommit connections).
+
+    pg_stat_user_tables decides the work per table: dead tuples get a
+    parallel VACUUM (ANALYZE), modifications alone get a plain ANALYZE,
+    and untouched tables are skipped. Tables are spread over up to
+    VACUUM_CONNECTIONS sessions so their I/O overlaps.
+    """
     print("\n[Phase 8] VACUUM ANALYZE...")
 
     if dry_run:
@@ -528,19 +792,58 @@ def phase8_vacuum(dry_run: bool = False) -> dict:
         "relations",
     ]
 
-    conn = _connect(autocommit=True)
+    conns = [_connect(autocommit=True)]
     try:
-        with conn.cursor() as cur:
-            for table in tables:
-                try:
-                    cur.execute(f"VACUUM ANALYZE {table}")
-                    print(f"  VACUUM ANALYZE {table} ✓")
-                except Exception as e:
-                    print(f"  VACUUM ANALYZE {table} failed: {e}")
+        with conns[0].cursor() as cur:
+            cur.execute(
+                "SELECT relname, n_mod_since_analyze, n_dead_tup "
+                "FROM pg_stat_user_tables WHERE relname = ANY(%s)",
+                (tables,),
+            )
+            stats = {name: (modified, dead) for name, modified, dead in cur.fetchall()}
+
+        jobs = []
+        skipped = 0
+        for table in tables:
+            if table not in stats:
+                print(f"  {table}: not found")
+                skipped += 1
+                continue
+            modified, dead = stats[table]
+            if dead:
+                jobs.append((
+                    table,
+                    "VACUUM ANALYZE",
+                    f"VACUUM (ANALYZE, PARALLEL {VACUUM_PARALLEL_WORKERS}, "
+                    f"INDEX_CLEANUP AUTO) {table}",
+                ))
+            elif modified:
+                jobs.append((table, "ANALYZE", f"ANALYZE {table}"))
+            else:
+                print(f"  {table}: unchanged, skipped")
+                skipped += 1
+
+        # VACUUM cannot run inside a transaction block, so every session
+        # must be autocommit
+        workers = min(len(jobs), VACUUM_CONNECTIONS)
+        conns.extend(_connect(autocommit=True) for _ in range(workers - 1))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = [
+                executor.submit(_run_maintenance, conn, jobs[i::workers])
+                for i, conn in enumerate(conns[:workers])
+            ]
+            done = [entry for future in futures for entry in future.result()]
     finally:
-        conn.close()
+        for conn in conns:
+            conn.close()
 
-    return {"status": "done", "tables": len(tables)}
+    return {
+        "status": "done",
+        "tables": len(tables),
+        "vacuumed": sum(1 for label, ok in done if ok and label == "VACUUM ANALYZE"),
+        "analyzed": sum(1 for label, ok in done if ok and label == "ANALYZE"),
+        "skipped": skipped,
+    }
 
 
 # ── Commands ─────────────────────────────────────────────────────────────────
@@ -579,17 +882,50 @@ def cmd_check() -> None:
     print("=" * 60)
 
 
-def cmd_full(dry_run: bool = False) -> None:
-    """Run all 8 GC phases."""
+def _gc_error(phase: str, exc: Exception) -> dict:
+    """Error record for the run summary; the traceback is kept only at DEBUG."""
+    tb = None
+    if logger.isEnabledFor(logging.DEBUG):
+        import traceback
+
+        tb = traceback.format_exc()
+    return {"phase": phase, "error": str(exc), "tb": tb}
+
+
+def cmd_migrate() -> None:
+    """Install the cleaned_at watermarks, then the GC indexes."""
+    print("=" * 60)
+    print("PG Memory GC Migration")
+    print("=" * 60)
+
+    conn = _connect()
+    try:
+        install_watermarks(conn)
+    finally:
+        conn.close()
+    install_gc_indexes()
+
+    print("=" * 60)
+
+
+def cmd_full(dry_run: bool = False, install_fks: bool = False) -> None:
+    """Run all 8 GC phases, optionally installing the KG foreign keys first."""
     print("=" * 60)
     mode_str = "[DRY-RUN] " if dry_run else ""
     print(f"{mode_str}PG Memory Garbage Collection")
     print("=" * 60)
 
-    conn = _connect()
     gc_errors: list[dict] = []
 
-    import traceback
+    conn = _connect()
+
+    if install_fks and not dry_run:
+        try:
+            install_constraints(conn)
+        except Exception as e:
+            conn.rollback()
+            gc_errors.append(_gc_error("Constraints", e))
+            print(f"  ERROR installing constraints: {e}")
 
     phases = [
         ("Phase 1", lambda: phase1_emoji_strip(conn, dry_run)),
@@ -606,7 +942,7 @@ def cmd_full(dry_run: bool = False) -> None:
         try:
             results[name] = fn()
         except Exception as e:
-            gc_errors.append({"phase": name, "error": str(e), "tb": traceback.format_exc()})
+            gc_errors.append(_gc_error(name, e))
             print(f"  ERROR in {name}: {e}")
 
     conn.close()
@@ -615,7 +951,7 @@ def cmd_full(dry_run: bool = False) -> None:
     try:
         results["Phase 8"] = phase8_vacuum(dry_run)
     except Exception as e:
-        gc_errors.append({"phase": "Phase 8", "error": str(e), "tb": traceback.format_exc()})
+        gc_errors.append(_gc_error("Phase 8", e))
 
     # Summary
     print("\n" + "=" * 60)
@@ -626,6 +962,8 @@ def cmd_full(dry_run: bool = False) -> None:
         print(f"\n  ERRORS: {len(gc_errors)}")
         for err in gc_errors:
             print(f"    {err['phase']}: {err['error']}")
+            if err["tb"]:
+                logger.debug(err["tb"])
     print("=" * 60)
 
 
@@ -639,23 +977,33 @@ def main(argv: Optional[list[str]] = None) -> None:
         epilog="""
 Examples:
   python scripts/pg_memory_gc.py check           # Status check
+  python scripts/pg_memory_gc.py migrate         # Add GC watermarks and indexes
   python scripts/pg_memory_gc.py full             # Full GC
   python scripts/pg_memory_gc.py full --dry-run   # Dry-run
+  python scripts/pg_memory_gc.py full --install-constraints  # Add KG FKs, then GC
 """,
     )
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     subparsers.add_parser("check", help="Show table row counts")
+    subparsers.add_parser("migrate", help="Add GC watermark columns and indexes")
 
     full_parser = subparsers.add_parser("full", help="Run all 8 GC phases")
     full_parser.add_argument("--dry-run", action="store_true", help="Preview without changes")
+    full_parser.add_argument(
+        "--install-constraints",
+        action="store_true",
+        help="Add ON DELETE CASCADE foreign keys from relations to entities",
+    )
 
     args = parser.parse_args(argv)
 
     if args.command == "check":
         cmd_check()
+    elif args.command == "migrate":
+        cmd_migrate()
     elif args.command == "full":
-        cmd_full(dry_run=args.dry_run)
+        cmd_full(dry_run=args.dry_run, install_fks=args.install_constraints)
     else:
         parser.print_help()
 
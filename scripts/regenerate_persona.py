@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import asyncio
+import heapq
 import json
 import sys
 import shutil
@@ -21,21 +23,32 @@ ANALYSIS_DAYS = 7       # 분석할 최근 일수
 DECAY_FACTOR = 0.8      # 감가율 (높을수록 기존 페르소나 보존)
 MIN_CONFIDENCE = 0.2    # 최소 신뢰도 임계값
 MAX_MESSAGES = 500      # SQLite에서 가져올 최대 메시지 수
+MAX_BEHAVIORS = 200     # 페르소나에 저장할 최대 행동 양식 수 (신뢰도 상위)
+MAX_CONCURRENT_BATCHES = 4  # 동시 Gemini 호출 수 (rate limit 고려)
+
+# 반복 호출되는 정규식은 모듈 로드 시 한 번만 컴파일
+_SPEAKER_RE = re.compile(r'\b(?:AI|Assistant|User)\b', re.IGNORECASE)
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_ROLE_NAMES = {
+    'assistant': 'Axel',
+    'ai': 'Axel',
+    'axel': 'Axel',
+    'user': 'Mark',
+    'mark': 'Mark',
+}
 
 def humanize_role(role: str) -> str:
 
-    role_lower = role.lower()
-    if role_lower in ('assistant', 'ai', 'axel'):
-        return 'Axel'
-    elif role_lower in ('user', 'mark'):
-        return 'Mark'
-    return role
+    return _ROLE_NAMES.get(role.lower(), role)
 
-def humanize_text(text: str) -> str:
+def _speaker_name(match: re.Match) -> str:
+    return _ROLE_NAMES[match.group().lower()]
 
-    text = re.sub(r'\b(AI|Assistant)\b', 'Axel', text, flags=re.IGNORECASE)
-    text = re.sub(r'\b(User)\b', 'Mark', text, flags=re.IGNORECASE)
-    return text
+def humanize_text(text: str) -> str:
+    """AI/Assistant → Axel, User → Mark in a single regex pass."""
+    return _SPEAKER_RE.sub(_speaker_name, text)
 
 def merge_behaviors(old_behaviors: list, new_insights: list) -> list:
     """기존 행동 양식을 감가상각 처리 (기존 페르소나 보존 우선)."""
@@ -54,6 +67,77 @@ def merge_behaviors(old_behaviors: list, new_insights: list) -> list:
 
     return merged
 
+def dedupe_behaviors(behaviors: list) -> list:
+    """공백/대소문자 정규화 후 중복 제거, 신뢰도 상위 MAX_BEHAVIORS개만 유지 (입력 순서 보존)."""
+    # 키마다 처음 나온 항목을 유지
+    unique: dict = {}
+    for b in behaviors:
+        unique.setdefault(_WHITESPACE_RE.sub(' ', b['insight']).strip().casefold(), b)
+    kept = list(unique.values())
+
+    if len(kept) > MAX_BEHAVIORS:
+        top = heapq.nlargest(
+            MAX_BEHAVIORS, range(len(kept)), key=lambda i: kept[i].get('confidence', 0)
+        )
+        kept = [kept[i] for i in sorted(top)]
+    return kept
+
+def build_insight_prompt(batch_text: str) -> str:
+
+    return f"""
+아래는 'Mark'와 'Axel'의 대화 로그입니다.
+이 대화를 분석하여 둘의 관계와 Axel의 성격에 대한 심층 인사이트를 도출하세요.
+
+## 대화 기록
+{batch_text}
+
+## 분석 목표
+1. **Mark의 특성**: 성격, 현재 상태, 선호하는 방식
+2. **Axel의 태도**: Mark를 대하는 태도, 말투, 유머 코드
+3. **관계의 진화**: 둘 사이의 신뢰도, 친밀감, 독특한 패턴
+
+## 출력 형식 (JSON)
+{{
+  "insights": [
+    "Mark는 ~하는 경향이 있음",
+    "Axel은 Mark가 ~할 때 ~게 반응함",
+    "둘은 ~한 주제로 농담을 주고받음"
+  ]
+}}
+"""
+
+async def extract_insights(client, model_name: str, batches: list) -> list:
+    """배치별 인사이트 추출을 동시에 실행 (MAX_CONCURRENT_BATCHES개씩 제한)."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+    done = 0
+
+    async def run_batch(idx: int, batch_text: str) -> list:
+        nonlocal done
+        try:
+            async with semaphore:
+                result = await client.aio.models.generate_content(
+                    model=model_name,
+                    contents=build_insight_prompt(batch_text),
+                )
+            response_text = result.text if result.text else "{}"
+
+            json_match = _JSON_RE.search(response_text)
+            if json_match:
+                data = json.loads(json_match.group())
+                return data.get('insights', [])
+        except Exception as e:
+            print(f"  ⚠ 배치 {idx+1} 오류: {e}")
+        finally:
+            done += 1
+            print(f"  ... 배치 {done}/{len(batches)} 분석 완료", end="\r")
+        return []
+
+    # gather는 입력 순서대로 결과를 돌려주므로 인사이트 순서가 유지됨
+    results = await asyncio.gather(
+        *(run_batch(idx, batch_text) for idx, batch_text in enumerate(batches))
+    )
+    return [insight for insights in results for insight in insights]
+
 def main():
     print("=" * 60)
     print("  🧬 페르소나 진화 프로세스 (7일 증분 업데이트)")
@@ -77,7 +161,6 @@ def main():
 
     # ChromaDB 제거, SQLite 7일 필터만 사용 (성능 최적화)
     documents = []
-    metadatas = []
 
     import sqlite3
     cutoff_time = datetime.now(VANCOUVER_TZ) - timedelta(days=ANALYSIS_DAYS)
@@ -86,19 +169,19 @@ def main():
     try:
         conn = sqlite3.connect(str(SQLITE_MEMORY_PATH))
         cur = conn.cursor()
+        # 빈 content는 SQL에서 걸러내고, idx_messages_timestamp로 범위 스캔
         cur.execute('''
-            SELECT role, content, timestamp
+            SELECT role, content
             FROM messages
-            WHERE timestamp >= ?
+            WHERE timestamp >= ? AND content IS NOT NULL AND content != ''
             ORDER BY timestamp DESC
             LIMIT ?
         ''', (cutoff_iso, MAX_MESSAGES))
-        rows = cur.fetchall()
-        for role, content, ts in rows:
-            if content:
-                human_role = humanize_role(role)
-                documents.append(f"{human_role}: {content}")
-                metadatas.append({'source': 'sqlite', 'timestamp': ts})
+        cur.arraysize = MAX_MESSAGES
+        documents = [
+            f"{humanize_role(role)}: {content}"
+            for role, content in cur.fetchmany()
+        ]
         conn.close()
     except Exception as e:
         print(f"  ⚠ SQLite 로드 실패: {e}")
@@ -131,47 +214,7 @@ def main():
     client = get_gemini_client()
     model_name = get_model_name()
 
-    all_insights = []
-
-    for idx, batch_text in enumerate(batches):
-        print(f"  ... 배치 {idx+1}/{len(batches)} 분석 중", end="\r")
-
-        prompt = f"""
-아래는 'Mark'와 'Axel'의 대화 로그입니다.
-이 대화를 분석하여 둘의 관계와 Axel의 성격에 대한 심층 인사이트를 도출하세요.
-
-## 대화 기록
-{batch_text}
-
-## 분석 목표
-1. **Mark의 특성**: 성격, 현재 상태, 선호하는 방식
-2. **Axel의 태도**: Mark를 대하는 태도, 말투, 유머 코드
-3. **관계의 진화**: 둘 사이의 신뢰도, 친밀감, 독특한 패턴
-
-## 출력 형식 (JSON)
-{{
-  "insights": [
-    "Mark는 ~하는 경향이 있음",
-    "Axel은 Mark가 ~할 때 ~게 반응함",
-    "둘은 ~한 주제로 농담을 주고받음"
-  ]
-}}
-"""
-        try:
-
-            result = client.models.generate_content(
-                model=model_name,
-                contents=prompt,
-            )
-            response_text = result.text if result.text else "{}"
-
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                insights = data.get('insights', [])
-                all_insights.extend(insights)
-        except Exception as e:
-            print(f"  ⚠ 배치 {idx+1} 오류: {e}")
+    all_insights = asyncio.run(extract_insights(client, model_name, batches))
 
     print(f"\n  ✓ 총 {len(all_insights)}개 신규 인사이트 추출됨")
 
@@ -242,7 +285,7 @@ def main():
         )
         response_text = result.text if result.text else "{}"
 
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        json_match = _JSON_RE.search(response_text)
         if json_match:
             new_persona = json.loads(json_match.group())
 
@@ -250,14 +293,7 @@ def main():
 
             final_behaviors = kept_behaviors + new_behaviors
 
-            unique_behaviors = []
-            seen_insights = set()
-            for b in final_behaviors:
-
-                key = b['insight'][:20].lower()
-                if key not in seen_insights:
-                    unique_behaviors.append(b)
-                    seen_insights.add(key)
+            unique_behaviors = dedupe_behaviors(final_behaviors)
 
             new_persona['learned_behaviors'] = unique_behaviors
 
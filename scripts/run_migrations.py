@@ -2,8 +2,10 @@
 
 import argparse
 import json
+import os
 import sqlite3
 import sys
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -14,7 +16,36 @@ from backend.config import SQLITE_MEMORY_PATH
 DB_PATH = SQLITE_MEMORY_PATH
 MIGRATIONS_DIR = PROJECT_ROOT / "scripts" / "migrations"
 
+# Stringified once; every command prints, connects to and stats these
+_DB_PATH_STR = str(DB_PATH)
+_MIGRATIONS_DIR_STR = str(MIGRATIONS_DIR)
+
+def _db_exists() -> bool:
+    return os.path.exists(_DB_PATH_STR)
+
+@contextmanager
+def _conn():
+    """Open the migration database with the runner's PRAGMAs; close on exit.
+
+    autocommit=True: executescript() must not implicitly COMMIT the apply
+    transaction, so every pending file shares a single fsync.
+    """
+    conn = sqlite3.connect(_DB_PATH_STR, autocommit=True)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        yield conn
+    finally:
+        conn.close()
+
 def ensure_migrations_table(conn: sqlite3.Connection) -> None:
+    """Create _migrations on first use; a read-only lookup otherwise."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='_migrations'"
+    ).fetchone()
+    if exists:
+        return
 
     conn.execute("""
         CREATE TABLE IF NOT EXISTS _migrations (
@@ -32,45 +63,80 @@ def get_applied_migrations(conn: sqlite3.Connection) -> list[dict]:
     )
     return [{"filename": row[0], "applied_at": row[1]} for row in cursor.fetchall()]
 
-def get_pending_migrations() -> list[Path]:
+def get_applied_filenames(conn: sqlite3.Connection) -> set[str]:
+    """Applied migration names only, for pending-file diffs."""
+    return {row[0] for row in conn.execute("SELECT filename FROM _migrations")}
+
+def get_last_applied(conn: sqlite3.Connection) -> dict | None:
 
-    if not MIGRATIONS_DIR.exists():
+    row = conn.execute(
+        "SELECT filename, applied_at FROM _migrations "
+        "ORDER BY applied_at DESC, id DESC LIMIT 1"
+    ).fetchone()
+    return {"filename": row[0], "applied_at": row[1]} if row else None
+
+def get_pending_migrations() -> list[str]:
+    """Sorted .sql file names in MIGRATIONS_DIR (names, not Paths)."""
+    try:
+        with os.scandir(_MIGRATIONS_DIR_STR) as it:
+            names = [e.name for e in it if e.name.endswith(".sql") and e.is_file()]
+    except FileNotFoundError:
         return []
-    return sorted(MIGRATIONS_DIR.glob("*.sql"))
+    names.sort()
+    return names
+
+def iter_sql_chunks(path: str):
+    """Yield a migration file as complete SQL statements, line by line.
+
+    sqlite3.complete_statement() decides where a statement ends (it
+    understands string literals and trigger BEGIN...END bodies), so only
+    the statement being read is held in memory, not the whole file. A
+    chunk can hold several statements that end on the same line.
+    """
+    buf: list[str] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            buf.append(line)
+            if ";" not in line:
+                continue
+            chunk = "".join(buf)
+            if sqlite3.complete_statement(chunk):
+                yield chunk
+                buf = []
+    tail = "".join(buf)
+    if tail.strip():
+        yield tail
 
 def get_migration_status(conn: sqlite3.Connection) -> dict:
 
-    applied = get_applied_migrations(conn)
-    applied_names = {m["filename"] for m in applied}
+    applied_names = get_applied_filenames(conn)
 
     all_files = get_pending_migrations()
-    pending = [f for f in all_files if f.name not in applied_names]
+    pending = [name for name in all_files if name not in applied_names]
 
     return {
-        "db_path": str(DB_PATH),
-        "migrations_dir": str(MIGRATIONS_DIR),
+        "db_path": _DB_PATH_STR,
+        "migrations_dir": _MIGRATIONS_DIR_STR,
         "total_files": len(all_files),
-        "applied": len(applied),
+        "applied": len(applied_names),
         "pending": len(pending),
-        "pending_files": [f.name for f in pending],
-        "last_applied": applied[-1] if applied else None,
+        "pending_files": pending,
+        "last_applied": get_last_applied(conn) if applied_names else None,
     }
 
-def cmd_status(output_json: bool = False) -> int:
+def cmd_status(output_json: bool = False, conn: sqlite3.Connection | None = None) -> int:
 
-    if not DB_PATH.exists():
+    if not _db_exists():
         if output_json:
-            print(json.dumps({"error": "Database not found", "path": str(DB_PATH)}))
+            print(json.dumps({"error": "Database not found", "path": _DB_PATH_STR}))
         else:
-            print(f"Database not found: {DB_PATH}")
+            print(f"Database not found: {_DB_PATH_STR}")
             print("Database will be created on first app startup.")
         return 1
 
-    conn = sqlite3.connect(DB_PATH)
-    ensure_migrations_table(conn)
-
-    status = get_migration_status(conn)
-    conn.close()
+    with nullcontext(conn) if conn else _conn() as conn:
+        ensure_migrations_table(conn)
+        status = get_migration_status(conn)
 
     if output_json:
         print(json.dumps(status, indent=2, ensure_ascii=False))
@@ -97,27 +163,24 @@ def cmd_status(output_json: bool = False) -> int:
 
     return 0
 
-def cmd_list(output_json: bool = False) -> int:
+def cmd_list(output_json: bool = False, conn: sqlite3.Connection | None = None) -> int:
 
-    if not DB_PATH.exists():
+    if not _db_exists():
         if output_json:
             print(json.dumps({"error": "Database not found"}))
         else:
-            print(f"Database not found: {DB_PATH}")
+            print(f"Database not found: {_DB_PATH_STR}")
         return 1
 
-    conn = sqlite3.connect(DB_PATH)
-    ensure_migrations_table(conn)
-
-    applied = get_applied_migrations(conn)
+    with nullcontext(conn) if conn else _conn() as conn:
+        ensure_migrations_table(conn)
+        applied = get_applied_migrations(conn)
     applied_names = {m["filename"] for m in applied}
     all_files = get_pending_migrations()
 
-    conn.close()
-
     result = {
         "applied": applied,
-        "pending": [f.name for f in all_files if f.name not in applied_names],
+        "pending": [name for name in all_files if name not in applied_names],
     }
 
     if output_json:
@@ -145,22 +208,31 @@ def cmd_list(output_json: bool = False) -> int:
 
     return 0
 
-def cmd_apply(dry_run: bool = False, output_json: bool = False) -> int:
+def cmd_apply(
+    dry_run: bool = False,
+    output_json: bool = False,
+    fresh: bool = False,
+    conn: sqlite3.Connection | None = None,
+) -> int:
 
-    if not DB_PATH.exists():
+    if not _db_exists():
         msg = "Database not found. Will be created on first app startup."
         if output_json:
-            print(json.dumps({"error": msg, "path": str(DB_PATH)}))
+            print(json.dumps({"error": msg, "path": _DB_PATH_STR}))
         else:
             print(msg)
         return 1
 
-    conn = sqlite3.connect(DB_PATH)
+    with nullcontext(conn) if conn else _conn() as conn:
+        return _apply_pending(conn, dry_run, output_json, fresh)
+
+def _apply_pending(conn: sqlite3.Connection, dry_run: bool, output_json: bool, fresh: bool) -> int:
+
     ensure_migrations_table(conn)
 
-    applied_names = {m["filename"] for m in get_applied_migrations(conn)}
+    applied_names = get_applied_filenames(conn)
     all_files = get_pending_migrations()
-    pending = [f for f in all_files if f.name not in applied_names]
+    pending = [name for name in all_files if name not in applied_names]
 
     result = {
         "dry_run": dry_run,
@@ -175,7 +247,6 @@ def cmd_apply(dry_run: bool = False, output_json: bool = False) -> int:
             print(json.dumps(result, indent=2))
         else:
             print("No pending migrations.")
-        conn.close()
         return 0
 
     prefix = "[DRY RUN] " if dry_run else ""
@@ -184,35 +255,56 @@ def cmd_apply(dry_run: bool = False, output_json: bool = False) -> int:
         print(f"\n{prefix}Applying {len(pending)} migration(s)...")
         print("=" * 50)
 
-    for sql_file in pending:
+    if fresh and not dry_run:
+        # No rollback journal or fsync: a crash or failed file can leave the
+        # database corrupt, so only for databases that can be recreated
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA foreign_keys=OFF")
+
+    if not dry_run:
+        conn.execute("BEGIN IMMEDIATE")
+
+    for name in pending:
         if not output_json:
-            print(f"  {sql_file.name}...", end=" ")
+            print(f"  {name}...", end=" ")
 
         if dry_run:
-            result["applied"].append(sql_file.name)
+            result["applied"].append(name)
             if not output_json:
                 print("(would apply)")
             continue
 
         try:
-            sql_content = sql_file.read_text(encoding="utf-8")
-            conn.executescript(sql_content)
-            conn.execute(
-                "INSERT INTO _migrations (filename) VALUES (?)",
-                (sql_file.name,)
-            )
-            conn.commit()
-            result["applied"].append(sql_file.name)
+            for chunk in iter_sql_chunks(os.path.join(_MIGRATIONS_DIR_STR, name)):
+                conn.executescript(chunk)
+            result["applied"].append(name)
             if not output_json:
                 print("OK")
         except Exception as e:
-            conn.rollback()
-            result["failed"] = {"file": sql_file.name, "error": str(e)}
+            result["failed"] = {"file": name, "error": str(e)}
             if not output_json:
                 print(f"FAILED: {e}")
             break
 
-    conn.close()
+    if not dry_run:
+        if result["failed"]:
+            # One transaction: earlier files in this run are undone too
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            result["applied"] = []
+        else:
+            # Bookkeeping for the whole run, inside the same transaction
+            conn.executemany(
+                "INSERT INTO _migrations (filename) VALUES (?)",
+                [(name,) for name in result["applied"]],
+            )
+            conn.execute("COMMIT")
+
+    if fresh and not dry_run:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
 
     if output_json:
         print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -220,7 +312,7 @@ def cmd_apply(dry_run: bool = False, output_json: bool = False) -> int:
         print("=" * 50)
         applied_count = len(result["applied"])
         if result["failed"]:
-            print(f"  Applied: {applied_count}/{len(pending)} (stopped on error)")
+            print(f"  Applied: {applied_count}/{len(pending)} (rolled back on error)")
         else:
             print(f"  {prefix}Applied: {applied_count}/{len(pending)}")
 
@@ -238,6 +330,7 @@ Examples:
   python scripts/run_migrations.py list         # 마이그레이션 목록
   python scripts/run_migrations.py apply        # 마이그레이션 적용
   python scripts/run_migrations.py apply --dry-run  # 미리보기
+  python scripts/run_migrations.py apply --fresh    # 새 DB 고속 적용 (저널/fsync 끔)
   python scripts/run_migrations.py status --json    # JSON 출력
         """
     )
@@ -253,17 +346,27 @@ Examples:
     apply_parser = subparsers.add_parser("apply", help="마이그레이션 적용")
     apply_parser.add_argument("--dry-run", action="store_true", help="미리보기 (실제 적용 안 함)")
     apply_parser.add_argument("--json", action="store_true", help="JSON 출력")
+    apply_parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="새로 만든 DB 전용: 적용 중 journal/fsync/외래키 검사를 끔 "
+             "(실패·중단 시 DB 손상 가능, 재생성 가능한 DB에만 사용)",
+    )
 
     args = parser.parse_args()
 
-    if args.command is None:
-        sys.exit(cmd_status())
-    elif args.command == "status":
-        sys.exit(cmd_status(output_json=args.json))
-    elif args.command == "list":
-        sys.exit(cmd_list(output_json=args.json))
-    elif args.command == "apply":
-        sys.exit(cmd_apply(dry_run=args.dry_run, output_json=args.json))
+    # One connection for the whole invocation; commands open their own
+    # only when called directly. A missing database is reported by the
+    # command itself, so don't create it here.
+    with _conn() if _db_exists() else nullcontext() as conn:
+        if args.command is None:
+            sys.exit(cmd_status(conn=conn))
+        elif args.command == "status":
+            sys.exit(cmd_status(output_json=args.json, conn=conn))
+        elif args.command == "list":
+            sys.exit(cmd_list(output_json=args.json, conn=conn))
+        elif args.command == "apply":
+            sys.exit(cmd_apply(dry_run=args.dry_run, output_json=args.json, fresh=args.fresh, conn=conn))
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ from backend.core.telemetry.interaction_log import (
     log_interaction,
     query_interactions,
 )
+from backend.memory.recent.interaction_logger import InteractionLogger
 
 
 class TestInteractionLog:
@@ -52,3 +53,15 @@ class TestInteractionLog:
         )
         row_id = log_interaction(initialized_db, log)
         assert row_id > 0
+
+    def test_query_sees_buffered_logger_rows(self, initialized_db):
+        logger = InteractionLogger(initialized_db)
+        try:
+            logger.log_interaction(
+                routing_decision={"effective_model": "gemini", "tier": "standard"},
+                conversation_id="session-C",
+            )
+            results = query_interactions(initialized_db, session_id="session-C")
+        finally:
+            logger.close()
+        assert len(results) == 1
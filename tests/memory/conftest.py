@@ -1,22 +1,82 @@
 """Pytest fixtures for memory module tests."""
 
+import sqlite3
+
 import pytest
 from unittest.mock import MagicMock
 from typing import Dict, List, Any
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.recent.connection import SQLiteConnectionManager
 from backend.memory.recent.interaction_logger import InteractionLogger
 from backend.memory.recent.repository import SessionRepository
 from backend.memory.recent.schema import SchemaManager
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 # ── Shared fixtures for recent/ module tests ────────────────────────────────
 
 
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory):
+    """In-memory copy of a fully migrated recent/ database, built once per session."""
+    mgr = SQLiteConnectionManager(db_path=tmp_path_factory.mktemp("schema") / "template.db")
+    SchemaManager(mgr).initialize()
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    with mgr.get_connection() as conn:
+        conn.backup(template)
+    mgr.close()
+    yield template
+    template.close()
+
+
+def _restore_schema(template, path):
+    target = sqlite3.connect(path)
+    try:
+        template.backup(target)
+    finally:
+        target.close()
+    return path
+
+
+@pytest.fixture
+def schema_db(tmp_path, schema_template):
+    """Path to a fresh DB file restored from the schema template.
+
+    ``SchemaManager.initialize()`` on it is a version check, not DDL.
+    """
+    return _restore_schema(schema_template, tmp_path / "test.db")
+
+
+_CLEAR_RECENT_TABLES_SQL = """
+DELETE FROM messages;
+DELETE FROM sessions;
+DELETE FROM interaction_logs;
+DELETE FROM archived_messages;
+DELETE FROM user_behavior_metrics;
+DELETE FROM access_patterns;
+DELETE FROM sqlite_sequence;
+"""
+
+
+@pytest.fixture(scope="module")
+def module_conn_mgr(tmp_path_factory, schema_template):
+    """Initialized SQLiteConnectionManager shared by every test in a module."""
+    path = _restore_schema(schema_template, tmp_path_factory.mktemp("recent") / "test.db")
+    mgr = SQLiteConnectionManager(db_path=path)
+    SchemaManager(mgr).initialize()
+    yield mgr
+    mgr.close()
+
+
+@pytest.fixture
+def clean_conn_mgr(module_conn_mgr):
+    """The module's shared manager with every recent/ table emptied."""
+    with module_conn_mgr.get_connection() as conn:
+        conn.executescript(_CLEAR_RECENT_TABLES_SQL)
+    return module_conn_mgr
+
+
 @pytest.fixture
 def connection_manager(tmp_path):
     """Fresh SQLiteConnectionManager with a temp DB file."""
@@ -41,7 +101,9 @@ def session_repository(initialized_db):
 @pytest.fixture
 def interaction_logger(initialized_db):
     """InteractionLogger backed by an initialized temp DB."""
-    return InteractionLogger(initialized_db)
+    logger = InteractionLogger(initialized_db)
+    yield logger
+    logger.close()
 
 
 @pytest.fixture
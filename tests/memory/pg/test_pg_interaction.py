@@ -154,3 +154,22 @@ class TestGetRecentLogs:
         logger._conn.execute_dict.side_effect = Exception("db error")
         result = logger.get_recent_logs()
         assert result == []
+
+
+# ============================================================================
+# get_interaction_detail()
+# ============================================================================
+
+class TestGetInteractionDetail:
+
+    def test_returns_row(self, logger):
+        logger._conn.execute_dict.return_value = [{"id": 7, "tool_calls": []}]
+        assert logger.get_interaction_detail(7) == {"id": 7, "tool_calls": []}
+
+    def test_missing_returns_none(self, logger):
+        logger._conn.execute_dict.return_value = []
+        assert logger.get_interaction_detail(7) is None
+
+    def test_error_returns_none(self, logger):
+        logger._conn.execute_dict.side_effect = Exception("db error")
+        assert logger.get_interaction_detail(7) is None
@@ -4,6 +4,7 @@ Covers:
 - add() generates UUID and inserts
 - get_all() with various include options
 - get_by_id() found and not found
+- get_contents() batch lookup
 - query_by_embedding() cosine similarity search
 - update_metadata() with various fields
 - delete() with and without doc_ids
@@ -161,6 +162,27 @@ class TestGetById:
         assert result is None
 
 
+class TestGetContents:
+
+    def test_maps_uuid_to_content(self, repo):
+        repo._conn.execute_dict.return_value = [
+            {"uuid": "a", "content": "first"},
+            {"uuid": "b", "content": "second"},
+        ]
+        result = repo.get_contents(["a", "b", "c"])
+        assert result == {"a": "first", "b": "second"}
+        assert repo._conn.execute_dict.call_count == 1
+        assert "ANY(%s)" in repo._conn.execute_dict.call_args[0][0]
+
+    def test_empty_ids_skip_query(self, repo):
+        assert repo.get_contents([]) == {}
+        repo._conn.execute_dict.assert_not_called()
+
+    def test_query_error_returns_empty(self, repo):
+        repo._conn.execute_dict.side_effect = RuntimeError("connection lost")
+        assert repo.get_contents(["a"]) == {}
+
+
 # ============================================================================
 # query_by_embedding()
 # ============================================================================
@@ -2,16 +2,14 @@
 
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, call
-from zoneinfo import ZoneInfo
 
 import pytest
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.config import MemoryConfig
 from backend.memory.permanent.consolidator import MemoryConsolidator
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 def _iso_hours_ago(hours: float) -> str:
     dt = datetime.now(VANCOUVER_TZ) - timedelta(hours=hours)
@@ -136,3 +134,41 @@ class TestEmptyBatchNoError:
         assert report["preserved"] == 0
         assert report["checked"] == 0
         repo.delete.assert_not_called()
+
+
+class TestSingleMetadataBatch:
+
+    def test_preserve_and_surviving_in_one_call(self):
+        """Preservation flags and surviving importance share one batch call."""
+        old_time = _iso_hours_ago(500)
+
+        memories_data = {
+            "ids": ["keep-1", "surv-1"],
+            "metadatas": [
+                {
+                    "importance": 0.9,
+                    "created_at": old_time,
+                    "access_count": 1,
+                    "repetitions": MemoryConfig.PRESERVE_REPETITIONS,
+                    "type": "fact",
+                },
+                {
+                    "importance": 0.7,
+                    "created_at": old_time,
+                    "access_count": 2,
+                    "repetitions": 2,
+                    "type": "fact",
+                },
+            ],
+        }
+
+        consolidator, repo = _make_consolidator(memories_data)
+        report = consolidator.consolidate()
+
+        repo.batch_update_metadata.assert_called_once()
+        ids, metadatas = repo.batch_update_metadata.call_args[0]
+        by_id = dict(zip(ids, metadatas))
+        assert by_id["keep-1"]["preserved"] is True
+        assert isinstance(by_id["surv-1"]["importance"], float)
+        assert report["preserved"] == 1
+        assert report["surviving_updated"] == 1
@@ -1,14 +1,12 @@
 """W2-2: Verify circadian stability integration in decay calculator."""
 
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 class TestCircadianDecay:
     """Verify circadian stability affects decay calculation."""
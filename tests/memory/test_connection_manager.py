@@ -43,6 +43,32 @@ class TestPragmaSettings:
             assert timeout == 5000
         mgr.close()
 
+    def test_synchronous_normal(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        with mgr.get_connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        mgr.close()
+
+    def test_cache_size_set(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        with mgr.get_connection() as conn:
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        mgr.close()
+
+    def test_temp_store_memory(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        with mgr.get_connection() as conn:
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        mgr.close()
+
+    def test_mmap_size_set(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        with mgr.get_connection() as conn:
+            row = conn.execute("PRAGMA mmap_size").fetchone()
+            # Builds without mmap report nothing; otherwise the limit sticks
+            assert row is None or row[0] == 268435456
+        mgr.close()
+
 
 # ── Cycle 1.3: Thread safety ────────────────────────────────────────────────
 
@@ -90,6 +116,79 @@ class TestThreadSafety:
             assert count == 4
         mgr.close()
 
+    def test_threads_get_distinct_connections(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        barrier = threading.Barrier(2)
+        conns: list[sqlite3.Connection] = []
+
+        def worker():
+            with mgr.get_connection() as conn:
+                conns.append(conn)
+                barrier.wait()  # keep both threads alive while connected
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(conns) == 2
+        assert conns[0] is not conns[1]
+        mgr.close()
+
+    def test_close_closes_other_threads_connections(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        opened = threading.Event()
+        closed = threading.Event()
+        conns: list[sqlite3.Connection] = []
+
+        def worker():
+            with mgr.get_connection() as conn:
+                conns.append(conn)
+            opened.set()
+            closed.wait(timeout=5)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        assert opened.wait(timeout=5)
+        mgr.close()
+        closed.set()
+        t.join()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conns[0].execute("SELECT 1")
+
+    def test_thread_reopens_after_close(self, tmp_path):
+        mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+        opened = threading.Event()
+        closed = threading.Event()
+        conns: list[sqlite3.Connection] = []
+        errors: list[Exception] = []
+
+        def worker():
+            try:
+                with mgr.get_connection() as conn:
+                    conns.append(conn)
+                opened.set()
+                closed.wait(timeout=5)
+                with mgr.get_connection() as conn:
+                    conns.append(conn)
+                    assert conn.execute("SELECT 1").fetchone()[0] == 1
+            except Exception as e:
+                errors.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        assert opened.wait(timeout=5)
+        mgr.close()
+        closed.set()
+        t.join()
+
+        assert errors == []
+        assert len(conns) == 2
+        assert conns[0] is not conns[1]
+        mgr.close()
+
 
 # ── Cycle 1.4: close() + Context Manager ────────────────────────────────────
 
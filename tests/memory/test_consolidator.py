@@ -4,15 +4,13 @@ import sys
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 sys.path.insert(0, "/home/northprot/projects/axnmihn")
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.consolidator import MemoryConsolidator
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 def get_past_time(days_ago: float) -> str:
     """Helper to create ISO timestamp from days ago."""
@@ -375,6 +375,19 @@ class TestDiskPersistence:
         assert msgs[0].content == "hello"
         assert msgs[1].role == "Axel"
 
+    def test_save_without_orjson_roundtrip(self, wm, tmp_path):
+        path = str(tmp_path / "wm.json")
+        with patch("backend.memory.current.now_vancouver", return_value=FROZEN_NOW):
+            wm.add("user", "안녕")
+        with patch("backend.memory.current.orjson", None):
+            assert wm.save_to_disk(path) is True
+
+        with open(path, 'r', encoding='utf-8') as f:
+            assert "안녕" in f.read()
+        wm2 = WorkingMemory()
+        assert wm2.load_from_disk(path) is True
+        assert wm2.messages[0].content == "안녕"
+
     def test_save_creates_parent_dirs(self, tmp_path):
         path = str(tmp_path / "sub" / "dir" / "wm.json")
         with patch("backend.memory.current.now_vancouver", return_value=FROZEN_NOW):
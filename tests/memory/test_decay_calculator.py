@@ -2,18 +2,18 @@
 
 import sys
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+
+import pytest
 
 sys.path.insert(0, "/home/northprot/projects/axnmihn")
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.decay_calculator import (
     AdaptiveDecayCalculator,
     get_memory_age_hours,
     MEMORY_TYPE_DECAY_MULTIPLIERS,
 )
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 def get_past_time(hours_ago: float) -> str:
     """Helper to create ISO timestamp from hours ago."""
@@ -142,3 +142,45 @@ class TestAdaptiveDecayCalculator:
         conversation = calc.calculate(importance=1.0, created_at=ts, memory_type="conversation")
 
         assert fact > preference > conversation
+
+
+class TestBatchNumpy:
+    """The vectorized batch path must match the per-memory Python loop."""
+
+    PROCESSED = [
+        {
+            "importance": 0.8, "hours_passed": 720.0, "access_count": 3,
+            "connection_count": 2, "last_access_hours": 0.5, "last_accessed_hour": 14,
+            "memory_type": 0, "channel_mentions": 1,
+        },
+        None,
+        {
+            "importance": 0.4, "hours_passed": 50.0, "access_count": 0,
+            "connection_count": 0, "last_access_hours": -1.0, "last_accessed_hour": -1,
+            "memory_type": 1, "channel_mentions": 0,
+        },
+        {
+            "importance": 0.05, "hours_passed": 5000.0, "access_count": 12,
+            "connection_count": 40, "last_access_hours": 100.0, "last_accessed_hour": 3,
+            "memory_type": 3, "channel_mentions": 4,
+        },
+    ]
+
+    def test_matches_python_loop(self):
+        calc = AdaptiveDecayCalculator()
+        expected = calc._calculate_batch_python(self.PROCESSED)
+        results = calc._calculate_batch_numpy(self.PROCESSED)
+
+        assert results[1] == 0.5
+        assert all(isinstance(r, float) for r in results)
+        assert results == pytest.approx(expected)
+
+    def test_matches_python_loop_with_peak_hours(self):
+        calc = AdaptiveDecayCalculator(peak_hours=[3, 14])
+        expected = calc._calculate_batch_python(self.PROCESSED)
+
+        assert calc._calculate_batch_numpy(self.PROCESSED) == pytest.approx(expected)
+
+    def test_all_invalid(self):
+        calc = AdaptiveDecayCalculator()
+        assert calc._calculate_batch_numpy([None, None]) == [0.5, 0.5]
@@ -2,15 +2,13 @@
 
 import math
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.config import MemoryConfig
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 def _iso_hours_ago(hours: float) -> str:
     """Create ISO timestamp for N hours ago."""
@@ -5,14 +5,12 @@ Verifies channel_mentions > 0 results in slower decay than channel_mentions = 0.
 
 import pytest
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 from backend.memory.permanent.consolidator import MemoryConsolidator
 from backend.memory.meta_memory import MetaMemory
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 class TestDecayWithChannelMentions:
     """Verify channel_mentions slows decay."""
@@ -3,8 +3,8 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.consolidator import MemoryConsolidator
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 from backend.memory.permanent.dynamic_decay import (
@@ -15,8 +15,6 @@ from backend.memory.permanent.dynamic_decay import (
 )
 from backend.memory.permanent.config import MemoryConfig
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 class TestDynamicDecayIntegration:
     """Verify Dynamic Decay changes base_rate when enabled."""
@@ -188,3 +188,12 @@ class TestLongTermMemoryFacade:
 
         assert result["deleted"] == 1
         mock_ltm._consolidator.consolidate.assert_called_once()
+
+    def test_get_memory_contents_single_lookup(self, mock_ltm):
+        """get_memory_contents should fetch every ID in one repository call."""
+        mock_ltm._repository.get_contents.return_value = {"1": "a", "2": "b"}
+
+        contents = mock_ltm.get_memory_contents(["1", "2", "3"])
+
+        assert contents == {"1": "a", "2": "b"}
+        mock_ltm._repository.get_contents.assert_called_once_with(["1", "2", "3"])
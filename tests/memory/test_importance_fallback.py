@@ -4,13 +4,11 @@ import logging
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.consolidator import MemoryConsolidator
 from backend.memory.memgpt import MemGPTConfig
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 class TestImportanceFallback:
     """Verify importance=None triggers warning log and uses 0.5."""
@@ -1,5 +1,9 @@
 """Tests for InteractionLogger and calculate_style_metrics — Phase 4 Cycle 4.5."""
 
+import threading
+import time
+from unittest.mock import MagicMock
+
 import pytest
 
 from backend.memory.recent.connection import SQLiteConnectionManager
@@ -11,8 +15,8 @@ from backend.memory.recent.interaction_logger import (
 
 
 @pytest.fixture
-def conn_mgr(tmp_path):
-    mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
+def conn_mgr(schema_db):
+    mgr = SQLiteConnectionManager(db_path=schema_db)
     SchemaManager(mgr).initialize()
     yield mgr
     mgr.close()
@@ -20,7 +24,9 @@ def conn_mgr(tmp_path):
 
 @pytest.fixture
 def logger(conn_mgr):
-    return InteractionLogger(conn_mgr)
+    logger = InteractionLogger(conn_mgr)
+    yield logger
+    logger.close()
 
 
 # ── InteractionLogger ───────────────────────────────────────────────────────
@@ -49,6 +55,7 @@ class TestInteractionLogger:
             },
             response_text="I think this is good. Maybe we should try.",
         )
+        logger.flush()
         with conn_mgr.get_connection() as conn:
             row = conn.execute(
                 "SELECT hedge_ratio, avg_sentence_len FROM interaction_logs LIMIT 1"
@@ -57,6 +64,83 @@ class TestInteractionLogger:
             assert row[0] > 0  # both sentences have hedges
 
 
+class TestBufferedWrites:
+    _DECISION = {"effective_model": "gemini-pro", "tier": "high", "router_reason": "test"}
+
+    @staticmethod
+    def _count(conn_mgr):
+        with conn_mgr.get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM interaction_logs").fetchone()[0]
+
+    def test_rows_buffered_until_flush(self, logger, conn_mgr):
+        logger.log_interaction(routing_decision=self._DECISION)
+        logger.log_interaction(routing_decision=self._DECISION)
+        assert self._count(conn_mgr) == 0
+
+        assert logger.flush() == 2
+        assert self._count(conn_mgr) == 2
+        assert logger.flush() == 0
+
+    def test_full_batch_written_immediately(self, logger, conn_mgr, monkeypatch):
+        monkeypatch.setattr("backend.memory.recent.interaction_logger._LOG_BATCH_SIZE", 3)
+        for _ in range(3):
+            logger.log_interaction(routing_decision=self._DECISION)
+        assert self._count(conn_mgr) == 3
+
+    def _wait_for_count(self, conn_mgr, expected):
+        deadline = time.monotonic() + 2
+        while self._count(conn_mgr) < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self._count(conn_mgr)
+
+    def test_flush_thread_writes_partial_batch(self, logger, conn_mgr, monkeypatch):
+        monkeypatch.setattr(
+            "backend.memory.recent.interaction_logger._LOG_FLUSH_INTERVAL_S", 0.01
+        )
+        logger.log_interaction(routing_decision=self._DECISION)
+        assert self._wait_for_count(conn_mgr, 1) == 1
+
+    def test_timed_flushes_share_one_thread(self, logger, conn_mgr, monkeypatch):
+        monkeypatch.setattr(
+            "backend.memory.recent.interaction_logger._LOG_FLUSH_INTERVAL_S", 0.01
+        )
+        flush_threads = set()
+        real_flush = logger.flush
+
+        def tracking_flush():
+            flush_threads.add(threading.get_ident())
+            return real_flush()
+
+        monkeypatch.setattr(logger, "flush", tracking_flush)
+        for expected in (1, 2, 3):
+            logger.log_interaction(routing_decision=self._DECISION)
+            assert self._wait_for_count(conn_mgr, expected) == expected
+        assert len(flush_threads) == 1
+
+    def test_close_flushes_and_stops(self, conn_mgr, monkeypatch):
+        fake_atexit = MagicMock()
+        monkeypatch.setattr("backend.memory.recent.interaction_logger.atexit", fake_atexit)
+        logger = InteractionLogger(conn_mgr)
+        logger.log_interaction(routing_decision=self._DECISION)
+        worker = logger._worker
+
+        logger.close()
+
+        assert self._count(conn_mgr) == 1
+        assert not worker.is_alive()
+        fake_atexit.unregister.assert_called_once_with(logger.close)
+        # Closed: later rows are written through, no new flush thread
+        logger.log_interaction(routing_decision=self._DECISION)
+        assert self._count(conn_mgr) == 2
+        assert logger._worker is None
+        logger.close()
+
+    def test_conn_mgr_flush_buffers_writes_pending(self, logger, conn_mgr):
+        logger.log_interaction(routing_decision=self._DECISION)
+        conn_mgr.flush_buffers()
+        assert self._count(conn_mgr) == 1
+
+
 # ── calculate_style_metrics (pure function) ─────────────────────────────────
 
 
@@ -87,3 +171,87 @@ class TestCalculateStyleMetrics:
     def test_short_response(self):
         result = calculate_style_metrics("Hi")
         assert result == {"hedge_ratio": 0.0, "avg_sentence_len": 0.0}
+
+    def test_hedge_detection_case_insensitive(self):
+        result = calculate_style_metrics("PERHAPS this works. It does.")
+        assert result["hedge_ratio"] == 0.5
+
+
+class TestGetRecentLogs:
+    def test_returns_dicts_newest_first(self, logger, conn_mgr):
+        # Insertion order differs from timestamp order
+        stamps = {
+            "low": "2026-01-01 10:00:02",
+            "mid": "2026-01-01 10:00:01",
+            "high": "2026-01-01 10:00:03",
+        }
+        for tier in stamps:
+            logger.log_interaction(
+                routing_decision={
+                    "effective_model": "gemini-pro",
+                    "tier": tier,
+                    "router_reason": "test",
+                },
+            )
+        logger.flush()
+        with conn_mgr.get_connection() as conn:
+            conn.executemany(
+                "UPDATE interaction_logs SET ts = ? WHERE tier = ?",
+                [(ts, tier) for tier, ts in stamps.items()],
+            )
+            conn.commit()
+
+        logs = logger.get_recent_logs()
+        assert all(isinstance(log, dict) for log in logs)
+        assert [log["tier"] for log in logs] == ["high", "low", "mid"]
+        assert [log["tier"] for log in logger.get_recent_logs(limit=2)] == ["high", "low"]
+
+    def test_omits_json_columns(self, logger):
+        logger.log_interaction(
+            routing_decision={
+                "effective_model": "gemini-pro",
+                "tier": "high",
+                "router_reason": "test",
+                "routing_features": {"len": 10},
+            },
+            tool_calls=[{"name": "search"}],
+        )
+        log = logger.get_recent_logs()[0]
+        assert "routing_features_json" not in log
+        assert "tool_calls_json" not in log
+
+    def test_get_interaction_detail(self, logger):
+        logger.log_interaction(
+            routing_decision={
+                "effective_model": "gemini-pro",
+                "tier": "high",
+                "router_reason": "test",
+                "routing_features": {"len": 10},
+            },
+        )
+        log_id = logger.get_recent_logs()[0]["id"]
+        detail = logger.get_interaction_detail(log_id)
+        assert detail["routing_features_json"] == '{"len": 10}'
+        assert logger.get_interaction_detail(log_id + 1) is None
+
+
+class TestStyleMetricsToggle:
+    def test_disabled_skips_metrics(self, logger, conn_mgr, monkeypatch):
+        monkeypatch.setattr(
+            "backend.memory.recent.interaction_logger.STYLE_METRICS_ENABLED", False
+        )
+        logger.log_interaction(
+            routing_decision={
+                "effective_model": "gemini-pro",
+                "tier": "high",
+                "router_reason": "test",
+            },
+            response_text="I think this is good. Maybe we should try.",
+        )
+        logger.flush()
+        with conn_mgr.get_connection() as conn:
+            row = conn.execute(
+                "SELECT hedge_ratio, response_chars FROM interaction_logs LIMIT 1"
+            ).fetchone()
+        assert row[0] is None
+        assert row[1] > 0
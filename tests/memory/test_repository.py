@@ -64,6 +64,30 @@ class TestChromaDBRepository:
 
         assert result is None
 
+    def test_get_contents(self, mock_chromadb_client, mock_chromadb_collection):
+        """get_contents should map IDs to documents from one get()."""
+        mock_chromadb_collection.get.return_value = {
+            "ids": ["mem-001", "mem-002"],
+            "documents": ["First", "Second"],
+        }
+        mock_chromadb_client.get_or_create_collection.return_value = mock_chromadb_collection
+        repo = ChromaDBRepository(client=mock_chromadb_client)
+
+        result = repo.get_contents(["mem-001", "mem-002", "missing"])
+
+        assert result == {"mem-001": "First", "mem-002": "Second"}
+        mock_chromadb_collection.get.assert_called_once_with(
+            ids=["mem-001", "mem-002", "missing"], include=["documents"]
+        )
+
+    def test_get_contents_empty_list(self, mock_chromadb_client, mock_chromadb_collection):
+        """get_contents with no IDs should not query the collection."""
+        mock_chromadb_client.get_or_create_collection.return_value = mock_chromadb_collection
+        repo = ChromaDBRepository(client=mock_chromadb_client)
+
+        assert repo.get_contents([]) == {}
+        mock_chromadb_collection.get.assert_not_called()
+
     def test_query_by_embedding(self, mock_chromadb_client, mock_chromadb_collection, sample_embedding):
         """query_by_embedding should return similar memories."""
         mock_chromadb_collection.query.return_value = {
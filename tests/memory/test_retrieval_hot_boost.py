@@ -2,15 +2,13 @@
 
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.permanent.retrieval import MemoryRetriever
 from backend.memory.permanent.decay_calculator import AdaptiveDecayCalculator
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
 
 def _make_retriever(hot_memory_ids: list[str] | None = None) -> MemoryRetriever:
     """Build a MemoryRetriever with mocked dependencies."""
@@ -68,6 +68,8 @@ class TestSchemaManager:
             "idx_interaction_logs_created",
             "idx_interaction_logs_router",
             "idx_archived_session",
+            "idx_sessions_ended",
+            "idx_messages_session_turn",
         }
         assert expected.issubset(indexes)
 
@@ -102,3 +104,73 @@ class TestSchemaMigration:
         with conn_mgr.get_connection() as conn:
             count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
             assert count == 1  # data preserved
+
+    def test_upgrades_v2_database(self, conn_mgr):
+        schema = SchemaManager(conn_mgr)
+        schema.initialize()
+        with conn_mgr.get_connection() as conn:
+            conn.execute("DROP INDEX idx_sessions_ended")
+            conn.execute("PRAGMA user_version = 2")
+            conn.commit()
+
+        schema.initialize()
+
+        with conn_mgr.get_connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_sessions_ended'"
+            ).fetchone()
+            assert row is not None
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == CURRENT_SCHEMA_VERSION
+
+    def test_upgrades_v3_database(self, conn_mgr):
+        schema = SchemaManager(conn_mgr)
+        schema.initialize()
+        with conn_mgr.get_connection() as conn:
+            conn.execute("DROP INDEX idx_messages_session_turn")
+            conn.execute("PRAGMA user_version = 3")
+            conn.commit()
+
+        schema.initialize()
+
+        with conn_mgr.get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT turn_id FROM messages "
+                "WHERE session_id = ? ORDER BY turn_id",
+                ("s",),
+            ).fetchall()
+            assert "idx_messages_session_turn" in plan[0][3]
+            assert not any("TEMP B-TREE" in row[3] for row in plan)
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 4
+
+    def test_adds_messages_json_to_legacy_sessions(self, conn_mgr):
+        with conn_mgr.get_connection() as conn:
+            conn.execute(
+                """CREATE TABLE sessions (
+                       id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT UNIQUE,
+                       summary TEXT, key_topics TEXT, emotional_tone TEXT,
+                       turn_count INTEGER, started_at TIMESTAMP, ended_at TIMESTAMP,
+                       created_at TIMESTAMP, expires_at TIMESTAMP)"""
+            )
+            conn.commit()
+
+        SchemaManager(conn_mgr).initialize()
+
+        with conn_mgr.get_connection() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+            assert "messages_json" in columns
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == CURRENT_SCHEMA_VERSION
+
+    def test_current_version_skips_writes(self, conn_mgr):
+        schema = SchemaManager(conn_mgr)
+        schema.initialize()
+
+        with conn_mgr.get_connection() as conn:
+            before = conn.total_changes
+            statements = []
+            conn.set_trace_callback(statements.append)
+            try:
+                schema.initialize()
+            finally:
+                conn.set_trace_callback(None)
+            assert conn.total_changes == before
+        assert statements == ["PRAGMA user_version"]
@@ -2,19 +2,26 @@
 
 import sqlite3
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.recent import SessionArchive
 from backend.memory.recent.connection import SQLiteConnectionManager
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
+
+_INSERT_MESSAGE_SQL = """INSERT INTO messages
+    (session_id, turn_id, role, content, timestamp, emotional_context)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_INSERT_LOG_SQL = """INSERT INTO interaction_logs
+    (effective_model, tier, router_reason, latency_ms,
+     tokens_in, tokens_out, refusal_detected)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
 
 
 @pytest.fixture
-def archive(tmp_path):
-    a = SessionArchive(db_path=str(tmp_path / "test.db"))
+def archive(schema_db):
+    a = SessionArchive(db_path=str(schema_db))
     yield a
     a.close()
 
@@ -22,44 +29,37 @@ def archive(tmp_path):
 def _seed_messages(archive: SessionArchive, session_id: str, count: int = 3):
     """Insert test messages directly into the DB."""
     now = datetime.now(VANCOUVER_TZ)
-    with archive._get_connection() as conn:
-        for i in range(count):
-            conn.execute(
-                """INSERT INTO messages
-                   (session_id, turn_id, role, content, timestamp, emotional_context)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    session_id,
-                    i,
-                    "user" if i % 2 == 0 else "assistant",
-                    f"message {i}",
-                    (now + timedelta(seconds=i)).isoformat(),
-                    "neutral",
-                ),
-            )
-        conn.commit()
+    rows = [
+        (
+            session_id,
+            i,
+            "user" if i % 2 == 0 else "assistant",
+            f"message {i}",
+            (now + timedelta(seconds=i)).isoformat(),
+            "neutral",
+        )
+        for i in range(count)
+    ]
+    with archive._conn_mgr.transaction() as conn:
+        conn.executemany(_INSERT_MESSAGE_SQL, rows)
 
 
 def _seed_interaction_logs(archive: SessionArchive, count: int = 5):
     """Insert test interaction logs."""
-    with archive._get_connection() as conn:
-        for i in range(count):
-            conn.execute(
-                """INSERT INTO interaction_logs
-                   (effective_model, tier, router_reason, latency_ms,
-                    tokens_in, tokens_out, refusal_detected)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    "gemini-pro" if i % 2 == 0 else "gemini-flash",
-                    "high" if i % 2 == 0 else "low",
-                    "complexity" if i % 3 == 0 else "default",
-                    100 + i * 10,
-                    50 + i,
-                    30 + i,
-                    0,
-                ),
-            )
-        conn.commit()
+    rows = [
+        (
+            "gemini-pro" if i % 2 == 0 else "gemini-flash",
+            "high" if i % 2 == 0 else "low",
+            "complexity" if i % 3 == 0 else "default",
+            100 + i * 10,
+            50 + i,
+            30 + i,
+            0,
+        )
+        for i in range(count)
+    ]
+    with archive._conn_mgr.transaction() as conn:
+        conn.executemany(_INSERT_LOG_SQL, rows)
 
 
 # ── Cycle 1.6: SessionArchive delegates to ConnectionManager ────────────────
@@ -141,6 +141,7 @@ class TestGetSessionDetailFallback:
     def test_returns_messages_from_messages_table(self, archive):
         """When messages_json is empty, get_session_detail should fall back."""
         # Insert a session with no messages_json
+        now = datetime.now(VANCOUVER_TZ)
         with archive._get_connection() as conn:
             conn.execute(
                 """INSERT INTO sessions
@@ -152,9 +153,9 @@ class TestGetSessionDetailFallback:
                     '["test"]',
                     "neutral",
                     3,
-                    datetime.now(VANCOUVER_TZ).isoformat(),
-                    datetime.now(VANCOUVER_TZ).isoformat(),
-                    (datetime.now(VANCOUVER_TZ) + timedelta(days=7)).isoformat(),
+                    now.isoformat(),
+                    now.isoformat(),
+                    (now + timedelta(days=7)).isoformat(),
                 ),
             )
             conn.commit()
@@ -2,11 +2,10 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
 import pytest
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
+from backend.core.utils.timezone import VANCOUVER_TZ
 
 
 def _make_manager_stub(facts: list[str], insights: list[str]):
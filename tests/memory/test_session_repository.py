@@ -1,23 +1,17 @@
 """Tests for SessionRepository — Phase 4 Cycles 4.2-4.4."""
 
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 import pytest
 
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.recent.connection import SQLiteConnectionManager
-from backend.memory.recent.schema import SchemaManager
-from backend.memory.recent.repository import SessionRepository
-
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
+from backend.memory.recent.repository import _MESSAGES_PER_INSERT, SessionRepository
 
 
 @pytest.fixture
-def conn_mgr(tmp_path):
-    mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
-    SchemaManager(mgr).initialize()
-    yield mgr
-    mgr.close()
+def conn_mgr(clean_conn_mgr):
+    return clean_conn_mgr
 
 
 @pytest.fixture
@@ -89,6 +83,50 @@ class TestSaveSession:
             ).fetchone()[0]
             assert msg_count == 2
 
+    def test_saves_messages_across_insert_chunks(self, repo):
+        now = datetime.now(VANCOUVER_TZ)
+        repo.save_message_immediate("sess-big", "user", "first", now.isoformat())
+        count = _MESSAGES_PER_INSERT * 2 + 1
+        messages = [{"role": "user", "content": f"m{i}"} for i in range(count)]
+        assert repo.save_session(
+            session_id="sess-big",
+            summary="",
+            key_topics=[],
+            emotional_tone="neutral",
+            turn_count=len(messages),
+            started_at=now,
+            ended_at=now,
+            messages=messages,
+        )
+
+        saved = repo.get_session_messages("sess-big")
+        assert [m["turn_id"] for m in saved] == list(range(len(messages) + 1))
+        assert [m["content"] for m in saved[1:]] == [m["content"] for m in messages]
+        assert saved[-1]["timestamp"]
+
+    def test_datetimes_stored_as_iso_text(self, repo, conn_mgr):
+        now = datetime.now(VANCOUVER_TZ)
+        repo.save_session(
+            session_id="sess-iso",
+            summary="",
+            key_topics=[],
+            emotional_tone="neutral",
+            turn_count=1,
+            started_at=now,
+            ended_at=now,
+            messages=[{"role": "user", "content": "hi", "timestamp": now}],
+        )
+        with conn_mgr.get_connection() as conn:
+            row = conn.execute(
+                "SELECT started_at, ended_at FROM sessions WHERE session_id = 'sess-iso'"
+            ).fetchone()
+            msg_ts = conn.execute(
+                "SELECT timestamp FROM messages WHERE session_id = 'sess-iso'"
+            ).fetchone()[0]
+        assert row[0] == now.isoformat()
+        assert row[1] == now.isoformat()
+        assert msg_ts == now.isoformat()
+
 
 # ── Cycle 4.4: Query methods ────────────────────────────────────────────────
 
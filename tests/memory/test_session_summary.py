@@ -3,13 +3,10 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.current import TimestampedMessage
 
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
-
-
 def _make_message(role: str, content: str) -> TimestampedMessage:
     return TimestampedMessage(
         role=role,
@@ -1,25 +1,51 @@
 """Tests for SessionSummarizer — Phase 5 TDD cycles."""
 
+import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
-from zoneinfo import ZoneInfo
 
 import pytest
 
-from backend.memory.recent.connection import SQLiteConnectionManager
-from backend.memory.recent.schema import SchemaManager
+from backend.core.utils.timezone import VANCOUVER_TZ
 from backend.memory.recent.repository import SessionRepository
-from backend.memory.recent.summarizer import SessionSummarizer
+from backend.memory.recent.summarizer import _SUMMARIZE_CONCURRENCY, SessionSummarizer
 
-VANCOUVER_TZ = ZoneInfo("America/Vancouver")
+
+class _FakeLLM:
+    """Minimal async LLM client: canned reply or error, plus a call counter."""
+
+    def __init__(self, reply: str = "테스트 요약입니다.", error: Exception | None = None):
+        self.reply = reply
+        self.error = error
+        self.calls = 0
+
+    async def generate(self, prompt, **kwargs):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.reply
+
+
+class _SlowLLM(_FakeLLM):
+    """_FakeLLM that yields to the loop and records peak concurrent calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, prompt, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().generate(prompt, **kwargs)
+        finally:
+            self.in_flight -= 1
 
 
 @pytest.fixture
-def conn_mgr(tmp_path):
-    mgr = SQLiteConnectionManager(db_path=tmp_path / "test.db")
-    SchemaManager(mgr).initialize()
-    yield mgr
-    mgr.close()
+def conn_mgr(clean_conn_mgr):
+    return clean_conn_mgr
 
 
 @pytest.fixture
@@ -34,16 +60,14 @@ def summarizer(repo):
 
 @pytest.fixture
 def mock_llm():
-    client = AsyncMock()
-    client.generate = AsyncMock(return_value="테스트 요약입니다.")
-    return client
+    return _FakeLLM()
 
 
 # ── Cycle 5.1: generate_summary ─────────────────────────────────────────────
 
 
 class TestGenerateSummary:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generates_summary_from_messages(self, summarizer, mock_llm):
         messages = [
             {"role": "user", "content": "Python에 대해 알려줘"},
@@ -51,18 +75,17 @@ class TestGenerateSummary:
         ]
         result = await summarizer.generate_summary(messages, llm_client=mock_llm)
         assert result == "테스트 요약입니다."
-        mock_llm.generate.assert_called_once()
+        assert mock_llm.calls == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_returns_none_for_empty(self, summarizer, mock_llm):
         result = await summarizer.generate_summary([], llm_client=mock_llm)
         assert result is None
-        mock_llm.generate.assert_not_called()
+        assert mock_llm.calls == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_returns_none_on_llm_failure(self, summarizer):
-        client = AsyncMock()
-        client.generate = AsyncMock(side_effect=RuntimeError("API error"))
+        client = _FakeLLM(error=RuntimeError("API error"))
         messages = [{"role": "user", "content": "test"}]
         result = await summarizer.generate_summary(messages, llm_client=client)
         assert result is None
@@ -72,14 +95,14 @@ class TestGenerateSummary:
 
 
 class TestSummarizeExpired:
-    def _seed_expired_session(self, repo):
+    def _seed_expired_session(self, repo, session_id="sess-expired"):
         """Create an expired session with messages."""
         now = datetime.now(VANCOUVER_TZ)
         past = now - timedelta(days=10)
         expired = past - timedelta(days=1)
 
         repo.save_session(
-            session_id="sess-expired",
+            session_id=session_id,
             summary="",
             key_topics=["test"],
             emotional_tone="neutral",
@@ -95,11 +118,11 @@ class TestSummarizeExpired:
         with repo._conn_mgr.get_connection() as conn:
             conn.execute(
                 "UPDATE sessions SET expires_at = ?, summary = NULL WHERE session_id = ?",
-                (expired.isoformat(), "sess-expired"),
+                (expired.isoformat(), session_id),
             )
             conn.commit()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_processes_expired_sessions(self, summarizer, repo, mock_llm):
         self._seed_expired_session(repo)
 
@@ -109,17 +132,53 @@ class TestSummarizeExpired:
 
         # Verify messages moved to archive
         with repo._conn_mgr.get_connection() as conn:
-            archived = conn.execute(
-                "SELECT COUNT(*) FROM archived_messages WHERE session_id = 'sess-expired'"
-            ).fetchone()[0]
+            archived, remaining = conn.execute(
+                """SELECT
+                       (SELECT COUNT(*) FROM archived_messages WHERE session_id = ?1),
+                       EXISTS(SELECT 1 FROM messages WHERE session_id = ?1)""",
+                ("sess-expired",),
+            ).fetchone()
             assert archived == 2
-
-            remaining = conn.execute(
-                "SELECT COUNT(*) FROM messages WHERE session_id = 'sess-expired'"
-            ).fetchone()[0]
             assert remaining == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_processes_multiple_expired_concurrently(self, summarizer, repo):
+        for i in range(10):
+            self._seed_expired_session(repo, session_id=f"sess-expired-{i}")
+        llm = _SlowLLM()
+
+        result = await summarizer.summarize_expired(llm_client=llm)
+
+        assert result == {"sessions_processed": 10, "messages_archived": 20}
+        assert llm.calls == 10
+        assert 1 < llm.peak <= _SUMMARIZE_CONCURRENCY
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_bounds_loaded_sessions_by_concurrency(self, summarizer, repo, monkeypatch):
+        for i in range(10):
+            self._seed_expired_session(repo, session_id=f"sess-expired-{i}")
+        loaded = {"now": 0, "peak": 0}
+        fetch = repo.get_session_messages_for_archive
+        archive = repo.archive_session
+
+        def _fetch(session_id):
+            loaded["now"] += 1
+            loaded["peak"] = max(loaded["peak"], loaded["now"])
+            return fetch(session_id)
+
+        def _archive(session_id, messages, summary):
+            loaded["now"] -= 1
+            return archive(session_id, messages, summary)
+
+        monkeypatch.setattr(repo, "get_session_messages_for_archive", _fetch)
+        monkeypatch.setattr(repo, "archive_session", _archive)
+
+        result = await summarizer.summarize_expired(llm_client=_SlowLLM())
+
+        assert result["sessions_processed"] == 10
+        assert loaded["peak"] <= _SUMMARIZE_CONCURRENCY
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_no_expired_sessions_returns_zero(self, summarizer, mock_llm):
         result = await summarizer.summarize_expired(llm_client=mock_llm)
         assert result["sessions_processed"] == 0
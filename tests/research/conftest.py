@@ -0,0 +1,17 @@
+"""Shared fixtures for research module tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_page_cache():
+    """Isolate tests from visit_page results cached by earlier tests."""
+    from backend.protocols.mcp.research import page_visitor
+
+    page_visitor._page_cache._cache.clear()
+    page_visitor._page_locks.clear()
+    page_visitor._page_lock_users.clear()
+    yield
+    page_visitor._page_cache._cache.clear()
+    page_visitor._page_locks.clear()
+    page_visitor._page_lock_users.clear()
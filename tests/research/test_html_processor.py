@@ -116,3 +116,173 @@ class TestHtmlToMarkdown:
         html = "<p>Text</p>\n\n\n\n\n<p>More</p>"
         result = html_to_markdown(html)
         assert "\n\n\n" not in result
+
+
+class TestParserFallback:
+    """clean_html falls back to html.parser when lxml is unavailable."""
+
+    def test_falls_back_to_html_parser(self):
+        from unittest.mock import patch
+
+        from bs4.builder import builder_registry
+
+        from backend.protocols.mcp.research.html_processor import clean_html
+
+        real_lookup = builder_registry.lookup
+
+        def lookup_without_lxml(*features):
+            return None if "lxml" in features else real_lookup(*features)
+
+        with patch.object(builder_registry, "lookup", side_effect=lookup_without_lxml), patch(
+            "backend.protocols.mcp.research.html_processor.HAS_LXML", False
+        ):
+            result = clean_html("<div><p>Hello</p><script>x()</script></div>")
+        assert "Hello" in result
+        assert "x()" not in result
+
+
+class TestLxmlPath:
+    """clean_html strips noise with lxml directly when it is installed."""
+
+    def test_uses_lxml_without_bs4(self):
+        from unittest.mock import patch
+
+        from backend.protocols.mcp.research import html_processor
+
+        assert html_processor.HAS_LXML
+        html = '<div><p>Keep</p><div class="top ad-banner">Ad</div>tail<script>x()</script></div>'
+        with patch.object(html_processor, "_clean_soup") as soup_path:
+            result = html_processor.clean_html(html)
+
+        soup_path.assert_not_called()
+        assert "Keep" in result
+        assert "tail" in result
+        assert "Ad" not in result
+        assert "x()" not in result
+
+    def test_noisy_root_yields_empty(self):
+        from backend.protocols.mcp.research.html_processor import clean_html
+
+        assert clean_html('<div id="cookie-consent">Accept</div>') == ""
+
+    def test_falls_back_to_bs4_when_lxml_rejects_input(self):
+        from backend.protocols.mcp.research.html_processor import clean_html
+
+        html = '<?xml version="1.0" encoding="utf-8"?><html><body><p>Body</p><script>x()</script></body></html>'
+        result = clean_html(html)
+        assert "Body" in result
+        assert "x()" not in result
+
+
+class TestHeadStripping:
+    """Head-level noise is dropped at parse time."""
+
+    def test_drops_head_scripts_and_styles(self):
+        from backend.protocols.mcp.research.html_processor import clean_html
+
+        html = (
+            "<html><head><style>.x{}</style><script>track()</script></head>"
+            "<body><p>Body text</p><script>inline()</script></body></html>"
+        )
+        result = clean_html(html)
+        assert "track()" not in result
+        assert ".x{}" not in result
+        assert "inline()" not in result
+        assert "Body text" in result
+
+    def test_nested_noise_inside_removed_subtree(self):
+        from backend.protocols.mcp.research.html_processor import clean_html
+
+        html = (
+            '<div><p>Keep</p><div class="sidebar"><nav><!-- c --><p id="ad-1">x</p>'
+            '</nav></div><p>Also keep</p></div>'
+        )
+        result = clean_html(html)
+        assert "Keep" in result
+        assert "Also keep" in result
+        assert "sidebar" not in result
+        assert "ad-1" not in result
+
+
+class TestMarkdownShortCircuit:
+    """html_to_markdown stops converting once the length budget is met."""
+
+    def test_stops_converting_after_budget(self):
+        from unittest.mock import patch
+
+        from backend.protocols.mcp.research.html_processor import _Converter, html_to_markdown
+
+        html = "<body>" + ("<p>" + "B" * 1000 + "</p>") * 200 + "</body>"
+        real = _Converter.process_element
+        calls = []
+
+        def counting(self, node, parent_tags=None):
+            calls.append(node)
+            return real(self, node, parent_tags=parent_tags)
+
+        with patch(
+            "backend.protocols.mcp.research.html_processor.MAX_CONTENT_LENGTH", 10_000
+        ), patch.object(_Converter, "process_element", counting):
+            result = html_to_markdown(html)
+
+        assert "[Content truncated" in result
+        top_level = [n for n in calls if getattr(n, "name", None) == "p" and n.parent.name == "body"]
+        assert len(top_level) < 20
+
+
+class TestInlineSpacing:
+    """Block-by-block conversion keeps markdownify's whitespace handling."""
+
+    def test_space_between_inline_siblings(self):
+        from backend.protocols.mcp.research.html_processor import html_to_markdown
+
+        assert html_to_markdown("<b>alpha</b> <i>beta</i> gamma") == "**alpha** *beta* gamma"
+
+    def test_matches_whole_document_conversion(self):
+        from backend.protocols.mcp.research.html_processor import (
+            _COLLAPSE_RE,
+            _clean_soup,
+            _collapse_run,
+            _get_converter,
+            html_to_markdown,
+        )
+
+        html = (
+            "<html><body>\n<h1>T</h1>\n<p>a <a href='/x'>b</a> c</p>\n"
+            "<ul><li>one</li><li>two</li></ul>\ntext <em>x</em> <b>y</b>\n"
+            "<div>d</div> <span>s</span> z<br>w</body></html>"
+        )
+        whole = _get_converter("https://e.com").convert_soup(_clean_soup(html))
+        expected = _COLLAPSE_RE.sub(_collapse_run, whole).strip()
+
+        assert html_to_markdown(html, base_url="https://e.com") == expected
+
+    def test_parses_document_once(self):
+        from unittest.mock import patch
+
+        from backend.protocols.mcp.research import html_processor
+
+        real = html_processor.BeautifulSoup
+        with patch.object(html_processor, "BeautifulSoup", side_effect=real) as parse:
+            html_processor.html_to_markdown("<p>one</p><p>two</p>")
+
+        assert parse.call_count == 1
+
+
+class TestCollapseRuns:
+    def test_collapses_newline_and_space_runs(self):
+        from backend.protocols.mcp.research.html_processor import _COLLAPSE_RE, _collapse_run
+
+        assert _COLLAPSE_RE.sub(_collapse_run, "a\n\n\n\nb   c\n\nd") == "a\n\nb c\n\nd"
+
+
+class TestConverterReuse:
+    def test_reuses_converter_with_fresh_base_url(self):
+        from backend.protocols.mcp.research.html_processor import _get_converter, html_to_markdown
+
+        first = html_to_markdown('<a href="/a">A</a>', base_url="https://one.example")
+        second = html_to_markdown('<a href="/a">A</a>', base_url="https://two.example")
+
+        assert "https://one.example/a" in first
+        assert "https://two.example/a" in second
+        assert _get_converter("") is _get_converter("")
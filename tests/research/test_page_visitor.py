@@ -111,6 +111,111 @@ class TestVisitPage:
         assert "Test" in result
 
 
+class TestVisitPageCache:
+    """Tests for the visit_page result cache."""
+
+    @staticmethod
+    def _mock_manager(status=200):
+        mock_page = AsyncMock()
+        mock_page.content = AsyncMock(return_value="<html><body><p>Cached body</p></body></html>")
+        mock_page.title = AsyncMock(return_value="Cache Page")
+        mock_page.set_default_timeout = MagicMock()
+        mock_page.set_default_navigation_timeout = MagicMock()
+        mock_response = AsyncMock()
+        mock_response.status = status
+        mock_page.goto = AsyncMock(return_value=mock_response)
+        mock_page.close = AsyncMock()
+
+        mock_manager = AsyncMock()
+        mock_manager.get_page = AsyncMock(return_value=mock_page)
+        return mock_manager
+
+    @pytest.mark.asyncio
+    async def test_second_visit_served_from_cache(self):
+        from backend.protocols.mcp.research.page_visitor import visit_page
+
+        mock_manager = self._mock_manager()
+        with patch(
+            "backend.protocols.mcp.research.page_visitor.get_browser_manager",
+            new_callable=AsyncMock,
+            return_value=mock_manager,
+        ), patch(
+            "backend.protocols.mcp.research.page_visitor.process_content_for_artifact",
+            side_effect=lambda url, content: content,
+        ):
+            first = await visit_page("https://example.com/cached")
+            second = await visit_page("https://example.com/cached")
+
+        assert first == second
+        assert "Cached body" in first
+        mock_manager.get_page.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_visits_share_one_load(self):
+        from backend.protocols.mcp.research.page_visitor import visit_page
+
+        mock_manager = self._mock_manager()
+        with patch(
+            "backend.protocols.mcp.research.page_visitor.get_browser_manager",
+            new_callable=AsyncMock,
+            return_value=mock_manager,
+        ), patch(
+            "backend.protocols.mcp.research.page_visitor.process_content_for_artifact",
+            side_effect=lambda url, content: content,
+        ):
+            results = await asyncio.gather(
+                *(visit_page("https://example.com/herd") for _ in range(3))
+            )
+
+        assert len(set(results)) == 1
+        mock_manager.get_page.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        from backend.protocols.mcp.research.page_visitor import visit_page
+
+        mock_manager = self._mock_manager(status=500)
+        with patch(
+            "backend.protocols.mcp.research.page_visitor.get_browser_manager",
+            new_callable=AsyncMock,
+            return_value=mock_manager,
+        ):
+            first = await visit_page("https://example.com/broken")
+            await visit_page("https://example.com/broken")
+
+        assert first.startswith("Error")
+        assert mock_manager.get_page.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lock_kept_while_waiter_pending(self):
+        """A visit arriving during a lock handoff must not get a fresh lock."""
+        from backend.protocols.mcp.research import page_visitor
+
+        url = "https://example.com/handoff"
+        state = {"in_flight": 0, "peak": 0, "calls": 0}
+        late = []
+
+        async def fake_load(load_url):
+            state["calls"] += 1
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            if state["calls"] == 1:
+                # Scheduled before the release wakes the queued waiter
+                late.append(asyncio.ensure_future(page_visitor.visit_page(url)))
+            state["in_flight"] -= 1
+            return "Error: uncached", False
+
+        with patch.object(page_visitor, "_load_page", side_effect=fake_load):
+            await asyncio.gather(page_visitor.visit_page(url), page_visitor.visit_page(url))
+            await asyncio.gather(*late)
+
+        assert state["calls"] == 3
+        assert state["peak"] == 1
+        assert url not in page_visitor._page_locks
+        assert url not in page_visitor._page_lock_users
+
+
 class TestDeepDive:
     """Tests for deep_dive function."""
 
@@ -177,3 +282,43 @@ class TestDeepDive:
 
         assert "ARTIFACT SAVED" in result
         assert "Saved Artifacts" in result
+
+    @pytest.mark.asyncio
+    async def test_slow_visit_times_out_without_stalling_others(self):
+        from backend.protocols.mcp.research.page_visitor import deep_dive
+
+        mock_results = [
+            {"title": "Fast", "url": "https://example.com/fast", "snippet": "S1"},
+            {"title": "Slow", "url": "https://example.com/slow", "snippet": "S2"},
+        ]
+
+        async def fake_visit(url):
+            if url.endswith("slow"):
+                await asyncio.sleep(10)
+            return "# Page\n\n**Source:** x\n\n---\n\nFast body"
+
+        with patch(
+            "backend.protocols.mcp.research.page_visitor.search_duckduckgo",
+            new_callable=AsyncMock,
+            return_value=mock_results,
+        ), patch(
+            "backend.protocols.mcp.research.page_visitor.visit_page",
+            side_effect=fake_visit,
+        ), patch(
+            "backend.protocols.mcp.research.page_visitor._VISIT_TIMEOUT_S", 0.05
+        ):
+            result = await deep_dive("timeout query")
+
+        assert "Fast body" in result
+        assert "Failed to retrieve: TimeoutError" in result
+        assert "Sources Analyzed:** 1/2" in result
+
+
+class TestSkipLines:
+    """Tests for the header-skipping helper used by deep_dive."""
+
+    def test_matches_split_join(self):
+        from backend.protocols.mcp.research.page_visitor import _skip_lines
+
+        for text in ["", "a", "a\nb\nc\nd", "a\nb\nc\nd\n", "# T\n\n**Source:** u\n\n---\n\nbody\nmore"]:
+            assert _skip_lines(text, 4) == "\n".join(text.split("\n")[4:])
@@ -65,3 +65,10 @@ def test_user_agents_is_list():
 
     assert isinstance(USER_AGENTS, list)
     assert len(USER_AGENTS) >= 3
+
+
+def test_excluded_tags_set_matches_list():
+    from backend.protocols.mcp.research.config import EXCLUDED_TAGS, EXCLUDED_TAGS_SET
+
+    assert isinstance(EXCLUDED_TAGS_SET, frozenset)
+    assert EXCLUDED_TAGS_SET == set(EXCLUDED_TAGS)
@@ -5,6 +5,50 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from backend.protocols.mcp.research.search_engines import (
+    _parse_ddg_lxml,
+    _parse_ddg_soup,
+    search_duckduckgo,
+    tavily_search,
+    web_search,
+)
+
+
+class _FakeResponse:
+    """Stands in for an aiohttp response used as ``async with``."""
+
+    def __init__(self, status: int, body: str = ""):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def text(self):
+        return self._body
+
+
+class _FakeSession:
+    """Stands in for aiohttp.ClientSession; ``get`` returns or raises."""
+
+    def __init__(self, response: _FakeResponse | None = None, error: Exception | None = None):
+        self._response = response
+        self._error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, *args, **kwargs):
+        if self._error is not None:
+            raise self._error
+        return self._response
+
 
 @pytest.fixture
 def ddg_html_response():
@@ -30,70 +74,73 @@ def ddg_html_response():
 class TestSearchDuckduckgo:
     """Tests for search_duckduckgo function."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_parses_results(self, ddg_html_response):
-        from backend.protocols.mcp.research.search_engines import search_duckduckgo
-
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.text = AsyncMock(return_value=ddg_html_response)
-        mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_resp.__aexit__ = AsyncMock(return_value=False)
+        session = _FakeSession(_FakeResponse(200, ddg_html_response))
 
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_resp)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("aiohttp.ClientSession", return_value=session):
             results = await search_duckduckgo("test query", num_results=5)
 
         assert len(results) >= 1
         assert "title" in results[0]
         assert "url" in results[0]
         assert "snippet" in results[0]
+        assert results[0]["url"] == "https://example.com/page1"
+        assert results[1]["url"] == "https://example.com/page2"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_returns_empty_on_http_error(self):
-        from backend.protocols.mcp.research.search_engines import search_duckduckgo
-
-        mock_resp = AsyncMock()
-        mock_resp.status = 503
-        mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_resp.__aexit__ = AsyncMock(return_value=False)
+        session = _FakeSession(_FakeResponse(503))
 
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_resp)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("aiohttp.ClientSession", return_value=session):
             results = await search_duckduckgo("test query")
 
         assert results == []
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_returns_empty_on_timeout(self):
-        from backend.protocols.mcp.research.search_engines import search_duckduckgo
-
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(side_effect=asyncio.TimeoutError())
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
+        session = _FakeSession(error=asyncio.TimeoutError())
 
-        with patch("aiohttp.ClientSession", return_value=mock_session):
+        with patch("aiohttp.ClientSession", return_value=session):
             results = await search_duckduckgo("timeout query")
 
         assert results == []
 
 
+_EXPECTED_DDG_RESULTS = [
+    {"title": "Title One", "url": "https://example.com/page1", "snippet": "Snippet for page one"},
+    {"title": "Title Two", "url": "https://example.com/page2", "snippet": "Snippet for page two"},
+]
+
+
+@pytest.mark.parametrize("parse", [_parse_ddg_lxml, _parse_ddg_soup], ids=["lxml", "soup"])
+class TestParseDdgResults:
+    """Both DuckDuckGo parsers must return identical results."""
+
+    def test_parses_fixture(self, parse, ddg_html_response):
+        assert parse(ddg_html_response, 5) == _EXPECTED_DDG_RESULTS
+
+    def test_respects_num_results(self, parse, ddg_html_response):
+        assert parse(ddg_html_response, 1) == _EXPECTED_DDG_RESULTS[:1]
+
+    def test_inline_markup_keeps_word_spacing(self, parse):
+        html = """
+        <div class="result">
+            <h2 class="result__title"><a class="result__a" href="https://example.com">Foo <b>bar</b></a></h2>
+            <a class="result__snippet">Some   <b>bold</b>
+                text</a>
+        </div>
+        """
+        assert parse(html, 5) == [
+            {"title": "Foo bar", "url": "https://example.com", "snippet": "Some bold text"}
+        ]
+
+
 class TestWebSearch:
     """Tests for web_search (renamed from _google_search)."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_formats_results_as_markdown(self):
-        from backend.protocols.mcp.research.search_engines import web_search
-
         mock_results = [
             {"title": "Result 1", "url": "https://example.com/1", "snippet": "First snippet"},
             {"title": "Result 2", "url": "https://example.com/2", "snippet": "Second snippet"},
@@ -111,10 +158,8 @@ class TestWebSearch:
         assert "https://example.com/1" in result
         assert "First snippet" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_no_results_message(self):
-        from backend.protocols.mcp.research.search_engines import web_search
-
         with patch(
             "backend.protocols.mcp.research.search_engines.search_duckduckgo",
             new_callable=AsyncMock,
@@ -126,18 +171,14 @@ class TestWebSearch:
 
     def test_web_search_is_exported(self):
         """Verify web_search exists (renamed from _google_search)."""
-        from backend.protocols.mcp.research.search_engines import web_search
-
         assert callable(web_search)
 
 
 class TestTavilySearch:
     """Tests for tavily_search function."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_returns_error_without_api_key(self):
-        from backend.protocols.mcp.research.search_engines import tavily_search
-
         with patch(
             "backend.protocols.mcp.research.search_engines.get_tavily_client",
             return_value=None,
@@ -146,10 +187,8 @@ class TestTavilySearch:
 
         assert "검색 불가" in result or "TAVILY_API_KEY" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_formats_tavily_results(self):
-        from backend.protocols.mcp.research.search_engines import tavily_search
-
         mock_client = MagicMock()
         mock_client.search.return_value = {
             "answer": "AI summary answer",
@@ -168,10 +207,8 @@ class TestTavilySearch:
         assert "AI summary answer" in result
         assert "Source 1" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_handles_tavily_exception(self):
-        from backend.protocols.mcp.research.search_engines import tavily_search
-
         mock_client = MagicMock()
         mock_client.search.side_effect = RuntimeError("API error")
 
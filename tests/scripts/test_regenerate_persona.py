@@ -0,0 +1,21 @@
+"""Tests for scripts/regenerate_persona.py helpers."""
+
+from unittest.mock import patch
+
+from scripts.regenerate_persona import dedupe_behaviors
+
+
+def _b(insight, confidence=0.5):
+    return {"insight": insight, "confidence": confidence}
+
+
+class TestDedupeBehaviors:
+    def test_keeps_first_occurrence_in_order(self):
+        a, b, dup = _b("Mark likes tea"), _b("Axel teases"), _b("mark  LIKES tea")
+        assert dedupe_behaviors([a, b, dup]) == [a, b]
+
+    def test_cap_keeps_most_confident_in_input_order(self):
+        behaviors = [_b("one", 0.3), _b("two", 0.9), _b("three", 0.1), _b("four", 0.6)]
+        with patch("scripts.regenerate_persona.MAX_BEHAVIORS", 2):
+            result = dedupe_behaviors(behaviors)
+        assert [b["insight"] for b in result] == ["two", "four"]
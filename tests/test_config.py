@@ -9,56 +9,52 @@ import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import pytest
+
+from backend import config
+from backend.config import (
+    BACKEND_ROOT,
+    DATA_ROOT,
+    MAX_FILE_SIZE,
+    MAX_LOG_LINES,
+    MAX_SEARCH_RESULTS,
+    PROJECT_ROOT,
+    TIMEOUT_API_CALL,
+    TIMEOUT_HTTP_DEFAULT,
+    TIMEOUT_STREAM_CHUNK,
+    ensure_data_directories,
+    get_cors_origins,
+    _get_float_env,
+    _get_int_env,
+    _get_size_bytes,
+)
+
 
 class TestTimeoutConstants:
     """Timeout constants merged from timeouts.py and scattered modules."""
 
-    def test_timeout_api_call_default(self):
-        from backend.config import TIMEOUT_API_CALL
-
-        assert TIMEOUT_API_CALL == 180
-
-    def test_timeout_stream_chunk_default(self):
-        from backend.config import TIMEOUT_STREAM_CHUNK
-
-        assert TIMEOUT_STREAM_CHUNK == 60
-
-    def test_timeout_first_chunk_base_default(self):
-        from backend.config import TIMEOUT_FIRST_CHUNK_BASE
-
-        assert TIMEOUT_FIRST_CHUNK_BASE == 100
-
-    def test_timeout_mcp_tool_default(self):
-        from backend.config import TIMEOUT_MCP_TOOL
-
-        assert TIMEOUT_MCP_TOOL == 300
-
-    def test_timeout_deep_research_default(self):
-        from backend.config import TIMEOUT_DEEP_RESEARCH
-
-        assert TIMEOUT_DEEP_RESEARCH == 600
-
-    def test_timeout_http_default(self):
-        from backend.config import TIMEOUT_HTTP_DEFAULT
-
-        assert TIMEOUT_HTTP_DEFAULT == 30.0
-
-    def test_timeout_http_connect(self):
-        from backend.config import TIMEOUT_HTTP_CONNECT
-
-        assert TIMEOUT_HTTP_CONNECT == 5.0
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("TIMEOUT_API_CALL", 180),
+            ("TIMEOUT_STREAM_CHUNK", 60),
+            ("TIMEOUT_FIRST_CHUNK_BASE", 100),
+            ("TIMEOUT_MCP_TOOL", 300),
+            ("TIMEOUT_DEEP_RESEARCH", 600),
+            ("TIMEOUT_HTTP_DEFAULT", 30.0),
+            ("TIMEOUT_HTTP_CONNECT", 5.0),
+        ],
+    )
+    def test_default(self, name, expected):
+        assert getattr(config, name) == expected
 
     def test_timeout_env_override(self):
         """Environment variable should override default timeout via _get_int_env."""
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {"TIMEOUT_API_CALL": "300"}):
             assert _get_int_env("TIMEOUT_API_CALL", 180) == 300
 
     def test_timeout_env_invalid_falls_back(self):
         """Invalid env value should fall back to default."""
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {"TIMEOUT_API_CALL": "not_a_number"}):
             assert _get_int_env("TIMEOUT_API_CALL", 180) == 180
 
@@ -66,129 +62,102 @@ class TestTimeoutConstants:
 class TestSSEConstants:
     """SSE configuration constants from mcp_transport.py."""
 
-    def test_sse_keepalive_interval_default(self):
-        from backend.config import SSE_KEEPALIVE_INTERVAL
-
-        assert SSE_KEEPALIVE_INTERVAL == 15
-
-    def test_sse_connection_timeout_default(self):
-        from backend.config import SSE_CONNECTION_TIMEOUT
-
-        assert SSE_CONNECTION_TIMEOUT == 600
-
-    def test_sse_retry_delay_default(self):
-        from backend.config import SSE_RETRY_DELAY
-
-        assert SSE_RETRY_DELAY == 3000
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("SSE_KEEPALIVE_INTERVAL", 15),
+            ("SSE_CONNECTION_TIMEOUT", 600),
+            ("SSE_RETRY_DELAY", 3000),
+        ],
+    )
+    def test_default(self, name, expected):
+        assert getattr(config, name) == expected
 
 
 class TestRetryConstants:
     """Retry configuration constants scattered across modules."""
 
-    def test_gemini_max_retries_default(self):
-        from backend.config import GEMINI_MAX_RETRIES
-
-        assert GEMINI_MAX_RETRIES == 5
-
-    def test_gemini_retry_delay_base_default(self):
-        from backend.config import GEMINI_RETRY_DELAY_BASE
-
-        assert GEMINI_RETRY_DELAY_BASE == 2.0
-
-    def test_stream_max_retries_default(self):
-        from backend.config import STREAM_MAX_RETRIES
-
-        assert STREAM_MAX_RETRIES == 5
-
-    def test_embedding_max_retries_default(self):
-        from backend.config import EMBEDDING_MAX_RETRIES
-
-        assert EMBEDDING_MAX_RETRIES == 3
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("GEMINI_MAX_RETRIES", 5),
+            ("GEMINI_RETRY_DELAY_BASE", 2.0),
+            ("STREAM_MAX_RETRIES", 5),
+            ("EMBEDDING_MAX_RETRIES", 3),
+        ],
+    )
+    def test_default(self, name, expected):
+        assert getattr(config, name) == expected
 
 
 class TestFileLimitConstants:
     """File size and search limit constants."""
 
-    def test_max_file_size_default(self):
-        from backend.config import MAX_FILE_SIZE
-
-        assert MAX_FILE_SIZE == 10 * 1024 * 1024
-
-    def test_max_log_lines_default(self):
-        from backend.config import MAX_LOG_LINES
-
-        assert MAX_LOG_LINES == 1000
-
-    def test_max_search_results_default(self):
-        from backend.config import MAX_SEARCH_RESULTS
-
-        assert MAX_SEARCH_RESULTS == 100
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("MAX_FILE_SIZE", 10 * 1024 * 1024),
+            ("MAX_LOG_LINES", 1000),
+            ("MAX_SEARCH_RESULTS", 100),
+        ],
+    )
+    def test_default(self, name, expected):
+        assert getattr(config, name) == expected
 
 
 class TestMaxFileSizeConsistency:
     """MAX_FILE_SIZE should have the same value across all modules."""
 
     def test_system_observer_matches_config(self):
-        from backend.config import MAX_FILE_SIZE as config_val
         from backend.core.tools.system_observer import MAX_FILE_SIZE as observer_val
 
-        assert observer_val == config_val
+        assert observer_val == MAX_FILE_SIZE
 
     def test_file_tools_imports_from_config(self):
-        from backend.config import MAX_FILE_SIZE as config_val
         from backend.core.mcp_tools.file_tools import MAX_FILE_SIZE as tools_val
 
-        assert tools_val is config_val  # same object via import
+        assert tools_val is MAX_FILE_SIZE  # same object via import
 
     def test_system_observer_max_log_lines_matches_config(self):
-        from backend.config import MAX_LOG_LINES as config_val
         from backend.core.tools.system_observer import MAX_LOG_LINES as observer_val
 
-        assert observer_val == config_val
+        assert observer_val == MAX_LOG_LINES
 
     def test_system_observer_max_search_results_matches_config(self):
-        from backend.config import MAX_SEARCH_RESULTS as config_val
         from backend.core.tools.system_observer import MAX_SEARCH_RESULTS as observer_val
 
-        assert observer_val == config_val
+        assert observer_val == MAX_SEARCH_RESULTS
 
 
 class TestReActConstants:
     """ReAct loop default configuration."""
 
-    def test_react_max_loops_default(self):
-        from backend.config import REACT_MAX_LOOPS
-
-        assert REACT_MAX_LOOPS == 15
-
-    def test_react_temperature_default(self):
-        from backend.config import REACT_DEFAULT_TEMPERATURE
-
-        assert REACT_DEFAULT_TEMPERATURE == 0.7
-
-    def test_react_max_tokens_default(self):
-        from backend.config import REACT_DEFAULT_MAX_TOKENS
-
-        assert REACT_DEFAULT_MAX_TOKENS == 16384
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("REACT_MAX_LOOPS", 15),
+            ("REACT_DEFAULT_TEMPERATURE", 0.7),
+            ("REACT_DEFAULT_MAX_TOKENS", 16384),
+        ],
+    )
+    def test_default(self, name, expected):
+        assert getattr(config, name) == expected
 
 
 class TestTimeoutsBackwardCompat:
     """timeouts.py TIMEOUTS object should use config.py values."""
 
     def test_timeouts_api_call_matches_config(self):
-        from backend.config import TIMEOUT_API_CALL
         from backend.core.utils.timeouts import TIMEOUTS
 
         assert TIMEOUTS.API_CALL == TIMEOUT_API_CALL
 
     def test_timeouts_http_default_matches_config(self):
-        from backend.config import TIMEOUT_HTTP_DEFAULT
         from backend.core.utils.timeouts import TIMEOUTS
 
         assert TIMEOUTS.HTTP_DEFAULT == TIMEOUT_HTTP_DEFAULT
 
     def test_timeouts_stream_chunk_matches_config(self):
-        from backend.config import TIMEOUT_STREAM_CHUNK
         from backend.core.utils.timeouts import TIMEOUTS
 
         assert TIMEOUTS.STREAM_CHUNK == TIMEOUT_STREAM_CHUNK
@@ -222,20 +191,16 @@ class TestDecayNamedConstants:
 class TestShutdownConstants:
     """Shutdown timeout constants from app.py."""
 
-    def test_shutdown_task_timeout(self):
-        from backend.config import SHUTDOWN_TASK_TIMEOUT
-
-        assert SHUTDOWN_TASK_TIMEOUT == 3.0
-
-    def test_shutdown_session_timeout(self):
-        from backend.config import SHUTDOWN_SESSION_TIMEOUT
-
-        assert SHUTDOWN_SESSION_TIMEOUT == 3.0
-
-    def test_shutdown_http_pool_timeout(self):
-        from backend.config import SHUTDOWN_HTTP_POOL_TIMEOUT
-
-        assert SHUTDOWN_HTTP_POOL_TIMEOUT == 2.0
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("SHUTDOWN_TASK_TIMEOUT", 3.0),
+            ("SHUTDOWN_SESSION_TIMEOUT", 3.0),
+            ("SHUTDOWN_HTTP_POOL_TIMEOUT", 2.0),
+        ],
+    )
+    def test_default(self, name, expected):
+        assert getattr(config, name) == expected
 
 
 # ============================================================================
@@ -246,8 +211,6 @@ class TestGetCorsOrigins:
     """CORS origin list from env or defaults."""
 
     def test_default_origins_when_env_empty(self):
-        from backend.config import get_cors_origins
-
         with patch.dict(os.environ, {"CORS_ALLOW_ORIGINS": ""}, clear=False):
             # Re-import to reset CORS_ALLOW_ORIGINS would require module reload,
             # but get_cors_origins reads the module-level variable.
@@ -260,22 +223,16 @@ class TestGetCorsOrigins:
                 assert len(origins) == 4
 
     def test_custom_origins_from_env(self):
-        from backend.config import get_cors_origins
-
         with patch("backend.config.CORS_ALLOW_ORIGINS", "https://example.com,https://app.test"):
             origins = get_cors_origins()
             assert origins == ["https://example.com", "https://app.test"]
 
     def test_strips_whitespace(self):
-        from backend.config import get_cors_origins
-
         with patch("backend.config.CORS_ALLOW_ORIGINS", " https://a.com , https://b.com "):
             origins = get_cors_origins()
             assert origins == ["https://a.com", "https://b.com"]
 
     def test_filters_empty_entries(self):
-        from backend.config import get_cors_origins
-
         with patch("backend.config.CORS_ALLOW_ORIGINS", "https://a.com,,, ,https://b.com"):
             origins = get_cors_origins()
             assert origins == ["https://a.com", "https://b.com"]
@@ -289,8 +246,6 @@ class TestGetSizeBytes:
     """_get_size_bytes reads bytes_env first, then mb_env, then default."""
 
     def test_default_mb_when_no_env(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {}, clear=False):
             os.environ.pop("TEST_BYTES", None)
             os.environ.pop("TEST_MB", None)
@@ -298,45 +253,33 @@ class TestGetSizeBytes:
             assert result == 10 * 1024 * 1024
 
     def test_bytes_env_takes_priority(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {"TEST_BYTES": "5000", "TEST_MB": "99"}):
             result = _get_size_bytes("TEST_BYTES", "TEST_MB", 10)
             assert result == 5000
 
     def test_mb_env_converted_to_bytes(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {"TEST_MB": "5"}, clear=False):
             os.environ.pop("TEST_BYTES", None)
             result = _get_size_bytes("TEST_BYTES", "TEST_MB", 10)
             assert result == 5 * 1024 * 1024
 
     def test_mb_env_handles_float(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {"TEST_MB": "2.5"}, clear=False):
             os.environ.pop("TEST_BYTES", None)
             result = _get_size_bytes("TEST_BYTES", "TEST_MB", 10)
             assert result == int(2.5 * 1024 * 1024)
 
     def test_invalid_bytes_env_falls_to_mb(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {"TEST_BYTES": "bad", "TEST_MB": "3"}):
             result = _get_size_bytes("TEST_BYTES", "TEST_MB", 10)
             assert result == 3 * 1024 * 1024
 
     def test_invalid_both_falls_to_default(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {"TEST_BYTES": "bad", "TEST_MB": "bad"}):
             result = _get_size_bytes("TEST_BYTES", "TEST_MB", 10)
             assert result == 10 * 1024 * 1024
 
     def test_negative_bytes_clamp_to_zero(self):
-        from backend.config import _get_size_bytes
-
         with patch.dict(os.environ, {"TEST_BYTES": "-100"}, clear=False):
             os.environ.pop("TEST_MB", None)
             result = _get_size_bytes("TEST_BYTES", "TEST_MB", 10)
@@ -351,33 +294,23 @@ class TestGetIntEnv:
     """_get_int_env reads integer from env or returns default."""
 
     def test_returns_default_when_not_set(self):
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {}, clear=False):
             os.environ.pop("TEST_INT_UNSET", None)
             assert _get_int_env("TEST_INT_UNSET", 42) == 42
 
     def test_returns_env_value(self):
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {"TEST_INT": "99"}):
             assert _get_int_env("TEST_INT", 42) == 99
 
     def test_invalid_value_returns_default(self):
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {"TEST_INT": "not_int"}):
             assert _get_int_env("TEST_INT", 42) == 42
 
     def test_zero_is_valid(self):
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {"TEST_INT": "0"}):
             assert _get_int_env("TEST_INT", 42) == 0
 
     def test_negative_value(self):
-        from backend.config import _get_int_env
-
         with patch.dict(os.environ, {"TEST_INT": "-5"}):
             assert _get_int_env("TEST_INT", 42) == -5
 
@@ -390,33 +323,23 @@ class TestGetFloatEnv:
     """_get_float_env reads float from env or returns default."""
 
     def test_returns_default_when_not_set(self):
-        from backend.config import _get_float_env
-
         with patch.dict(os.environ, {}, clear=False):
             os.environ.pop("TEST_FLOAT_UNSET", None)
             assert _get_float_env("TEST_FLOAT_UNSET", 3.14) == 3.14
 
     def test_returns_env_value(self):
-        from backend.config import _get_float_env
-
         with patch.dict(os.environ, {"TEST_FLOAT": "2.718"}):
             assert _get_float_env("TEST_FLOAT", 3.14) == 2.718
 
     def test_integer_string_parsed_as_float(self):
-        from backend.config import _get_float_env
-
         with patch.dict(os.environ, {"TEST_FLOAT": "10"}):
             assert _get_float_env("TEST_FLOAT", 3.14) == 10.0
 
     def test_invalid_value_returns_default(self):
-        from backend.config import _get_float_env
-
         with patch.dict(os.environ, {"TEST_FLOAT": "not_float"}):
             assert _get_float_env("TEST_FLOAT", 3.14) == 3.14
 
     def test_zero_is_valid(self):
-        from backend.config import _get_float_env
-
         with patch.dict(os.environ, {"TEST_FLOAT": "0.0"}):
             assert _get_float_env("TEST_FLOAT", 3.14) == 0.0
 
@@ -428,41 +351,67 @@ class TestGetFloatEnv:
 class TestEnsureDataDirectories:
     """ensure_data_directories creates required directories."""
 
-    def test_creates_directories(self, tmp_path):
-        from backend.config import ensure_data_directories
-
-        with patch("backend.config.DATA_ROOT", tmp_path / "data"), \
-             patch("backend.config.TEMP_DIR", tmp_path / "data" / "tmp"), \
-             patch("backend.config.CHROMADB_PATH", tmp_path / "data" / "chroma"), \
-             patch("backend.config.STORAGE_ROOT", tmp_path / "storage"), \
-             patch("backend.config.RESEARCH_INBOX_DIR", tmp_path / "storage" / "research" / "inbox"), \
-             patch("backend.config.RESEARCH_ARTIFACTS_DIR", tmp_path / "storage" / "research" / "artifacts"), \
-             patch("backend.config.CRON_REPORTS_DIR", tmp_path / "storage" / "cron" / "reports"), \
-             patch("backend.config.LOGS_DIR", tmp_path / "logs"):
+    @staticmethod
+    def _set_dirs(monkeypatch, root):
+        """Point every directory ensure_data_directories touches under root."""
+        storage = root / "storage"
+        for name, value in (
+            ("DATA_ROOT", root / "data"),
+            ("TEMP_DIR", root / "data" / "tmp"),
+            ("CHROMADB_PATH", root / "data" / "chroma"),
+            ("STORAGE_ROOT", storage),
+            ("RESEARCH_INBOX_DIR", storage / "research" / "inbox"),
+            ("RESEARCH_ARTIFACTS_DIR", storage / "research" / "artifacts"),
+            ("CRON_REPORTS_DIR", storage / "cron" / "reports"),
+            ("LOGS_DIR", root / "logs"),
+        ):
+            monkeypatch.setattr(config, name, value)
+
+    def test_creates_directories(self, tmp_path, monkeypatch):
+        self._set_dirs(monkeypatch, tmp_path)
+        ensure_data_directories()
+        assert {"data", "storage", "logs"} <= {e.name for e in os.scandir(tmp_path)}
+        assert "tmp" in {e.name for e in os.scandir(tmp_path / "data")}
+
+        # Already ensured: a repeat call issues no mkdir at all
+        with patch.object(Path, "mkdir") as mkdir:
+            ensure_data_directories()
+        mkdir.assert_not_called()
+
+    def test_shared_ancestors_not_remade(self, tmp_path, monkeypatch):
+        real_mkdir = Path.mkdir
+        made = []  # top-level calls only; mkdir(parents=True) recurses into itself
+        depth = 0
+
+        def tracking_mkdir(self, *args, **kwargs):
+            nonlocal depth
+            if depth == 0:
+                made.append(self)
+            depth += 1
+            try:
+                return real_mkdir(self, *args, **kwargs)
+            finally:
+                depth -= 1
+
+        self._set_dirs(monkeypatch, tmp_path)
+        with patch.object(Path, "mkdir", tracking_mkdir):
             ensure_data_directories()
-            assert (tmp_path / "data").exists()
-            assert (tmp_path / "data" / "tmp").exists()
-            assert (tmp_path / "storage").exists()
-            assert (tmp_path / "logs").exists()
 
-    def test_does_not_raise_on_mkdir_failure(self, tmp_path):
-        """If a directory cannot be created, it logs warning but doesn't raise."""
-        from backend.config import ensure_data_directories
+        assert (tmp_path / "storage" / "research" / "artifacts").is_dir()
+        assert (tmp_path / "data").is_dir()
+        assert tmp_path / "data" not in made
+        assert tmp_path / "storage" not in made
 
+    def test_does_not_raise_on_mkdir_failure(self, tmp_path, monkeypatch):
+        """If a directory cannot be created, it logs warning but doesn't raise."""
         # Use a file as the parent so mkdir fails
         blocker = tmp_path / "blocker"
         blocker.write_text("I'm a file, not a directory")
 
-        with patch("backend.config.DATA_ROOT", blocker / "data"), \
-             patch("backend.config.TEMP_DIR", tmp_path / "ok" / "tmp"), \
-             patch("backend.config.CHROMADB_PATH", tmp_path / "ok" / "chroma"), \
-             patch("backend.config.STORAGE_ROOT", tmp_path / "ok" / "storage"), \
-             patch("backend.config.RESEARCH_INBOX_DIR", tmp_path / "ok" / "ri"), \
-             patch("backend.config.RESEARCH_ARTIFACTS_DIR", tmp_path / "ok" / "ra"), \
-             patch("backend.config.CRON_REPORTS_DIR", tmp_path / "ok" / "cr"), \
-             patch("backend.config.LOGS_DIR", tmp_path / "ok" / "logs"):
-            # Should not raise
-            ensure_data_directories()
+        self._set_dirs(monkeypatch, tmp_path / "ok")
+        monkeypatch.setattr(config, "DATA_ROOT", blocker / "data")
+        # Should not raise
+        ensure_data_directories()
 
 
 # ============================================================================
@@ -473,19 +422,15 @@ class TestPathConstants:
     """Verify path constants are Path objects and consistent."""
 
     def test_project_root_is_path(self):
-        from backend.config import PROJECT_ROOT
         assert isinstance(PROJECT_ROOT, Path)
 
     def test_backend_root_is_path(self):
-        from backend.config import BACKEND_ROOT
         assert isinstance(BACKEND_ROOT, Path)
 
     def test_backend_root_is_child_of_project_root(self):
-        from backend.config import PROJECT_ROOT, BACKEND_ROOT
         assert str(BACKEND_ROOT).startswith(str(PROJECT_ROOT))
 
     def test_data_root_under_project(self):
-        from backend.config import PROJECT_ROOT, DATA_ROOT
         assert DATA_ROOT == PROJECT_ROOT / "data"
 
 
@@ -496,76 +441,49 @@ class TestPathConstants:
 class TestMiscConfig:
     """Various configuration values with expected defaults."""
 
-    def test_host_default(self):
-        from backend.config import HOST
-        assert HOST == "0.0.0.0" or isinstance(HOST, str)
-
-    def test_port_is_int(self):
-        from backend.config import PORT
-        assert isinstance(PORT, int)
-
-    def test_embedding_dimension_default(self):
-        from backend.config import EMBEDDING_DIMENSION
-        assert EMBEDDING_DIMENSION == 3072
-
-    def test_deep_search_enabled_is_bool(self):
-        from backend.config import DEEP_SEARCH_ENABLED
-        assert isinstance(DEEP_SEARCH_ENABLED, bool)
-
-    def test_allowed_text_extensions(self):
-        from backend.config import ALLOWED_TEXT_EXTENSIONS
-        assert ".py" in ALLOWED_TEXT_EXTENSIONS
-        assert ".json" in ALLOWED_TEXT_EXTENSIONS
-
-    def test_allowed_image_extensions(self):
-        from backend.config import ALLOWED_IMAGE_EXTENSIONS
-        assert ".png" in ALLOWED_IMAGE_EXTENSIONS
-        assert ".jpg" in ALLOWED_IMAGE_EXTENSIONS
-
-    def test_max_context_tokens_positive(self):
-        from backend.config import MAX_CONTEXT_TOKENS
-        assert MAX_CONTEXT_TOKENS > 0
-
-    def test_memory_budgets_positive(self):
-        from backend.config import (
-            BUDGET_SYSTEM_PROMPT,
-            BUDGET_TEMPORAL,
-            BUDGET_WORKING_MEMORY,
-            BUDGET_LONG_TERM,
-            BUDGET_GRAPHRAG,
-            BUDGET_SESSION_ARCHIVE,
-        )
-        for val in [BUDGET_SYSTEM_PROMPT, BUDGET_TEMPORAL, BUDGET_WORKING_MEMORY,
-                     BUDGET_LONG_TERM, BUDGET_GRAPHRAG, BUDGET_SESSION_ARCHIVE]:
-            assert val > 0
-
-    def test_pg_pool_defaults(self):
-        from backend.config import PG_POOL_MIN, PG_POOL_MAX
-        assert PG_POOL_MIN == 2
-        assert PG_POOL_MAX == 10
-
-    def test_mcp_disabled_tools_is_set(self):
-        from backend.config import MCP_DISABLED_TOOLS
-        assert isinstance(MCP_DISABLED_TOOLS, set)
-
-    def test_mcp_disabled_categories_is_set(self):
-        from backend.config import MCP_DISABLED_CATEGORIES
-        assert isinstance(MCP_DISABLED_CATEGORIES, set)
-
-    def test_context_io_timeout_is_float(self):
-        from backend.config import CONTEXT_IO_TIMEOUT
-        assert isinstance(CONTEXT_IO_TIMEOUT, float)
-
-    def test_memory_decay_constants(self):
-        from backend.config import (
-            MEMORY_BASE_DECAY_RATE,
-            MEMORY_MIN_RETENTION,
-            MEMORY_DECAY_DELETE_THRESHOLD,
-            MEMORY_SIMILARITY_THRESHOLD,
-            MEMORY_MIN_IMPORTANCE,
-        )
-        assert 0 < MEMORY_BASE_DECAY_RATE < 1
-        assert 0 < MEMORY_MIN_RETENTION < 1
-        assert 0 < MEMORY_DECAY_DELETE_THRESHOLD < 1
-        assert 0 < MEMORY_SIMILARITY_THRESHOLD <= 1
-        assert 0 < MEMORY_MIN_IMPORTANCE < 1
+    @pytest.mark.parametrize(
+        "name,predicate",
+        [
+            ("HOST", lambda v: isinstance(v, str)),
+            ("PORT", lambda v: isinstance(v, int)),
+            ("EMBEDDING_DIMENSION", lambda v: v == 3072),
+            ("DEEP_SEARCH_ENABLED", lambda v: isinstance(v, bool)),
+            ("ALLOWED_TEXT_EXTENSIONS", lambda v: ".py" in v and ".json" in v),
+            ("ALLOWED_IMAGE_EXTENSIONS", lambda v: ".png" in v and ".jpg" in v),
+            ("PG_POOL_MIN", lambda v: v == 2),
+            ("PG_POOL_MAX", lambda v: v == 10),
+            ("MCP_DISABLED_TOOLS", lambda v: isinstance(v, frozenset)),
+            ("MCP_DISABLED_CATEGORIES", lambda v: isinstance(v, frozenset)),
+            ("CONTEXT_IO_TIMEOUT", lambda v: isinstance(v, float)),
+            ("MEMORY_SIMILARITY_THRESHOLD", lambda v: 0 < v <= 1),
+        ],
+    )
+    def test_value(self, name, predicate):
+        assert predicate(getattr(config, name))
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "MAX_CONTEXT_TOKENS",
+            "BUDGET_SYSTEM_PROMPT",
+            "BUDGET_TEMPORAL",
+            "BUDGET_WORKING_MEMORY",
+            "BUDGET_LONG_TERM",
+            "BUDGET_GRAPHRAG",
+            "BUDGET_SESSION_ARCHIVE",
+        ],
+    )
+    def test_positive(self, name):
+        assert getattr(config, name) > 0
+
+    @pytest.mark.parametrize(
+        "name,lo,hi",
+        [
+            ("MEMORY_BASE_DECAY_RATE", 0, 1),
+            ("MEMORY_MIN_RETENTION", 0, 1),
+            ("MEMORY_DECAY_DELETE_THRESHOLD", 0, 1),
+            ("MEMORY_MIN_IMPORTANCE", 0, 1),
+        ],
+    )
+    def test_in_open_range(self, name, lo, hi):
+        assert lo < getattr(config, name) < hi